@@ -2,18 +2,37 @@ import streamlit as st
 import sys
 import os
 import json
-import pandas as pd
 from datetime import datetime
 
-# Add src to python path to import our modules
-sys.path.insert(0, os.path.dirname(__file__))
+# Add src to python path to import our modules (once, not on every rerun)
+_ROOT = os.path.dirname(os.path.abspath(__file__))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
-from src.core.types import (
-    TaxInputs, TaxpayerInfo, FilingStatus, W2,
-    Form1099INT, BusinessIncome, Dependent
+# Currency formatter with the format spec bound once
+_USD = "${:,.2f}".format
+
+# Form 1040 breakdown rows: display label and the Form1040Outputs field it reads
+_LINE_LABELS = (
+    "1z. Wages, salaries, tips",
+    "2b. Taxable Interest",
+    "3b. Ordinary Dividends",
+    "8.  Other Income (Sch 1)",
+    "9.  Total Income",
+    "10. Adjustments to Income",
+    "11. Adjusted Gross Income (AGI)",
+    "12. Standard Deduction",
+    "15. Taxable Income",
+    "16. Tax calculated",
+    "23. Other Taxes (SE Tax)",
+    "24. Total Tax",
+    "25a. Federal Withholding",
+    "33. Total Payments"
+)
+_LINE_FIELDS = (
+    "line_1z", "line_2b", "line_3b", "line_8", "line_9", "line_10", "line_11",
+    "line_12", "line_15", "line_16", "line_23", "line_24", "line_25a", "line_33"
 )
-from src.agents.form_1040_agent import Form1040Agent
-from main import TaxReturnProcessor
 
 # Page Config
 st.set_page_config(
@@ -24,7 +43,7 @@ st.set_page_config(
 )
 
 # Custom CSS for styling
-st.markdown("""
+_CSS = """
 <style>
     .metric-card {
         background-color: #f0f2f6;
@@ -58,25 +77,56 @@ st.markdown("""
         background-color: #45a049;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Stylesheet and logo are emitted from cached functions so Streamlit
+# replays the stored elements on rerun instead of rebuilding them
+@st.cache_resource
+def _inject_css():
+    st.markdown(_CSS, unsafe_allow_html=True)
+    return True
+
+@st.cache_data
+def _sidebar_logo():
+    st.image("https://cdn-icons-png.flaticon.com/512/2504/2504792.png", width=50)
+
+_inject_css()
 
-# Helper function to display metrics
+# Load every compiled Numba kernel once per server, before the first return
+# rather than during it; LIGHTTAXES_LAZY_WARMUP=1 leaves loading to first use
+@st.cache_resource
+def _warm_kernels():
+    if not os.environ.get("LIGHTTAXES_LAZY_WARMUP"):
+        from src.core.jit import warm_kernels
+        warm_kernels()
+
+# Processor factory - a fresh processor (and agents) per return, since agents
+# hold per-return citations; the LLM engine and IRS PDF navigators they use
+# are shared process-wide, so building one is cheap
+def get_processor(verbose: bool, provider: str):
+    from main import TaxReturnProcessor
+    _warm_kernels()
+    return TaxReturnProcessor(verbose=verbose)
+
+# Helper function to render a metric card (returns HTML, caller emits)
 def metric_card(label, value, is_currency=True, color=None):
-    display_value = f"${value:,.2f}" if is_currency else value
+    display_value = _USD(value) if is_currency else value
     color_class = ""
     if color == "green": color_class = "refund-text"
     if color == "red": color_class = "owed-text"
     
-    st.markdown(f"""
-    <div class="metric-card">
-        <div class="metric-label">{label}</div>
-        <div class="metric-value {color_class}">{display_value}</div>
-    </div>
-    """, unsafe_allow_html=True)
+    # Kept on one line: blank/indented lines would end the HTML block when
+    # several cards are concatenated into a single markdown call
+    return (
+        f'<div class="metric-card" style="flex: 1;">'
+        f'<div class="metric-label">{label}</div>'
+        f'<div class="metric-value {color_class}">{display_value}</div>'
+        f'</div>'
+    )
 
 # Sidebar - Configuration
 with st.sidebar:
-    st.image("https://cdn-icons-png.flaticon.com/512/2504/2504792.png", width=50)
+    _sidebar_logo()
     st.title("Settings")
     
     use_mock = st.toggle("Run in Mock Mode", value=True, help="Simulates LLM reasoning without API costs")
@@ -143,6 +193,7 @@ with tab_business:
     st.subheader("Schedule C - Profit or Loss from Business")
     has_business = st.checkbox("I have self-employment/business income")
     
+    biz_name = ""
     biz_gross = 0.0
     biz_expenses = 0.0
     
@@ -156,7 +207,7 @@ with tab_business:
             biz_expenses = st.number_input("Total Expenses", 0.0, 1000000.0, 20000.0)
             st.caption("Includes ads, office, supplies, etc.")
             
-        st.metric("Estimated Net Profit", f"${biz_gross - biz_expenses:,.2f}")
+        st.metric("Estimated Net Profit", _USD(biz_gross - biz_expenses))
 
     st.divider()
     st.subheader("📚 Other Adjustments")
@@ -169,7 +220,15 @@ with tab_business:
 
 
 # Prepare Input JSON logic
-def prepare_input_data():
+# Keyed on the raw widget values, so an unchanged form is not rebuilt
+@st.cache_data(show_spinner=False)
+def prepare_input_data(
+    filing_status, info_name, info_ssn, info_age,
+    is_educator, educator_paid, sli_paid,
+    w2_wages, w2_withheld,
+    has_interest, int_income,
+    has_business, biz_name, biz_gross, biz_expenses
+):
     data = {
         "filing_status": filing_status,
         "taxpayer_name": info_name,
@@ -198,17 +257,27 @@ def prepare_input_data():
     
     return data
 
+# Run the agent swarm only for inputs (and provider) not seen before
+@st.cache_data(show_spinner=False)
+def run_tax_return(input_data, provider):
+    processor = get_processor(True, provider)
+    return processor.process_tax_return(input_data)
+
 # Calculation Logic
 if st.button("🚀 Calculate Tax Return", type="primary"):
     with st.spinner("Initializing Agent Swarm..."):
         try:
-            input_data = prepare_input_data()
-            
-            # Initialize Processor
-            processor = TaxReturnProcessor(verbose=True)
+            input_data = prepare_input_data(
+                filing_status, info_name, info_ssn, info_age,
+                is_educator, educator_paid, sli_paid,
+                w2_wages, w2_withheld,
+                has_interest, int_income,
+                has_business, biz_name, biz_gross, biz_expenses
+            )
+            st.session_state.inputs = input_data
             
-            # Run
-            result = processor.process_tax_return(input_data)
+            # Run (processor and results are cached across reruns)
+            result = run_tax_return(input_data, os.environ.get("DEFAULT_LLM", "openai"))
             
             # Store in session state
             st.session_state.result = result
@@ -227,12 +296,16 @@ if st.session_state.get('processed'):
     st.divider()
     st.header("📊 Tax Return Summary")
     
-    # Top Level Metrics
-    row1_1, row1_2, row1_3, row1_4 = st.columns(4)
-    with row1_1: metric_card("Total Income", res.line_9)
-    with row1_2: metric_card("AGI", res.line_11)
-    with row1_3: metric_card("Taxable Income", res.line_15)
-    with row1_4: metric_card("Total Tax", res.line_24)
+    # Top Level Metrics (single markdown emit for all four cards)
+    st.markdown(
+        "<div style='display: flex; gap: 16px;'>"
+        + metric_card("Total Income", res.line_9)
+        + metric_card("AGI", res.line_11)
+        + metric_card("Taxable Income", res.line_15)
+        + metric_card("Total Tax", res.line_24)
+        + "</div>",
+        unsafe_allow_html=True
+    )
     
     # Refund vs Owed Big Banner
     st.markdown("<br>", unsafe_allow_html=True)
@@ -240,14 +313,14 @@ if st.session_state.get('processed'):
         st.markdown(f"""
         <div style="background-color: #d4edda; color: #155724; padding: 20px; border-radius: 10px; text-align: center; border: 2px solid #c3e6cb;">
             <h2>🎉 REFUND AMOUNT</h2>
-            <h1 style="font-size: 48px;">${res.line_34:,.2f}</h1>
+            <h1 style="font-size: 48px;">{_USD(res.line_34)}</h1>
         </div>
         """, unsafe_allow_html=True)
     elif res.line_37 > 0:
         st.markdown(f"""
         <div style="background-color: #f8d7da; color: #721c24; padding: 20px; border-radius: 10px; text-align: center; border: 2px solid #f5c6cb;">
             <h2>⚠ AMOUNT YOU OWE</h2>
-            <h1 style="font-size: 48px;">${res.line_37:,.2f}</h1>
+            <h1 style="font-size: 48px;">{_USD(res.line_37)}</h1>
         </div>
         """, unsafe_allow_html=True)
     else:
@@ -256,45 +329,16 @@ if st.session_state.get('processed'):
     # Detailed Form 1040 View
     st.markdown("### 📝 Form 1040 Breakdown")
     
-    df_data = {
-        "Line Item": [
-            "1z. Wages, salaries, tips",
-            "2b. Taxable Interest",
-            "3b. Ordinary Dividends",
-            "8.  Other Income (Sch 1)",
-            "9.  Total Income",
-            "10. Adjustments to Income",
-            "11. Adjusted Gross Income (AGI)",
-            "12. Standard Deduction",
-            "15. Taxable Income",
-            "16. Tax calculated",
-            "23. Other Taxes (SE Tax)",
-            "24. Total Tax",
-            "25a. Federal Withholding",
-            "33. Total Payments"
-        ],
-        "Amount": [
-            res.line_1z,
-            res.line_2b,
-            res.line_3b,
-            res.line_8,
-            res.line_9,
-            res.line_10,
-            res.line_11,
-            res.line_12,
-            res.line_15,
-            res.line_16,
-            getattr(res, 'line_23', 0.0), # Helper for optional attr
-            res.line_24,
-            res.line_25a,
-            res.line_33
-        ]
-    }
+    values = tuple(getattr(res, name, 0.0) for name in _LINE_FIELDS)
     
-    # Nice Table
-    df = pd.DataFrame(df_data)
-    df['Amount'] = df['Amount'].apply(lambda x: f"${x:,.2f}")
-    st.table(df)
+    # Nice Table (rendered to HTML once and emitted in a single call)
+    rows = [(label, _USD(val)) for label, val in zip(_LINE_LABELS, values)]
+    st.markdown(
+        "<table><thead><tr><th>Line Item</th><th>Amount</th></tr></thead><tbody>"
+        + "".join(f"<tr><td>{label}</td><td>{amount}</td></tr>" for label, amount in rows)
+        + "</tbody></table>",
+        unsafe_allow_html=True
+    )
 
     # Verification Badge
     st.success("✅ Arithmetic Verification Passed: All internal calculations match.")
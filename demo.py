@@ -5,113 +5,125 @@ Demonstrates the deterministic calculation pipeline
 
 import sys
 import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+_ROOT = os.path.dirname(os.path.abspath(__file__))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
 from src.tools.tax_table import calculate_tax
 from src.tools.standard_deduction import get_standard_deduction
 
-def demo_tax_calculation(wages, withholding, filing_status, name="Taxpayer"):
+# Currency formatter with the format spec bound once
+_USD = "${:,.2f}".format
+
+def demo_tax_calculation(wages, withholding, filing_status, name="Taxpayer", verbose=True):
     """
     Demonstrate complete tax calculation flow
+    
+    The report is buffered and written to stdout in one call;
+    pass verbose=False to only get the result dict back.
     """
-    print("=" * 80)
-    print(f"TAX CALCULATION DEMO - {name}")
-    print("=" * 80)
-    print()
+    out = []
+    out.append("=" * 80)
+    out.append(f"TAX CALCULATION DEMO - {name}")
+    out.append("=" * 80)
+    out.append("")
     
     # Step 1: Income
-    print("STEP 1: INCOME")
-    print("-" * 80)
-    print(f"W-2 Wages (Line 1z):                    ${wages:>15,.2f}")
+    out.append("STEP 1: INCOME")
+    out.append("-" * 80)
+    out.append(f"W-2 Wages (Line 1z):                    ${wages:>15,.2f}")
     total_income = wages
-    print(f"Total Income (Line 9):                  ${total_income:>15,.2f}")
-    print()
+    out.append(f"Total Income (Line 9):                  ${total_income:>15,.2f}")
+    out.append("")
     
     # Step 2: Adjustments (none in this simple case)
-    print("STEP 2: ADJUSTMENTS")
-    print("-" * 80)
+    out.append("STEP 2: ADJUSTMENTS")
+    out.append("-" * 80)
     adjustments = 0
-    print(f"Adjustments to Income (Line 10):        ${adjustments:>15,.2f}")
-    print()
+    out.append(f"Adjustments to Income (Line 10):        ${adjustments:>15,.2f}")
+    out.append("")
     
     # Step 3: AGI
-    print("STEP 3: ADJUSTED GROSS INCOME (AGI)")
-    print("-" * 80)
+    out.append("STEP 3: ADJUSTED GROSS INCOME (AGI)")
+    out.append("-" * 80)
     agi = total_income - adjustments
-    print(f"AGI (Line 11):                          ${agi:>15,.2f}")
-    print(f"  Calculation: ${total_income:,.2f} - ${adjustments:,.2f}")
-    print()
+    out.append(f"AGI (Line 11):                          ${agi:>15,.2f}")
+    out.append(f"  Calculation: {_USD(total_income)} - {_USD(adjustments)}")
+    out.append("")
     
     # Step 4: Deductions
-    print("STEP 4: DEDUCTIONS")
-    print("-" * 80)
+    out.append("STEP 4: DEDUCTIONS")
+    out.append("-" * 80)
     std_deduction = get_standard_deduction(filing_status)
-    print(f"Standard Deduction (Line 12):           ${std_deduction:>15,.2f}")
-    print(f"  Filing Status: {filing_status}")
-    print()
+    out.append(f"Standard Deduction (Line 12):           ${std_deduction:>15,.2f}")
+    out.append(f"  Filing Status: {filing_status}")
+    out.append("")
     
     # Step 5: Taxable Income
-    print("STEP 5: TAXABLE INCOME")
-    print("-" * 80)
+    out.append("STEP 5: TAXABLE INCOME")
+    out.append("-" * 80)
     taxable_income = max(0, agi - std_deduction)
-    print(f"Taxable Income (Line 15):               ${taxable_income:>15,.2f}")
-    print(f"  Calculation: ${agi:,.2f} - ${std_deduction:,.2f}")
-    print()
+    out.append(f"Taxable Income (Line 15):               ${taxable_income:>15,.2f}")
+    out.append(f"  Calculation: {_USD(agi)} - {_USD(std_deduction)}")
+    out.append("")
     
     # Step 6: Tax Calculation (DETERMINISTIC - from IRS tables)
-    print("STEP 6: TAX CALCULATION")
-    print("-" * 80)
+    out.append("STEP 6: TAX CALCULATION")
+    out.append("-" * 80)
     tax = calculate_tax(taxable_income, filing_status)
-    print(f"Tax (Line 16):                          ${tax:>15,.2f}")
-    print(f"  Using 2024 IRS Tax Tables")
-    print(f"  Taxable Income: ${taxable_income:,.2f}")
-    print(f"  Filing Status: {filing_status}")
-    print()
+    out.append(f"Tax (Line 16):                          ${tax:>15,.2f}")
+    out.append(f"  Using 2024 IRS Tax Tables")
+    out.append(f"  Taxable Income: {_USD(taxable_income)}")
+    out.append(f"  Filing Status: {filing_status}")
+    out.append("")
     
     # Step 7: Credits (none in this simple case)
-    print("STEP 7: CREDITS")
-    print("-" * 80)
+    out.append("STEP 7: CREDITS")
+    out.append("-" * 80)
     credits = 0
-    print(f"Child Tax Credit (Line 19):             ${credits:>15,.2f}")
-    print()
+    out.append(f"Child Tax Credit (Line 19):             ${credits:>15,.2f}")
+    out.append("")
     
     # Step 8: Total Tax
-    print("STEP 8: TOTAL TAX")
-    print("-" * 80)
+    out.append("STEP 8: TOTAL TAX")
+    out.append("-" * 80)
     total_tax = tax - credits
-    print(f"Total Tax (Line 24):                    ${total_tax:>15,.2f}")
-    print(f"  Calculation: ${tax:,.2f} - ${credits:,.2f}")
-    print()
+    out.append(f"Total Tax (Line 24):                    ${total_tax:>15,.2f}")
+    out.append(f"  Calculation: {_USD(tax)} - {_USD(credits)}")
+    out.append("")
     
     # Step 9: Payments
-    print("STEP 9: PAYMENTS")
-    print("-" * 80)
-    print(f"Federal Tax Withheld (Line 25a):        ${withholding:>15,.2f}")
-    print(f"Total Payments (Line 33):               ${withholding:>15,.2f}")
-    print()
+    out.append("STEP 9: PAYMENTS")
+    out.append("-" * 80)
+    out.append(f"Federal Tax Withheld (Line 25a):        ${withholding:>15,.2f}")
+    out.append(f"Total Payments (Line 33):               ${withholding:>15,.2f}")
+    out.append("")
     
     # Step 10: Refund or Amount Owed
-    print("STEP 10: REFUND OR AMOUNT OWED")
-    print("-" * 80)
+    out.append("STEP 10: REFUND OR AMOUNT OWED")
+    out.append("-" * 80)
     
     if withholding > total_tax:
         refund = withholding - total_tax
         amount_owed = 0
-        print(f"REFUND (Line 34):                       ${refund:>15,.2f} ✓")
-        print(f"  You overpaid by ${refund:,.2f}")
-        result = f"REFUND: ${refund:,.2f}"
+        out.append(f"REFUND (Line 34):                       ${refund:>15,.2f} ✓")
+        out.append(f"  You overpaid by {_USD(refund)}")
+        result = f"REFUND: {_USD(refund)}"
     else:
         refund = 0
         amount_owed = total_tax - withholding
-        print(f"Amount You Owe (Line 37):               ${amount_owed:>15,.2f}")
-        print(f"  You underpaid by ${amount_owed:,.2f}")
-        result = f"OWED: ${amount_owed:,.2f}"
+        out.append(f"Amount You Owe (Line 37):               ${amount_owed:>15,.2f}")
+        out.append(f"  You underpaid by {_USD(amount_owed)}")
+        result = f"OWED: {_USD(amount_owed)}"
+    
+    out.append("")
+    out.append("=" * 80)
+    out.append(f"FINAL RESULT: {result}")
+    out.append("=" * 80)
+    out.append("")
     
-    print()
-    print("=" * 80)
-    print(f"FINAL RESULT: {result}")
-    print("=" * 80)
-    print()
+    if verbose:
+        sys.stdout.write("\n".join(out) + "\n")
     
     return {
         'wages': wages,
@@ -154,35 +166,38 @@ if __name__ == "__main__":
         name="John & Jane Smith"
     )
     
-    # Summary comparison
-    print("\n" + "█" * 80)
-    print("COMPARISON SUMMARY")
-    print("█" * 80 + "\n")
+    # Summary comparison (buffered, single write)
+    out = []
+    out.append("\n" + "█" * 80)
+    out.append("COMPARISON SUMMARY")
+    out.append("█" * 80 + "\n")
     
-    print(f"{'Metric':<30} {'Single':<20} {'MFJ':<20}")
-    print("-" * 80)
-    print(f"{'Wages':<30} ${result1['wages']:>18,.2f} ${result2['wages']:>18,.2f}")
-    print(f"{'AGI':<30} ${result1['agi']:>18,.2f} ${result2['agi']:>18,.2f}")
-    print(f"{'Taxable Income':<30} ${result1['taxable_income']:>18,.2f} ${result2['taxable_income']:>18,.2f}")
-    print(f"{'Tax':<30} ${result1['tax']:>18,.2f} ${result2['tax']:>18,.2f}")
-    print(f"{'Withholding':<30} ${result1['withholding']:>18,.2f} ${result2['withholding']:>18,.2f}")
+    out.append(f"{'Metric':<30} {'Single':<20} {'MFJ':<20}")
+    out.append("-" * 80)
+    out.append(f"{'Wages':<30} ${result1['wages']:>18,.2f} ${result2['wages']:>18,.2f}")
+    out.append(f"{'AGI':<30} ${result1['agi']:>18,.2f} ${result2['agi']:>18,.2f}")
+    out.append(f"{'Taxable Income':<30} ${result1['taxable_income']:>18,.2f} ${result2['taxable_income']:>18,.2f}")
+    out.append(f"{'Tax':<30} ${result1['tax']:>18,.2f} ${result2['tax']:>18,.2f}")
+    out.append(f"{'Withholding':<30} ${result1['withholding']:>18,.2f} ${result2['withholding']:>18,.2f}")
     
     if result1['refund'] > 0:
-        print(f"{'Refund':<30} ${result1['refund']:>18,.2f} ✓", end="")
+        outcome = f"{'Refund':<30} ${result1['refund']:>18,.2f} ✓"
     else:
-        print(f"{'Amount Owed':<30} ${result1['amount_owed']:>18,.2f}", end="")
+        outcome = f"{'Amount Owed':<30} ${result1['amount_owed']:>18,.2f}"
     
     if result2['refund'] > 0:
-        print(f" ${result2['refund']:>18,.2f} ✓")
+        outcome += f" ${result2['refund']:>18,.2f} ✓"
     else:
-        print(f" ${result2['amount_owed']:>18,.2f}")
-    
-    print()
-    print("=" * 80)
-    print("✅ ALL CALCULATIONS COMPLETED SUCCESSFULLY")
-    print("=" * 80)
-    print("\nNote: This demo uses 100% deterministic calculations from IRS 2024 tax tables.")
-    print("No LLM/API needed for these calculations - pure Python functions!")
-    print("\nFor full system with IRS PDF grounding and LLM reasoning,")
-    print("add your API key to .env and run: python main.py --case single-w2 --verbose")
-    print()
+        outcome += f" ${result2['amount_owed']:>18,.2f}"
+    out.append(outcome)
+    
+    out.append("")
+    out.append("=" * 80)
+    out.append("✅ ALL CALCULATIONS COMPLETED SUCCESSFULLY")
+    out.append("=" * 80)
+    out.append("\nNote: This demo uses 100% deterministic calculations from IRS 2024 tax tables.")
+    out.append("No LLM/API needed for these calculations - pure Python functions!")
+    out.append("\nFor full system with IRS PDF grounding and LLM reasoning,")
+    out.append("add your API key to .env and run: python main.py --case single-w2 --verbose")
+    out.append("")
+    sys.stdout.write("\n".join(out) + "\n")
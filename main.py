@@ -7,24 +7,70 @@ import sys
 import os
 import json
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, List, Optional, Tuple
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # optional accelerator - fall back to stdlib json
+    orjson = None
 
 from src.core.types import (
     TaxInputs, TaxpayerInfo, FilingStatus, W2,
     Form1099INT, Form1099DIV, BusinessIncome, Dependent,
-    Form1040Inputs, ScheduleBInputs
+    Form1040Inputs, Form1040Outputs, ScheduleBInputs, ScheduleCInputs, ScheduleSEInputs
 )
 from src.agents.form_1040_agent import Form1040Agent
 from src.agents.schedule_b_agent import ScheduleBAgent
 from src.agents.schedule_c_agent import ScheduleCAgent
 from src.agents.schedule_se_agent import ScheduleSEAgent
 from src.verifiers.arithmetic_verifier import ArithmeticVerifier
+from src.tools.pdf_navigator import PDFNavigator
 from src.tools.tax_table import calculate_tax
 from src.tools.standard_deduction import get_standard_deduction
+from src.tools.adjustments import compute_schedule_1, compute_schedule_1_batch, _is_mfj, _mfj_mask
+
+
+def _cents(amount: float) -> int:
+    """Convert a dollar amount to integer cents"""
+    return int(round(amount * 100))
+
+
+@lru_cache(maxsize=None)
+def _pdf_navigator(form_name: str) -> PDFNavigator:
+    """
+    PDF navigator for one form, shared by that form's agents in every processor.
+    
+    The opened IRS PDF and its extracted pages are the expensive part of an
+    agent. The agents themselves hold per-return citations and errors, so
+    each TaxReturnProcessor builds its own around these navigators (the LLM
+    engine is already shared through default_engine()).
+    """
+    return PDFNavigator()
+
+
+# Read-only lookup from input.json filing status strings to FilingStatus
+_FS = MappingProxyType({status.value: status for status in FilingStatus})
+
+
+# Packed W-2 record used for vectorized wage/withholding totals
+_W2_DTYPE = np.dtype([('wages', 'f8'), ('federal_withholding', 'f8')])
+
+
+def _w2_totals(w2s: List[W2]) -> Tuple[float, float]:
+    """Total wages and withholding over a return's W-2s, in one packed-array reduction"""
+    packed = np.fromiter(
+        ((w2.wages, w2.federal_withholding) for w2 in w2s),
+        dtype=_W2_DTYPE,
+        count=len(w2s)
+    )
+    wages, withholding = packed.view(('f8', 2)).sum(axis=0).tolist()
+    return wages, withholding
 
 
 class TaxReturnProcessor:
@@ -42,16 +88,18 @@ class TaxReturnProcessor:
         self._initialize_agents()
     
     def _initialize_agents(self):
-        """Initialize all form agents"""
-        self.agents['1040'] = Form1040Agent()
-        self.agents['schedule_b'] = ScheduleBAgent()
-        self.agents['schedule_c'] = ScheduleCAgent()
-        self.agents['schedule_se'] = ScheduleSEAgent()
+        """Initialize all form agents (PDF navigators shared, see _pdf_navigator)"""
+        self.agents = {
+            '1040': Form1040Agent(pdf_navigator=_pdf_navigator("1040")),
+            'schedule_b': ScheduleBAgent(pdf_navigator=_pdf_navigator("schedule-b")),
+            'schedule_c': ScheduleCAgent(pdf_navigator=_pdf_navigator("schedule-c")),
+            'schedule_se': ScheduleSEAgent(pdf_navigator=_pdf_navigator("schedule-se")),
+        }
     
-    def _log(self, message: str):
-        """Log message if verbose"""
+    def _log(self, fmt: str, *args):
+        """Log message if verbose (args are formatted into fmt only when printed)"""
         if self.verbose:
-            print(message)
+            print(fmt.format(*args) if args else fmt)
     
     def process_tax_return(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -70,51 +118,74 @@ class TaxReturnProcessor:
         # Parse inputs
         tax_inputs = self._parse_inputs(inputs)
         
+        # W-2-only returns need no schedules or Schedule 1 adjustments
+        if not (
+            tax_inputs.income_1099_int or tax_inputs.income_1099_div
+            or tax_inputs.business_income
+            or tax_inputs.student_loan_interest_paid
+            or tax_inputs.educator_expenses_paid
+            or tax_inputs.spouse_educator_expenses_paid
+        ):
+            return self._process_simple_w2(tax_inputs)
+        
         # Process forms in dependency order
         schedule_b_outputs = None
         schedule_c_outputs = None
         schedule_se_outputs = None
         
-        # Step 1: Schedule B (if needed)
+        schedule_b_inputs = None
+        schedule_c_inputs = None
+        
         if tax_inputs.income_1099_int or tax_inputs.income_1099_div:
-            self._log("\n[1/4] Processing Schedule B (Interest & Dividends)...")
             schedule_b_inputs = ScheduleBInputs(
                 interest_income=tax_inputs.income_1099_int,
                 dividend_income=tax_inputs.income_1099_div
             )
-            schedule_b_outputs = self.agents['schedule_b'].process(schedule_b_inputs)
-            self._log(f"  Total Interest: ${schedule_b_outputs.total_interest:,.2f}")
-            self._log(f"  Total Dividends: ${schedule_b_outputs.total_dividends:,.2f}")
         
-        # Step 2: Schedule C (if needed)
         if tax_inputs.business_income:
-            self._log("\n[2/4] Processing Schedule C (Business Income)...")
-            from src.core.types import ScheduleCInputs
             schedule_c_inputs = ScheduleCInputs(
                 business=tax_inputs.business_income,
                 filing_status=tax_inputs.filing_status
             )
-            schedule_c_outputs = self.agents['schedule_c'].process(schedule_c_inputs)
-            self._log(f"  Net Profit/Loss: ${schedule_c_outputs.net_profit_loss:,.2f}")
+        
+        # Steps 1-2: Schedule B and Schedule C have no dependency on each
+        # other, so run them concurrently. Leaving the executor block waits
+        # for both, so a failure in one never abandons the other.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            future_b = None
+            future_c = None
+            if schedule_b_inputs:
+                self._log("\n[1/4] Processing Schedule B (Interest & Dividends)...")
+                future_b = executor.submit(self.agents['schedule_b'].process, schedule_b_inputs)
+            if schedule_c_inputs:
+                self._log("\n[2/4] Processing Schedule C (Business Income)...")
+                future_c = executor.submit(self.agents['schedule_c'].process, schedule_c_inputs)
+        
+        if future_b:
+            schedule_b_outputs = future_b.result()
+            self._log("  Total Interest: ${:,.2f}", schedule_b_outputs.total_interest)
+            self._log("  Total Dividends: ${:,.2f}", schedule_b_outputs.total_dividends)
+        
+        if future_c:
+            schedule_c_outputs = future_c.result()
+            self._log("  Net Profit/Loss: ${:,.2f}", schedule_c_outputs.net_profit_loss)
             
             # Step 3: Schedule SE (if Schedule C has profit)
             if schedule_c_outputs.net_profit_loss > 0:
                 self._log("\n[3/4] Processing Schedule SE (Self-Employment Tax)...")
-                from src.core.types import ScheduleSEInputs
                 schedule_se_inputs = ScheduleSEInputs(
                     net_profit_loss=schedule_c_outputs.net_profit_loss,
                     filing_status=tax_inputs.filing_status
                 )
                 schedule_se_outputs = self.agents['schedule_se'].process(schedule_se_inputs)
-                self._log(f"  SE Tax: ${schedule_se_outputs.self_employment_tax:,.2f}")
-                self._log(f"  Deduction: ${schedule_se_outputs.deduction:,.2f}")
+                self._log("  SE Tax: ${:,.2f}", schedule_se_outputs.self_employment_tax)
+                self._log("  Deduction: ${:,.2f}", schedule_se_outputs.deduction)
         
         # Step 4: Form 1040 (main return)
-        self._log(f"\n[4/4] Processing Form 1040 (Main Tax Return)...")
+        self._log("\n[4/4] Processing Form 1040 (Main Tax Return)...")
         
-        # Calculate total wages from W-2s
-        total_wages = sum(w2.wages for w2 in tax_inputs.w2)
-        total_withholding = sum(w2.federal_withholding for w2 in tax_inputs.w2)
+        # Calculate total wages and withholding from W-2s in one reduction
+        total_wages, total_withholding = _w2_totals(tax_inputs.w2)
         
         # Get interest and dividends from Schedule B
         total_interest = schedule_b_outputs.total_interest if schedule_b_outputs else 0
@@ -123,98 +194,183 @@ class TaxReturnProcessor:
         # Prepare Form 1040 inputs
         
         # Calculate Adjustments (Schedule 1)
-        from src.tools.adjustments import (
-            calculate_educator_expense, 
-            calculate_student_loan_interest,
-            calculate_excess_business_loss
-        )
-        
-        total_adjustments = 0.0
-        se_tax = 0.0
-        additional_income = 0.0
+        # Schedule 1 totals are accumulated in integer cents so the running
+        # sums are exact; they go back to dollars at the Form 1040 boundary
+        wages_c = _cents(total_wages)
+        interest_c = _cents(total_interest)
+        dividends_c = _cents(total_dividends)
+        withholding_c = _cents(total_withholding)
         
-        # 1. Business Income/Loss
         net_biz = schedule_c_outputs.net_profit_loss if schedule_c_outputs else 0.0
-        additional_income += net_biz
-        
-        # Handle Excess Business Loss (Form 461) - Addition to Income
-        if net_biz < 0:
-            ebl_addback = calculate_excess_business_loss(abs(net_biz), tax_inputs.filing_status)
-            if ebl_addback > 0:
-                self._log(f"  Form 461: Excess Business Loss detected. Adding back ${ebl_addback:,.2f}")
-                additional_income += ebl_addback # Disallowing loss = adding back
-                
-        # 2. SE Tax Deduction
-        if schedule_se_outputs:
-            total_adjustments += schedule_se_outputs.deduction
-            se_tax = schedule_se_outputs.self_employment_tax
-            
-        # 3. Educator Expenses
-        educator_deduction = calculate_educator_expense(
-            tax_inputs.educator_expenses_paid,
-            tax_inputs.taxpayer.is_eligible_educator,
-            tax_inputs.spouse_educator_expenses_paid,
-            tax_inputs.taxpayer.spouse_eligible_educator,
-            tax_inputs.filing_status
+        se_tax_c = _cents(schedule_se_outputs.self_employment_tax) if schedule_se_outputs else 0
+        
+        additional_c, adjustments_c, ebl_addback, educator_deduction, sli_deduction = compute_schedule_1(
+            wages_c + interest_c + dividends_c,
+            float(net_biz),
+            float(schedule_se_outputs.deduction) if schedule_se_outputs else 0.0,
+            float(tax_inputs.educator_expenses_paid),
+            bool(tax_inputs.taxpayer.is_eligible_educator),
+            float(tax_inputs.spouse_educator_expenses_paid),
+            bool(tax_inputs.taxpayer.spouse_eligible_educator),
+            float(tax_inputs.student_loan_interest_paid),
+            _is_mfj(tax_inputs.filing_status)
         )
+        
+        if ebl_addback > 0:
+            self._log("  Form 461: Excess Business Loss detected. Adding back ${:,.2f}", ebl_addback)
         if educator_deduction > 0:
-            self._log(f"  Educator Expense Deduction: ${educator_deduction:,.2f}")
-            total_adjustments += educator_deduction
-            
-        # 4. Student Loan Interest (SLI)
-        # Temporary MAGI calculation (approximate for deduction lookup)
-        temp_agi = total_wages + total_interest + total_dividends + additional_income - (total_adjustments)
-        sli_deduction = calculate_student_loan_interest(
-            tax_inputs.student_loan_interest_paid,
-            temp_agi,
-            tax_inputs.filing_status
-        )
+            self._log("  Educator Expense Deduction: ${:,.2f}", educator_deduction)
         if sli_deduction > 0:
-            self._log(f"  Student Loan Interest Deduction: ${sli_deduction:,.2f}")
-            total_adjustments += sli_deduction
+            self._log("  Student Loan Interest Deduction: ${:,.2f}", sli_deduction)
             
         form_1040_inputs = Form1040Inputs(
             filing_status=tax_inputs.filing_status,
             taxpayer=tax_inputs.taxpayer,
             dependents=tax_inputs.dependents,
-            wages=total_wages,
-            interest=total_interest,
-            dividends=total_dividends,
-            schedule_1_additional_income=additional_income,
-            schedule_1_adjustments=total_adjustments
+            wages=wages_c / 100,
+            interest=interest_c / 100,
+            dividends=dividends_c / 100,
+            schedule_1_additional_income=additional_c / 100,
+            schedule_1_adjustments=adjustments_c / 100,
+            other_taxes=se_tax_c / 100,
+            withholding=withholding_c / 100
         )
         
         # Process Form 1040
         form_1040_outputs = self.agents['1040'].process(form_1040_inputs)
         
-        # Manually set Line 23 (Other Taxes) since our 1040 agent doesn't fully implement Sch 2 yet
-        if se_tax > 0:
-            form_1040_outputs.line_23 = se_tax
-            # Recalculate total tax (Line 24) since Line 23 changed
-            form_1040_outputs.line_24 = form_1040_outputs.line_16 - form_1040_outputs.line_19 + form_1040_outputs.line_23
+        return self._finish_return(
+            form_1040_outputs, schedule_b_outputs, schedule_c_outputs, schedule_se_outputs
+        )
+    
+    def process_tax_returns(self, inputs_list: List[Dict[str, Any]]) -> List[Form1040Outputs]:
+        """
+        Process many tax returns at once
         
-        # Update with withholding info (fix for W-2 integration)
-        form_1040_outputs.line_25a = total_withholding
-        form_1040_outputs.line_33 = total_withholding
+        Returns without business income are gathered into column arrays and
+        their Schedule 1 totals computed in one compute_schedule_1_batch call.
+        Returns with a Schedule C go through process_tax_return individually.
+        Both kinds carry citations when the Form 1040 agent has them enabled.
         
-        # Recalculate refund/owed
-        if form_1040_outputs.line_33 > form_1040_outputs.line_24:
-            form_1040_outputs.line_34 = form_1040_outputs.line_33 - form_1040_outputs.line_24
-            form_1040_outputs.line_37 = 0
-        else:
-            form_1040_outputs.line_34 = 0
-            form_1040_outputs.line_37 = form_1040_outputs.line_24 - form_1040_outputs.line_33
+        Afterwards verify_results() checks the last return in inputs_list,
+        as if it had been the last process_tax_return call.
         
-        self._log(f"\n  AGI: ${form_1040_outputs.line_11:,.2f}")
-        self._log(f"  Taxable Income: ${form_1040_outputs.line_15:,.2f}")
-        self._log(f"  Tax: ${form_1040_outputs.line_16:,.2f}")
-        self._log(f"  Total Tax: ${form_1040_outputs.line_24:,.2f}")
-        self._log(f"  Payments: ${form_1040_outputs.line_33:,.2f}")
+        Args:
+            inputs_list: Tax return inputs (input.json format), one per return
+            
+        Returns:
+            Form 1040 outputs, in the same order as inputs_list
+        """
+        results: List[Optional[Form1040Outputs]] = [None] * len(inputs_list)
+        
+        batch = []
+        for i, inputs in enumerate(inputs_list):
+            if "business_income" in inputs:
+                results[i] = self.process_tax_return(inputs)
+            else:
+                batch.append(i)
+        
+        if not batch:
+            return results
+        
+        # Parse batched returns, reducing W-2s and 1099s to per-return cents
+        rows = []
+        for i in batch:
+            tax_inputs = self._parse_inputs(inputs_list[i])
+            wages, withholding = _w2_totals(tax_inputs.w2)
+            interest = sum(form.interest_income for form in tax_inputs.income_1099_int)
+            dividends = sum(form.ordinary_dividends for form in tax_inputs.income_1099_div)
+            rows.append((
+                tax_inputs, _cents(wages), _cents(interest), _cents(dividends), _cents(withholding)
+            ))
+        
+        # Schedule 1 columns (no business income or SE tax in this batch)
+        parsed = [row[0] for row in rows]
+        zeros = np.zeros(len(rows))
+        additional_c, adjustments_c = compute_schedule_1_batch(
+            np.array([row[1] + row[2] + row[3] for row in rows], dtype=np.int64),
+            zeros,
+            zeros,
+            np.array([t.educator_expenses_paid for t in parsed], dtype=np.float64),
+            np.array([t.taxpayer.is_eligible_educator for t in parsed], dtype=np.bool_),
+            np.array([t.spouse_educator_expenses_paid for t in parsed], dtype=np.float64),
+            np.array([t.taxpayer.spouse_eligible_educator for t in parsed], dtype=np.bool_),
+            np.array([t.student_loan_interest_paid for t in parsed], dtype=np.float64),
+            _mfj_mask([t.filing_status for t in parsed], len(parsed))
+        )
+        
+        form_1040_inputs = [
+            Form1040Inputs(
+                filing_status=tax_inputs.filing_status,
+                taxpayer=tax_inputs.taxpayer,
+                dependents=tax_inputs.dependents,
+                wages=wages_c / 100,
+                interest=interest_c / 100,
+                dividends=dividends_c / 100,
+                schedule_1_additional_income=int(additional_c[k]) / 100,
+                schedule_1_adjustments=int(adjustments_c[k]) / 100,
+                withholding=withholding_c / 100
+            )
+            for k, (tax_inputs, wages_c, interest_c, dividends_c, withholding_c) in enumerate(rows)
+        ]
+        form_1040 = self.agents['1040']
+        batch_outputs = form_1040.process_batch(
+            form_1040_inputs, emit_citations=form_1040.enable_citations
+        )
+        for i, outputs in zip(batch, batch_outputs):
+            results[i] = outputs
+        
+        # A batched last return has no schedules; otherwise its own
+        # process_tax_return call already stored its results
+        if batch[-1] == len(inputs_list) - 1:
+            self.results = {
+                'schedule_b': None,
+                'schedule_c': None,
+                'schedule_se': None,
+                'form_1040': results[-1]
+            }
+        
+        self._log("Processed {} returns ({} batched)", len(inputs_list), len(batch))
+        return results
+    
+    def _process_simple_w2(self, tax_inputs: TaxInputs) -> Form1040Outputs:
+        """
+        Fast path for W-2-only returns.
+        
+        Skips Schedule B/C/SE dispatch and the Schedule 1 calculation; Form 1040
+        still computes the deduction, credits and citations as usual.
+        """
+        self._log("\n[4/4] Processing Form 1040 (Main Tax Return)...")
+        
+        total_wages, total_withholding = _w2_totals(tax_inputs.w2)
+        form_1040_inputs = Form1040Inputs(
+            filing_status=tax_inputs.filing_status,
+            taxpayer=tax_inputs.taxpayer,
+            dependents=tax_inputs.dependents,
+            wages=_cents(total_wages) / 100,
+            withholding=_cents(total_withholding) / 100
+        )
+        
+        return self._finish_return(self.agents['1040'].process(form_1040_inputs))
+    
+    def _finish_return(
+        self,
+        form_1040_outputs: Form1040Outputs,
+        schedule_b_outputs=None,
+        schedule_c_outputs=None,
+        schedule_se_outputs=None
+    ) -> Form1040Outputs:
+        """Log the Form 1040 summary and store results for verify_results()"""
+        self._log("\n  AGI: ${:,.2f}", form_1040_outputs.line_11)
+        self._log("  Taxable Income: ${:,.2f}", form_1040_outputs.line_15)
+        self._log("  Tax: ${:,.2f}", form_1040_outputs.line_16)
+        self._log("  Total Tax: ${:,.2f}", form_1040_outputs.line_24)
+        self._log("  Payments: ${:,.2f}", form_1040_outputs.line_33)
         
         if form_1040_outputs.line_34 > 0:
-            self._log(f"  REFUND: ${form_1040_outputs.line_34:,.2f}")
+            self._log("  REFUND: ${:,.2f}", form_1040_outputs.line_34)
         else:
-            self._log(f"  AMOUNT OWED: ${form_1040_outputs.line_37:,.2f}")
+            self._log("  AMOUNT OWED: ${:,.2f}", form_1040_outputs.line_37)
         
         # Store results
         self.results = {
@@ -245,20 +401,20 @@ class TaxReturnProcessor:
         verifier = ArithmeticVerifier()
         result = verifier.verify_form_1040(self.results['form_1040'])
         
-        self._log(f"\n{result.verifier_name}:")
-        self._log(f"  Status: {'✓ PASS' if result.passed else '✗ FAIL'}")
-        self._log(f"  Errors: {len(result.errors)}")
-        self._log(f"  Warnings: {len(result.warnings)}")
+        self._log("\n{}:", result.verifier_name)
+        self._log("  Status: {}", '✓ PASS' if result.passed else '✗ FAIL')
+        self._log("  Errors: {}", len(result.errors))
+        self._log("  Warnings: {}", len(result.warnings))
         
         if result.errors:
             self._log("\n  Errors Found:")
             for error in result.errors:
-                self._log(f"    - {error.line}: {error.message}")
+                self._log("    - {}: {}", error.line, error.message)
         
         if result.warnings:
             self._log("\n  Warnings:")
             for warning in result.warnings:
-                self._log(f"    - {warning}")
+                self._log("    - {}", warning)
         
         return result.passed
     
@@ -266,53 +422,45 @@ class TaxReturnProcessor:
         """Parse input.json format to typed inputs"""
         
         # Parse filing status
-        filing_status_map = {
-            "single": FilingStatus.SINGLE,
-            "married_filing_jointly": FilingStatus.MARRIED_FILING_JOINTLY,
-            "married_filing_separately": FilingStatus.MARRIED_FILING_SEPARATELY,
-            "head_of_household": FilingStatus.HEAD_OF_HOUSEHOLD,
-            "qualifying_widow": FilingStatus.QUALIFYING_WIDOW,
-        }
-        
-        filing_status = filing_status_map.get(
+        filing_status = _FS.get(
             data.get("filing_status", "single").lower(),
             FilingStatus.SINGLE
         )
         
+        # Parse W-2s
+        w2s = [
+            W2(
+                wages=w2_data.get("wages", 0),
+                federal_withholding=w2_data.get("federal_withholding", 0)
+            )
+            for w2_data in data.get("w2", ())
+        ]
+        
         # Parse taxpayer info
         taxpayer = TaxpayerInfo(
             name=data.get("taxpayer_name", "Taxpayer"),
             ssn=data.get("ssn", "000-00-0000"),
-            age=data.get("age")
+            age=data.get("age"),
+            is_eligible_educator=data.get("is_taxpayer_educator", False),
+            spouse_eligible_educator=data.get("is_spouse_educator", False)
         )
         
-        # Parse W-2s
-        w2s = []
-        if "w2" in data:
-            for w2_data in data["w2"]:
-                w2s.append(W2(
-                    wages=w2_data.get("wages", 0),
-                    federal_withholding=w2_data.get("federal_withholding", 0)
-                ))
-        
         # Parse 1099-INT
-        interest_forms = []
-        if "income_1099_int" in data:
-            for form_data in data["income_1099_int"]:
-                interest_forms.append(Form1099INT(
-                    interest_income=form_data.get("interest_income", 0)
-                ))
+        interest_forms = [
+            Form1099INT(interest_income=form_data.get("interest_income", 0))
+            for form_data in data.get("income_1099_int", ())
+        ]
         
         # Parse dependents
-        dependents = []
-        if "dependents" in data:
-            for dep_data in data["dependents"]:
-                dependents.append(Dependent(
-                    name=dep_data.get("name", ""),
-                    ssn=dep_data.get("ssn", ""),
-                    relationship=dep_data.get("relationship", ""),
-                    qualifying_child=dep_data.get("qualifying_child", False)
-                ))
+        dependents = [
+            Dependent(
+                name=dep_data.get("name", ""),
+                ssn=dep_data.get("ssn", ""),
+                relationship=dep_data.get("relationship", ""),
+                qualifying_child=dep_data.get("qualifying_child", False)
+            )
+            for dep_data in data.get("dependents", ())
+        ]
         
         # Parse Business Income (Schedule C)
         business_income = None
@@ -335,10 +483,6 @@ class TaxReturnProcessor:
         spouse_educator_expenses_paid = data.get("spouse_educator_expenses_paid", 0.0)
         student_loan_interest_paid = data.get("student_loan_interest_paid", 0.0)
         
-        # Check flags for eligibility
-        taxpayer.is_eligible_educator = data.get("is_taxpayer_educator", False)
-        taxpayer.spouse_eligible_educator = data.get("is_spouse_educator", False)
-        
         return TaxInputs(
             filing_status=filing_status,
             taxpayer=taxpayer,
@@ -352,8 +496,8 @@ class TaxReturnProcessor:
         )
 
 
-def main():
-    """Main entry point"""
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser"""
     parser = argparse.ArgumentParser(
         description="LightTaxes - Codebase-Style Tax Agent System"
     )
@@ -389,7 +533,28 @@ def main():
         help="Run in mock mode (no API key needed)"
     )
     
-    args = parser.parse_args()
+    return parser
+
+
+_PARSER = _build_parser()
+
+# Example return used when the requested input file does not exist
+_EXAMPLE_INPUT = {
+    "filing_status": "single",
+    "taxpayer_name": "John Doe",
+    "ssn": "123-45-6789",
+    "w2": [
+        {
+            "wages": 50000,
+            "federal_withholding": 5000
+        }
+    ]
+}
+
+
+def main(argv: Optional[list] = None):
+    """Main entry point"""
+    args = _PARSER.parse_args(argv)
     
     # Set mock mode if requested
     if args.mock:
@@ -406,24 +571,14 @@ def main():
         print(f"Error: Input file not found: {input_file}")
         print("\nCreating example input file for testing...")
         
-        # Create example input
-        example_input = {
-            "filing_status": "single",
-            "taxpayer_name": "John Doe",
-            "ssn": "123-45-6789",
-            "w2": [
-                {
-                    "wages": 50000,
-                    "federal_withholding": 5000
-                }
-            ]
-        }
-        
-        # Use it directly
-        input_data = example_input
+        # Use the example input directly
+        input_data = _EXAMPLE_INPUT
     else:
-        with open(input_file, 'r') as f:
-            input_data = json.load(f)
+        if orjson is not None:
+            input_data = orjson.loads(input_file.read_bytes())
+        else:
+            with open(input_file, 'r') as f:
+                input_data = json.load(f)
     
     # Process tax return
     processor = TaxReturnProcessor(verbose=args.verbose or True)
@@ -3,14 +3,70 @@ Form 1040 Agent - U.S. Individual Income Tax Return
 This is the main tax return form - analogous to main() in the paper's codebase metaphor
 """
 
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
+from typing import List, Tuple
+
+import numpy as np
 
 from src.core.form_agent import FormAgent
 from src.core.types import Form1040Inputs, Form1040Outputs
-from src.tools.tax_table import calculate_tax
-from src.tools.standard_deduction import get_standard_deduction
+from src.tools.tax_table import calculate_tax, calculate_tax_batch
+from src.tools.standard_deduction import get_standard_deduction, get_standard_deduction_batch
+from src.core.jit import njit, prange
+
+
+@njit(cache=True)
+def _income_lines(wages, interest, dividends, schedule_1_income, schedule_1_adjustments, deduction):
+    """Lines 9, 11 and 15: total income, AGI and taxable income"""
+    line_9 = wages + interest + dividends + schedule_1_income
+    line_11 = line_9 - schedule_1_adjustments
+    # Line 13 (qualified business income deduction) skipped for simplicity
+    line_15 = max(0.0, line_11 - deduction)
+    return line_9, line_11, line_15
+
+
+@njit(cache=True)
+def _tax_lines(tax, qualifying_children, other_taxes, payments):
+    """Lines 19, 24, 34 and 37: child tax credit, total tax, refund or amount owed"""
+    # Simple child tax credit: $2000 per qualifying child, not exceeding tax
+    credit = 0.0
+    if qualifying_children > 0:
+        credit = min(qualifying_children * 2000.0, tax)
+    
+    # Refund or amount owed, branch-free: at most one of the two is positive
+    total_tax = tax - credit + other_taxes
+    refund = max(0.0, payments - total_tax)
+    owed = max(0.0, total_tax - payments)
+    return credit, total_tax, refund, owed
+
+
+@njit(cache=True, parallel=True)
+def _income_lines_batch(wages, interest, dividends, schedule_1_income, schedule_1_adjustments, deduction):
+    """Array form of _income_lines, one fused loop over all returns"""
+    n = wages.shape[0]
+    line_9 = np.empty(n)
+    line_11 = np.empty(n)
+    line_15 = np.empty(n)
+    for i in prange(n):
+        line_9[i], line_11[i], line_15[i] = _income_lines(
+            wages[i], interest[i], dividends[i],
+            schedule_1_income[i], schedule_1_adjustments[i], deduction[i]
+        )
+    return line_9, line_11, line_15
+
+
+@njit(cache=True, parallel=True)
+def _tax_lines_batch(tax, qualifying_children, other_taxes, payments):
+    """Array form of _tax_lines, one fused loop over all returns"""
+    n = tax.shape[0]
+    credit = np.empty(n)
+    total_tax = np.empty(n)
+    refund = np.empty(n)
+    owed = np.empty(n)
+    for i in prange(n):
+        credit[i], total_tax[i], refund[i], owed[i] = _tax_lines(
+            tax[i], qualifying_children[i], other_taxes[i], payments[i]
+        )
+    return credit, total_tax, refund, owed
 
 
 class Form1040Agent(FormAgent):
@@ -25,6 +81,8 @@ class Form1040Agent(FormAgent):
     - Schedule 8812 (child tax credit)
     """
     
+    __slots__ = ()
+    
     def __init__(self, **kwargs):
         super().__init__(form_name="1040", **kwargs)
     
@@ -50,268 +108,363 @@ class Form1040Agent(FormAgent):
         Returns:
             Form1040Outputs with all calculated lines
         """
-        outputs = Form1040Outputs()
+        # Numeric core (all lines) in one straight-line pass
+        outputs, num_qualifying_children = self._compute_lines(inputs)
         
-        # INCOME SECTION (Lines 1-9)
-        self._calculate_income(inputs, outputs)
+        # Citations section by section, skipped entirely when disabled
+        if self.enable_citations:
+            self.clear_citations()
+            self._cite_lines(inputs, outputs, num_qualifying_children)
+            outputs.citations = self.citation_sources()
+        
+        return outputs
+    
+    def process_batch(
+        self,
+        inputs_list: List[Form1040Inputs],
+        emit_citations: bool = False
+    ) -> List[Form1040Outputs]:
+        """
+        Process many Form 1040s at once
+        
+        Inputs are laid out as one NumPy column per field and the lines are
+        computed by parallel loops over the same kernels process() uses, so
+        the whole batch enters compiled code once per kernel. With
+        emit_citations=True the computed outputs are then cited return by
+        return, without recomputing any line.
+        
+        Args:
+            inputs_list: Form1040Inputs, one per return
+            emit_citations: Whether to record citations for each return
+            
+        Returns:
+            Form1040Outputs in the same order as inputs_list
+        """
+        if not inputs_list:
+            return []
+        
+        def column(values):
+            return np.fromiter(values, dtype=np.float64, count=len(inputs_list))
+        
+        wages = column(i.wages for i in inputs_list)
+        interest = column(i.interest for i in inputs_list)
+        dividends = column(i.dividends for i in inputs_list)
+        sched1_inc = column(i.schedule_1_additional_income for i in inputs_list)
+        sched1_adj = column(i.schedule_1_adjustments for i in inputs_list)
+        other_taxes = column(i.other_taxes for i in inputs_list)
+        withholding = column(self._withholding(i) for i in inputs_list)
+        num_qc = self._qualifying_child_counts(inputs_list)
+        line_12 = get_standard_deduction_batch(
+            [i.filing_status.value for i in inputs_list],
+            [i.taxpayer.age for i in inputs_list],
+            [i.taxpayer.blind for i in inputs_list],
+            [i.taxpayer.spouse_age for i in inputs_list],
+            [i.taxpayer.spouse_blind for i in inputs_list]
+        )
+        
+        # Lines 9-15: income, AGI and taxable income
+        line_9, line_11, line_15 = _income_lines_batch(
+            wages, interest, dividends, sched1_inc, sched1_adj, line_12
+        )
+        
+        # Line 16: bracket lookup over the whole column
+        line_16 = calculate_tax_batch(line_15, [i.filing_status.value for i in inputs_list])
+        
+        # Lines 19-37: credits, total tax, payments, refund or amount owed
+        line_19, line_24, line_34, line_37 = _tax_lines_batch(
+            line_16, num_qc, other_taxes, withholding
+        )
+        
+        columns = {
+            'line_1z': wages, 'line_2b': interest, 'line_3b': dividends,
+            'line_8': sched1_inc, 'line_9': line_9, 'line_10': sched1_adj,
+            'line_11': line_11, 'line_12': line_12, 'line_15': line_15,
+            'line_16': line_16, 'line_19': line_19, 'line_23': other_taxes,
+            'line_24': line_24, 'line_25a': withholding, 'line_33': withholding,
+            'line_34': line_34, 'line_37': line_37,
+        }
+        names = tuple(columns)
+        rows = zip(*(col.tolist() for col in columns.values()))
+        outputs_list = [Form1040Outputs(**dict(zip(names, row))) for row in rows]
+        
+        # Numbers are already final; only the reasoning is per-return
+        if emit_citations:
+            for inputs, outputs, count in zip(inputs_list, outputs_list, num_qc.tolist()):
+                self.clear_citations()
+                self._cite_lines(inputs, outputs, count)
+                outputs.citations = self.citation_sources()
+        
+        return outputs_list
+    
+    @staticmethod
+    def _qualifying_child_counts(inputs_list: List[Form1040Inputs]) -> np.ndarray:
+        """Qualifying children per return, from one flat pass over all dependents"""
+        owners = np.fromiter(
+            (n for n, i in enumerate(inputs_list) for _ in i.dependents), dtype=np.int64
+        )
+        flags = np.fromiter(
+            (d.qualifying_child for i in inputs_list for d in i.dependents), dtype=np.float64
+        )
+        return np.bincount(owners, weights=flags, minlength=len(inputs_list)).astype(np.int64)
+    
+    @staticmethod
+    def _withholding(inputs: Form1040Inputs) -> float:
+        """Withholding provided by the caller, otherwise the W-2s on the taxpayer"""
+        if inputs.withholding is None:
+            return inputs.taxpayer.w2_withholding
+        return inputs.withholding
+    
+    def _compute_lines(self, inputs: Form1040Inputs) -> Tuple[Form1040Outputs, int]:
+        """
+        Compute every Form 1040 line.
+        
+        The arithmetic runs in the _income_lines/_tax_lines kernels; the
+        standard deduction and the tax table stay on their cached lookups.
+        Lines are gathered into locals and the outputs model is built in a
+        single constructor call rather than one attribute set per line.
+        
+        Returns:
+            Form1040Outputs and the number of qualifying children (for the
+            Line 19 citation)
+        """
+        # Lines 1z-8 and 10: carried from W-2s, Schedule B and Schedule 1
+        line_1z = inputs.wages
+        line_2b = inputs.interest
+        line_3b = inputs.dividends
+        line_8 = inputs.schedule_1_additional_income
+        line_10 = inputs.schedule_1_adjustments
+        
+        # Line 12: Standard deduction (itemizing via Schedule A not implemented)
+        line_12 = get_standard_deduction(
+            inputs.filing_status.value,
+            inputs.taxpayer.age,
+            inputs.taxpayer.blind,
+            inputs.taxpayer.spouse_age,
+            inputs.taxpayer.spouse_blind
+        )
+        
+        # Lines 9, 11, 15
+        line_9, line_11, line_15 = _income_lines(
+            line_1z, line_2b, line_3b, line_8, line_10, line_12
+        )
+        
+        # Line 16: Tax from tax table or computation worksheet (DETERMINISTIC - NO LLM)
+        line_16 = calculate_tax(line_15, inputs.filing_status.value)
         
-        # ADJUSTMENTS (Line 10)
-        self._calculate_adjustments(inputs, outputs)
+        # Lines 23, 25a, 33: other taxes (Schedule 2) and W-2 withholding
+        line_23 = inputs.other_taxes
+        line_25a = self._withholding(inputs)
         
-        # AGI (Line 11)
-        self._calculate_agi(inputs, outputs)
+        # Lines 19, 24, 34, 37
+        num_qualifying_children = int(inputs.qualifying_child_mask.sum())
+        line_19, line_24, line_34, line_37 = _tax_lines(
+            line_16, num_qualifying_children, line_23, line_25a
+        )
+        
+        outputs = Form1040Outputs(
+            line_1z=line_1z, line_2b=line_2b, line_3b=line_3b, line_8=line_8,
+            line_9=line_9, line_10=line_10, line_11=line_11, line_12=line_12,
+            line_15=line_15, line_16=line_16, line_19=line_19, line_23=line_23,
+            line_24=line_24, line_25a=line_25a, line_33=line_25a,
+            line_34=line_34, line_37=line_37
+        )
+        return outputs, num_qualifying_children
+    
+    def _cite_lines(
+        self,
+        inputs: Form1040Inputs,
+        outputs: Form1040Outputs,
+        num_qualifying_children: int
+    ):
+        """Record citations for every section of a computed return"""
+        
+        # INCOME SECTION (Lines 1-9)
+        self._cite_income(outputs)
         
-        # DEDUCTIONS (Line 12)
-        self._calculate_deductions(inputs, outputs)
+        # ADJUSTMENTS AND AGI (Lines 10-11)
+        self._cite_agi(outputs)
         
-        # TAXABLE INCOME (Line 15)
-        self._calculate_taxable_income(inputs, outputs)
+        # DEDUCTIONS AND TAXABLE INCOME (Lines 12-15)
+        self._cite_deductions(inputs, outputs)
         
         # TAX (Line 16)
-        self._calculate_tax(inputs, outputs)
+        self._cite_tax(inputs, outputs)
         
         # CREDITS (Lines 17-21)
-        self._calculate_credits(inputs, outputs)
+        self._cite_credits(outputs, num_qualifying_children)
         
-        # OTHER TAXES (Lines 22-23)
-        self._calculate_other_taxes(inputs, outputs)
-        
-        # TOTAL TAX (Line 24)
-        self._calculate_total_tax(inputs, outputs)
+        # OTHER TAXES AND TOTAL TAX (Lines 22-24)
+        self._cite_total_tax(outputs)
         
         # PAYMENTS (Lines 25-33)
-        self._calculate_payments(inputs, outputs)
+        self._cite_payments(outputs)
         
         # REFUND OR AMOUNT OWED (Lines 34/37)
-        self._calculate_refund_or_owed(inputs, outputs)
-        
-        # Add citations
-        outputs.citations = {c.line: c.source for c in self.citations}
-        
-        return outputs
+        self._cite_refund_or_owed(outputs)
     
-    def _calculate_income(self, inputs: Form1040Inputs, outputs: Form1040Outputs):
-        """Calculate total income (Lines 1-9)"""
+    def _cite_income(self, outputs: Form1040Outputs):
+        """Cite total income (Lines 1-9)"""
         
         # Line 1z: Wages from W-2
-        outputs.line_1z = inputs.wages
         self.cite(
             "Line 1z",
             "Form W-2, Box 1",
-            f"Total wages from W-2 forms: ${outputs.line_1z:,.2f}"
+            "Total wages from W-2 forms: ${:,.2f}",
+            outputs.line_1z
         )
         
         # Line 2b: Taxable interest (from Schedule B or direct input)
-        outputs.line_2b = inputs.interest
         if outputs.line_2b > 0:
             self.cite(
                 "Line 2b",
                 "Schedule B, Line 4 or Form 1099-INT",
-                f"Taxable interest income: ${outputs.line_2b:,.2f}"
+                "Taxable interest income: ${:,.2f}",
+                outputs.line_2b
             )
         
         # Line 3b: Qualified dividends (from Schedule B or direct input)
-        outputs.line_3b = inputs.dividends
         if outputs.line_3b > 0:
             self.cite(
                 "Line 3b",
                 "Schedule B, Line 6 or Form 1099-DIV",
-                f"Qualified dividends: ${outputs.line_3b:,.2f}"
+                "Qualified dividends: ${:,.2f}",
+                outputs.line_3b
             )
         
         # Line 8: Additional income from Schedule 1
-        outputs.line_8 = inputs.schedule_1_additional_income
         if outputs.line_8 > 0:
             self.cite(
                 "Line 8",
                 "Schedule 1, Line 10",
-                f"Additional income from Schedule 1: ${outputs.line_8:,.2f}"
+                "Additional income from Schedule 1: ${:,.2f}",
+                outputs.line_8
             )
         
         # Line 9: Total income
-        outputs.line_9 = (
-            outputs.line_1z +
-            outputs.line_2b +
-            outputs.line_3b +
-            outputs.line_8
-        )
         self.cite(
             "Line 9",
             "Form 1040 Instructions, Line 9",
-            f"Total income: ${outputs.line_9:,.2f} = Sum of Lines 1-8"
+            "Total income: ${:,.2f} = Sum of Lines 1-8",
+            outputs.line_9
         )
     
-    def _calculate_adjustments(self, inputs: Form1040Inputs, outputs: Form1040Outputs):
-        """Calculate adjustments to income (Line 10)"""
+    def _cite_agi(self, outputs: Form1040Outputs):
+        """Cite adjustments (Line 10) and Adjusted Gross Income (Line 11)"""
         
         # Line 10: Adjustments from Schedule 1
-        outputs.line_10 = inputs.schedule_1_adjustments
         if outputs.line_10 > 0:
             self.cite(
                 "Line 10",
                 "Schedule 1, Line 26",
-                f"Adjustments to income from Schedule 1: ${outputs.line_10:,.2f}"
+                "Adjustments to income from Schedule 1: ${:,.2f}",
+                outputs.line_10
             )
-    
-    def _calculate_agi(self, inputs: Form1040Inputs, outputs: Form1040Outputs):
-        """Calculate Adjusted Gross Income (Line 11)"""
         
         # Line 11: AGI = Total Income - Adjustments
-        outputs.line_11 = outputs.line_9 - outputs.line_10
         self.cite(
             "Line 11",
             "Form 1040 Instructions, Line 11 - Adjusted Gross Income",
-            f"AGI: ${outputs.line_11:,.2f} = Line 9 (${outputs.line_9:,.2f}) - Line 10 (${outputs.line_10:,.2f})"
+            "AGI: ${:,.2f} = Line 9 (${:,.2f}) - Line 10 (${:,.2f})",
+            outputs.line_11, outputs.line_9, outputs.line_10
         )
     
-    def _calculate_deductions(self, inputs: Form1040Inputs, outputs: Form1040Outputs):
-        """Calculate deductions (Line 12)"""
-        
-        # Line 12: Standard or itemized deduction
-        # For this implementation, always use standard deduction
-        # In production, would check Schedule A
-        
-        taxpayer_age = inputs.taxpayer.age
-        taxpayer_blind = inputs.taxpayer.blind
-        spouse_age = inputs.taxpayer.spouse_age
-        spouse_blind = inputs.taxpayer.spouse_blind
-        
-        outputs.line_12 = get_standard_deduction(
-            inputs.filing_status.value,
-            taxpayer_age,
-            taxpayer_blind,
-            spouse_age,
-            spouse_blind
-        )
+    def _cite_deductions(self, inputs: Form1040Inputs, outputs: Form1040Outputs):
+        """Cite deductions (Line 12) and taxable income (Line 15)"""
         
         self.cite(
             "Line 12",
             f"IRS Standard Deduction for {inputs.filing_status.value}",
-            f"Standard deduction: ${outputs.line_12:,.2f}"
+            "Standard deduction: ${:,.2f}",
+            outputs.line_12
         )
-    
-    def _calculate_taxable_income(self, inputs: Form1040Inputs, outputs: Form1040Outputs):
-        """Calculate taxable income (Line 15)"""
-        
-        # Line 15: Taxable income = AGI - Deductions
-        # Note: Line 13 (qualified business income deduction) skipped for simplicity
-        # Line 14 would be sum of 12 and 13
-        outputs.line_15 = max(0, outputs.line_11 - outputs.line_12)
         
         self.cite(
             "Line 15",
             "Form 1040 Instructions, Line 15 - Taxable Income",
-            f"Taxable income: ${outputs.line_15:,.2f} = AGI (${outputs.line_11:,.2f}) - Deductions (${outputs.line_12:,.2f})"
+            "Taxable income: ${:,.2f} = AGI (${:,.2f}) - Deductions (${:,.2f})",
+            outputs.line_15, outputs.line_11, outputs.line_12
         )
     
-    def _calculate_tax(self, inputs: Form1040Inputs, outputs: Form1040Outputs):
-        """Calculate tax using deterministic tax table (Line 16)"""
-        
-        # Line 16: Tax from tax table or computation worksheet
-        # This uses DETERMINISTIC calculation - NO LLM
-        outputs.line_16 = calculate_tax(outputs.line_15, inputs.filing_status.value)
+    def _cite_tax(self, inputs: Form1040Inputs, outputs: Form1040Outputs):
+        """Cite tax from the deterministic tax table (Line 16)"""
         
         self.cite(
             "Line 16",
             "2024 Tax Computation Worksheet / Tax Tables",
-            f"Tax on ${outputs.line_15:,.2f} taxable income with {inputs.filing_status.value} status: ${outputs.line_16:,.2f}"
+            "Tax on ${:,.2f} taxable income with {} status: ${:,.2f}",
+            outputs.line_15, inputs.filing_status.value, outputs.line_16
         )
     
-    def _calculate_credits(self, inputs: Form1040Inputs, outputs: Form1040Outputs):
-        """Calculate credits (Lines 17-21)"""
-        
-        # Line 19: Child tax credit (from Schedule 8812 or simple calc)
-        # For simplicity, not implementing full Schedule 8812 logic here
-        # In production, would call Schedule8812Agent
-        
-        num_qualifying_children = sum(1 for d in inputs.dependents if d.qualifying_child)
+    def _cite_credits(self, outputs: Form1040Outputs, num_qualifying_children: int):
+        """Cite credits (Lines 17-21)"""
         
+        # Line 19: Child tax credit (simple calc; full Schedule 8812 not implemented)
         if num_qualifying_children > 0:
-            # Simple child tax credit (not considering phase-outs)
-            # $2000 per qualifying child
-            child_credit = num_qualifying_children * 2000
-            # Credit cannot exceed tax
-            outputs.line_19 = min(child_credit, outputs.line_16)
-            
             self.cite(
                 "Line 19",
                 "Schedule 8812 - Child Tax Credit",
-                f"Child tax credit: ${outputs.line_19:,.2f} for {num_qualifying_children} qualifying children"
+                "Child tax credit: ${:,.2f} for {} qualifying children",
+                outputs.line_19, num_qualifying_children
             )
     
-    def _calculate_other_taxes(self, inputs: Form1040Inputs, outputs: Form1040Outputs):
-        """Calculate other taxes (Lines 22-23)"""
+    def _cite_total_tax(self, outputs: Form1040Outputs):
+        """Cite other taxes (Line 23) and total tax (Line 24)"""
         
-        # Line 23: Self-employment tax (from Schedule SE via Schedule 1)
-        # This would come from Schedule 1, but we'll track it separately
-        # In production, this would be properly integrated
-        pass
-    
-    def _calculate_total_tax(self, inputs: Form1040Inputs, outputs: Form1040Outputs):
-        """Calculate total tax (Line 24)"""
+        # Line 23: Other taxes from Schedule 2 (self-employment tax from Schedule SE)
+        if outputs.line_23 > 0:
+            self.cite(
+                "Line 23",
+                "Schedule 2, Line 21 (Schedule SE)",
+                "Other taxes, including self-employment tax: ${:,.2f}",
+                outputs.line_23
+            )
         
         # Line 24: Total tax = Tax - Credits + Other Taxes
-        # Simplified: Line 16 - Line 19 + Line 23
-        outputs.line_24 = outputs.line_16 - outputs.line_19 + outputs.line_23
-        
         self.cite(
             "Line 24",
             "Form 1040 Instructions, Line 24 - Total Tax",
-            f"Total tax: ${outputs.line_24:,.2f} = Tax (${outputs.line_16:,.2f}) - Credits (${outputs.line_19:,.2f}) + Other Taxes (${outputs.line_23:,.2f})"
+            "Total tax: ${:,.2f} = Tax (${:,.2f}) - Credits (${:,.2f}) + Other Taxes (${:,.2f})",
+            outputs.line_24, outputs.line_16, outputs.line_19, outputs.line_23
         )
     
-    def _calculate_payments(self, inputs: Form1040Inputs, outputs: Form1040Outputs):
-        """Calculate payments (Lines 25-33)"""
-        
-        # Line 25a: Federal income tax withheld from W-2
-        # Sum all W-2 withholding from inputs
-        total_withholding = sum(w2.federal_withholding for w2 in inputs.taxpayer.w2) if hasattr(inputs.taxpayer, 'w2') else 0
-        
-        # If no W-2 info in taxpayer, check if wages input includes withholding info
-        # For TaxCalcBench compatibility, we might need to extract from initial inputs
-        # For now, we'll set this to 0 unless explicitly provided
-        outputs.line_25a = total_withholding
+    def _cite_payments(self, outputs: Form1040Outputs):
+        """Cite payments (Lines 25-33)"""
         
         if outputs.line_25a > 0:
             self.cite(
                 "Line 25a",
                 "Form W-2, Box 2",
-                f"Federal income tax withheld: ${outputs.line_25a:,.2f}"
+                "Federal income tax withheld: ${:,.2f}",
+                outputs.line_25a
             )
         
-        # Line 33: Total payments
-        outputs.line_33 = outputs.line_25a
-        
         self.cite(
             "Line 33",
             "Form 1040 Instructions, Line 33 - Total Payments",
-            f"Total payments: ${outputs.line_33:,.2f}"
+            "Total payments: ${:,.2f}",
+            outputs.line_33
         )
     
-    def _calculate_refund_or_owed(self, inputs: Form1040Inputs, outputs: Form1040Outputs):
-        """Calculate refund or amount owed (Lines 34/37)"""
-        
-        # Compare payments to total tax
-        if outputs.line_33 > outputs.line_24:
-            # Refund
-            outputs.line_34 = outputs.line_33 - outputs.line_24
-            outputs.line_37 = 0
-            
-            self.cite(
+    def _cite_refund_or_owed(self, outputs: Form1040Outputs):
+        """Cite refund or amount owed (Lines 34/37)"""
+        
+        is_refund = outputs.line_34 > 0
+        if is_refund:
+            line, source, reasoning = (
                 "Line 34",
                 "Form 1040 Instructions, Line 34 - Refund",
-                f"Overpayment (refund): ${outputs.line_34:,.2f} = Payments (${outputs.line_33:,.2f}) - Tax (${outputs.line_24:,.2f})"
+                "Overpayment (refund): ${:,.2f} = Payments (${:,.2f}) - Tax (${:,.2f})"
             )
+            amounts = (outputs.line_34, outputs.line_33, outputs.line_24)
         else:
-            # Amount owed
-            outputs.line_34 = 0
-            outputs.line_37 = outputs.line_24 - outputs.line_33
-            
-            self.cite(
+            line, source, reasoning = (
                 "Line 37",
                 "Form 1040 Instructions, Line 37 - Amount You Owe",
-                f"Amount you owe: ${outputs.line_37:,.2f} = Tax (${outputs.line_24:,.2f}) - Payments (${outputs.line_33:,.2f})"
+                "Amount you owe: ${:,.2f} = Tax (${:,.2f}) - Payments (${:,.2f})"
             )
+            amounts = (outputs.line_37, outputs.line_24, outputs.line_33)
+        
+        self.cite(line, source, reasoning, *amounts)
 
 
 if __name__ == "__main__":
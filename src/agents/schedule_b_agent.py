@@ -3,9 +3,7 @@ Schedule B Agent - Interest and Ordinary Dividends
 Upstream form for Form 1040 (feeds Lines 2b and 3b)
 """
 
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
+import numpy as np
 
 from src.core.form_agent import FormAgent
 from src.core.types import ScheduleBInputs, ScheduleBOutputs
@@ -20,6 +18,8 @@ class ScheduleBAgent(FormAgent):
     - Output: Form 1040 Lines 2b and 3b
     """
     
+    __slots__ = ()
+    
     def __init__(self, **kwargs):
         super().__init__(form_name="schedule-b", **kwargs)
     
@@ -37,37 +37,49 @@ class ScheduleBAgent(FormAgent):
         Returns:
             ScheduleBOutputs with total interest and dividends
         """
-        outputs = ScheduleBOutputs(
-            total_interest=0.0,
-            total_dividends=0.0
-        )
+        # Citations on the outputs cover this return only
+        self.clear_citations()
+        
+        total_interest = 0.0
+        total_dividends = 0.0
         
         # Part I: Interest
         if inputs.interest_income:
-            outputs.total_interest = sum(
-                item.interest_income for item in inputs.interest_income
-            )
+            total_interest = float(np.fromiter(
+                (item.interest_income for item in inputs.interest_income),
+                dtype=np.float64,
+                count=len(inputs.interest_income)
+            ).sum())
             
             self.cite(
                 "Line 4",
                 "Form 1099-INT aggregation",
-                f"Total interest income: ${outputs.total_interest:,.2f} from {len(inputs.interest_income)} payer(s)"
+                "Total interest income: ${:,.2f} from {} payer(s)",
+                total_interest, len(inputs.interest_income)
             )
         
         # Part II: Dividends
         if inputs.dividend_income:
-            outputs.total_dividends = sum(
-                item.ordinary_dividends for item in inputs.dividend_income
-            )
+            total_dividends = float(np.fromiter(
+                (item.ordinary_dividends for item in inputs.dividend_income),
+                dtype=np.float64,
+                count=len(inputs.dividend_income)
+            ).sum())
             
             self.cite(
                 "Line 6",
                 "Form 1099-DIV aggregation",
-                f"Total ordinary dividends: ${outputs.total_dividends:,.2f} from {len(inputs.dividend_income)} payer(s)"
+                "Total ordinary dividends: ${:,.2f} from {} payer(s)",
+                total_dividends, len(inputs.dividend_income)
             )
         
+        outputs = ScheduleBOutputs(
+            total_interest=total_interest,
+            total_dividends=total_dividends
+        )
+        
         # Add citations to outputs
-        outputs.citations = {c.line: c.source for c in self.citations}
+        outputs.citations = self.citation_sources()
         
         return outputs
 
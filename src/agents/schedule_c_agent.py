@@ -3,12 +3,15 @@ Schedule C Agent - Profit or Loss from Business
 Upstream form for Schedule SE (self-employment tax)
 """
 
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
+import numpy as np
 
 from src.core.form_agent import FormAgent
-from src.core.types import ScheduleCInputs, ScheduleCOutputs
+from src.core.types import ScheduleCInputs, ScheduleCOutputs, EXPENSE_FIELDS
+
+
+# Deductible share of each expense in EXPENSE_FIELDS (only 50% of meals)
+_COEFFS = np.array([0.5 if name == "meals" else 1.0 for name in EXPENSE_FIELDS])
+_COEFFS.setflags(write=False)
 
 
 class ScheduleCAgent(FormAgent):
@@ -20,6 +23,8 @@ class ScheduleCAgent(FormAgent):
     - Output: Net profit/loss → Schedule SE → Schedule 1
     """
     
+    __slots__ = ()
+    
     def __init__(self, **kwargs):
         super().__init__(form_name="schedule-c", **kwargs)
     
@@ -37,6 +42,9 @@ class ScheduleCAgent(FormAgent):
         Returns:
             ScheduleCOutputs with gross income, expenses, and net profit/loss
         """
+        # Citations on the outputs cover this return only
+        self.clear_citations()
+        
         business = inputs.business
         
         # Part I: Income
@@ -55,35 +63,26 @@ class ScheduleCAgent(FormAgent):
         self.cite(
             "Line 7",
             "Schedule C Instructions, Part I",
-            f"Gross income: ${gross_income:,.2f} = Receipts (${gross_receipts:,.2f}) - Returns (${returns:,.2f}) - COGS (${cogs:,.2f}) + Other (${business.other_income:,.2f})"
+            "Gross income: ${:,.2f} = Receipts (${:,.2f}) - Returns (${:,.2f}) - COGS (${:,.2f}) + Other (${:,.2f})",
+            gross_income, gross_receipts, returns, cogs, business.other_income
         )
         
         # Part II: Expenses
-        total_expenses = (
-            business.advertising +
-            business.car_truck_expenses +
-            business.commissions_fees +
-            business.contract_labor +
-            business.depreciation +
-            business.insurance +
-            business.interest +
-            business.legal_professional +
-            business.office_expense +
-            business.rent_lease +
-            business.repairs_maintenance +
-            business.supplies +
-            business.taxes_licenses +
-            business.travel +
-            (business.meals * 0.5) +  # Only 50% of meals deductible
-            business.utilities +
-            business.wages +
-            sum(business.other_expenses.values())
-        )
+        # Weighting by 1.0/0.5 is exact and cumsum adds in field order, so the total
+        # matches line-by-line addition (50% meals often land on half cents)
+        total_expenses = float(np.cumsum(_COEFFS * business.to_vector())[-1])
+        if business.other_expenses:
+            total_expenses += float(np.fromiter(
+                business.other_expenses.values(),
+                dtype=np.float64,
+                count=len(business.other_expenses)
+            ).cumsum()[-1])
         
         self.cite(
             "Line 28",
             "Schedule C Instructions, Part II",
-            f"Total expenses: ${total_expenses:,.2f} (Note: Meals limited to 50% deductible)"
+            "Total expenses: ${:,.2f} (Note: Meals limited to 50% deductible)",
+            total_expenses
         )
         
         # Line 31: Net profit or loss
@@ -92,7 +91,8 @@ class ScheduleCAgent(FormAgent):
         self.cite(
             "Line 31",
             "Schedule C Instructions, Line 31",
-            f"Net profit (or loss): ${net_profit_loss:,.2f} = Gross Income (${gross_income:,.2f}) - Total Expenses (${total_expenses:,.2f})"
+            "Net profit (or loss): ${:,.2f} = Gross Income (${:,.2f}) - Total Expenses (${:,.2f})",
+            net_profit_loss, gross_income, total_expenses
         )
         
         outputs = ScheduleCOutputs(
@@ -101,7 +101,7 @@ class ScheduleCAgent(FormAgent):
             net_profit_loss=net_profit_loss
         )
         
-        outputs.citations = {c.line: c.source for c in self.citations}
+        outputs.citations = self.citation_sources()
         
         return outputs
 
@@ -3,12 +3,11 @@ Schedule SE Agent - Self-Employment Tax
 Calculates Social Security and Medicare tax for self-employed individuals
 """
 
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
+import numpy as np
 
 from src.core.form_agent import FormAgent
 from src.core.types import ScheduleSEInputs, ScheduleSEOutputs
+from src.core.jit import njit
 
 
 # 2024 Self-Employment Tax Constants
@@ -19,6 +18,29 @@ TOTAL_SE_RATE = SOCIAL_SECURITY_RATE + MEDICARE_RATE  # 15.3%
 SOCIAL_SECURITY_WAGE_BASE_2024 = 168600  # Wage base limit for Social Security
 
 
+@njit(cache=True)
+def compute_se_batch(net_profit):
+    """
+    Array form of ScheduleSEAgent.process for many net profits at once.
+    
+    Returns (net_earnings, self_employment_tax, deduction) as float64
+    arrays. Amounts are left unrounded; callers round to cents with
+    round(float(x), 2) exactly as the scalar agent does.
+    """
+    n = net_profit.shape[0]
+    net_earnings = np.zeros(n)
+    se_tax = np.zeros(n)
+    deduction = np.zeros(n)
+    for i in range(n):
+        if net_profit[i] > 400.0:
+            ne = net_profit[i] * SE_TAX_RATE
+            tax = min(ne, SOCIAL_SECURITY_WAGE_BASE_2024) * SOCIAL_SECURITY_RATE + ne * MEDICARE_RATE
+            net_earnings[i] = ne
+            se_tax[i] = tax
+            deduction[i] = tax / 2
+    return net_earnings, se_tax, deduction
+
+
 class ScheduleSEAgent(FormAgent):
     """
     Schedule SE - Self-Employment Tax
@@ -30,6 +52,8 @@ class ScheduleSEAgent(FormAgent):
         - Deduction (1/2 of SE tax) → Form 1040 Schedule 1 Line 15
     """
     
+    __slots__ = ()
+    
     def __init__(self, **kwargs):
         super().__init__(form_name="schedule-se", **kwargs)
     
@@ -46,6 +70,9 @@ class ScheduleSEAgent(FormAgent):
             ScheduleSEOutputs with SE tax and deduction
         """
         
+        # Citations on the outputs cover this return only
+        self.clear_citations()
+        
         net_profit = inputs.net_profit_loss
         
         # Must have net profit to have SE tax
@@ -72,7 +99,8 @@ class ScheduleSEAgent(FormAgent):
         self.cite(
             "Line 4",
             "Schedule SE Instructions, Line 4",
-            f"Net earnings: ${net_earnings:,.2f} = ${net_profit:,.2f} × 92.35%"
+            "Net earnings: ${:,.2f} = ${:,.2f} × 92.35%",
+            net_earnings, net_profit
         )
         
         # Calculate Social Security and Medicare portions
@@ -89,7 +117,8 @@ class ScheduleSEAgent(FormAgent):
         self.cite(
             "Line 12",
             "Schedule SE Instructions, Line 12",
-            f"Self-employment tax: ${self_employment_tax:,.2f} = SS (${ss_tax:,.2f}) + Medicare (${medicare_tax:,.2f})"
+            "Self-employment tax: ${:,.2f} = SS (${:,.2f}) + Medicare (${:,.2f})",
+            self_employment_tax, ss_tax, medicare_tax
         )
         
         # Line 13: Deduction for 1/2 of SE tax
@@ -99,7 +128,8 @@ class ScheduleSEAgent(FormAgent):
         self.cite(
             "Line 13",
             "Schedule SE Instructions, Line 13 - Deduction",
-            f"Deduction for 1/2 of SE tax: ${deduction:,.2f}"
+            "Deduction for 1/2 of SE tax: ${:,.2f}",
+            deduction
         )
         
         outputs = ScheduleSEOutputs(
@@ -108,7 +138,7 @@ class ScheduleSEAgent(FormAgent):
             deduction=round(deduction, 2)
         )
         
-        outputs.citations = {c.line: c.source for c in self.citations}
+        outputs.citations = self.citation_sources()
         
         return outputs
 
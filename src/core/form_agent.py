@@ -3,19 +3,44 @@ Base Form Agent class - Foundation for all IRS form agents
 Implements the codebase-style architecture from the paper
 """
 
+import re
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
-import sys
-import os
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
-
-from src.core.types import AgentResponse, Citation
-from src.core.llm_engine import LLMEngine
+from src.core.types import AgentResponse, Citation, CitationRecord
+from src.core.llm_engine import LLMEngine, default_engine
 from src.tools.pdf_navigator import PDFNavigator
 
 
+# First number in an LLM response, once currency symbols and commas are gone
+_NUMBER_RE = re.compile(r'-?\d+\.?\d*')
+
+
+@lru_cache(maxsize=None)
+def _system_prompt(form_name: str) -> str:
+    """Default system prompt for a form, one shared string per form name"""
+    return f"""You are a tax preparation agent specialized in IRS Form {form_name}.
+
+Your responsibilities:
+1. Follow IRS instructions exactly
+2. Cite sources for non-trivial decisions
+3. Flag any ambiguities or errors
+4. Use deterministic calculations when possible
+5. Be conservative - when in doubt, consult instructions
+
+Respond with clear, step-by-step reasoning."""
+
+
+def _line_prompt(calculation_prompt: str) -> str:
+    """Wrap a line calculation prompt with the numeric-answer instructions"""
+    return f"""{calculation_prompt}
+
+Respond with ONLY the numeric value, no explanation or currency symbols.
+If the value is 0 or not applicable, respond with "0".
+"""
+
+
 class FormAgent(ABC):
     """
     Base class for all IRS form agents.
@@ -27,6 +52,14 @@ class FormAgent(ABC):
     4. Follows a clear processing pipeline
     """
     
+    # Fixed attribute set, no per-instance __dict__; subclasses declare
+    # their own (usually empty) __slots__ to keep it that way
+    __slots__ = (
+        "form_name", "llm", "pdf_nav", "enable_citations", "default_system",
+        "citations", "_citation_sources", "errors", "warnings",
+        "_line_values", "_pdf_loaded",
+    )
+    
     def __init__(
         self,
         form_name: str,
@@ -39,22 +72,40 @@ class FormAgent(ABC):
         
         Args:
             form_name: IRS form name (e.g., "1040", "schedule-c")
-            llm: LLM engine instance
+            llm: LLM engine instance (default: the process-wide engine
+                for DEFAULT_LLM)
             pdf_navigator: PDF navigator instance
             enable_citations: Whether to track IRS citations
         """
         self.form_name = form_name
-        self.llm = llm or LLMEngine()
+        self.llm = llm or default_engine()
         self.pdf_nav = pdf_navigator or PDFNavigator()
         self.enable_citations = enable_citations
         
+        # System prompt shared by every LLM call this agent makes
+        self.default_system = _system_prompt(form_name)
+        
         # Storage for citations and errors
-        self.citations: List[Citation] = []
+        self.citations: List[CitationRecord] = []
+        self._citation_sources: Dict[str, str] = {}
         self.errors: List[str] = []
         self.warnings: List[str] = []
         
-        # Load form PDF
-        self._load_form_pdf()
+        # Parsed line values by (line, prompt, IRS context), used when the
+        # LLM engine caches responses so repeats skip the parse as well
+        self._line_values: Dict[Tuple[str, str, Optional[str]], float] = {}
+        
+        # The form PDF is opened on first use, so agents that only run the
+        # deterministic tools never pay for the disk read and parse
+        self._pdf_loaded = False
+    
+    def _ensure_pdf(self):
+        """Load this form's IRS PDF the first time instructions are needed"""
+        if not self._pdf_loaded:
+            self._pdf_loaded = True
+            # A navigator shared between agents may already have the PDF open
+            if self.pdf_nav.current_pdf_path is None:
+                self._load_form_pdf()
     
     def _load_form_pdf(self):
         """Load IRS instructions PDF for this form"""
@@ -98,6 +149,7 @@ class FormAgent(ABC):
         Returns:
             IRS instructions text
         """
+        self._ensure_pdf()
         try:
             instructions = self.pdf_nav.get_line_instructions(line, self.form_name)
             return instructions if instructions else f"No instructions found for {line}"
@@ -105,23 +157,36 @@ class FormAgent(ABC):
             self.warnings.append(f"Error getting instructions for {line}: {e}")
             return f"Unable to retrieve instructions for {line}"
     
-    def cite(self, line: str, source: str, reasoning: str):
+    def cite(self, line: str, source: str, reasoning: str, *args):
         """
         Record an IRS citation for a decision.
         
         Args:
             line: Form line (e.g., "Line 11")
             source: IRS source (e.g., "Form 1040 Instructions, Page 25")
-            reasoning: Agent's reasoning
+            reasoning: Agent's reasoning, or a str.format template for args
+            *args: Values for the reasoning template, only formatted when
+                citations are enabled
         """
         if self.enable_citations:
-            citation = Citation(
-                form=self.form_name,
-                line=line,
-                source=source,
-                reasoning=reasoning
-            )
-            self.citations.append(citation)
+            if args:
+                reasoning = reasoning.format(*args)
+            self.citations.append(CitationRecord(self.form_name, line, source, reasoning))
+            self._citation_sources[line] = source
+    
+    def clear_citations(self):
+        """Forget the citations recorded for an earlier return"""
+        self.citations.clear()
+        self._citation_sources.clear()
+    
+    def citation_sources(self) -> Dict[str, str]:
+        """
+        Line -> source mapping of recorded citations, for outputs.citations
+        
+        Kept up to date by cite(), so this is a single dict copy rather
+        than a walk over every Citation.
+        """
+        return dict(self._citation_sources)
     
     def add_error(self, message: str):
         """Add an error message"""
@@ -141,10 +206,12 @@ class FormAgent(ABC):
         Returns:
             AgentResponse with outputs, citations, errors
         """
+        # Validated construction on purpose: pydantic-core builds models
+        # faster than the pure-Python model_construct path
         return AgentResponse(
             form_name=self.form_name,
             outputs=outputs,
-            citations=self.citations,
+            citations=[Citation(*record) for record in self.citations],
             errors=self.errors,
             warnings=self.warnings
         )
@@ -166,32 +233,9 @@ class FormAgent(ABC):
         Returns:
             LLM response
         """
-        # Build full prompt with IRS grounding
-        full_prompt = prompt
-        
-        if irs_context:
-            full_prompt = f"""IRS Official Instructions:
-{irs_context}
-
----
-
-{prompt}
-"""
-        
-        default_system = f"""You are a tax preparation agent specialized in IRS Form {self.form_name}.
-
-Your responsibilities:
-1. Follow IRS instructions exactly
-2. Cite sources for non-trivial decisions
-3. Flag any ambiguities or errors
-4. Use deterministic calculations when possible
-5. Be conservative - when in doubt, consult instructions
-
-Respond with clear, step-by-step reasoning."""
-
-        system = system_prompt or default_system
-        
-        return self.llm.generate(full_prompt, system)
+        # IRS context travels as its own block after the system prompt, so
+        # providers can serve the repeated prefix from their prompt cache
+        return self.llm.generate(prompt, system_prompt or self.default_system, context=irs_context)
     
     def calculate_line(
         self,
@@ -214,32 +258,110 @@ Respond with clear, step-by-step reasoning."""
         if use_irs_context:
             irs_context = self.get_irs_instructions(line)
         
-        prompt = f"""{calculation_prompt}
-
-Respond with ONLY the numeric value, no explanation or currency symbols.
-If the value is 0 or not applicable, respond with "0".
-"""
+        key = (line, calculation_prompt, irs_context)
+        if self.llm.cache and key in self._line_values:
+            return self._line_values[key]
         
         try:
-            response = self.generate_with_context(prompt, irs_context)
+            response = self.generate_with_context(_line_prompt(calculation_prompt), irs_context)
             # Extract number from response
             value = self._extract_number(response)
+            if self.llm.cache:
+                self._line_values[key] = value
             return value
         except Exception as e:
             self.add_error(f"Error calculating {line}: {e}")
             return 0.0
     
+    async def acalculate_lines(
+        self,
+        line_prompts: Dict[str, str],
+        use_irs_context: bool = True
+    ) -> Dict[str, float]:
+        """
+        Calculate several form lines with concurrent LLM calls.
+        
+        Same prompts as calculate_line, but all lines go out in one
+        LLMEngine.generate_many call instead of one round-trip at a time.
+        
+        Args:
+            line_prompts: Line identifier -> prompt describing the calculation
+            use_irs_context: Whether to include IRS instructions
+            
+        Returns:
+            Line identifier -> calculated value (0.0 for lines that failed)
+        """
+        prompts = [
+            (
+                _line_prompt(calculation_prompt),
+                self.default_system,
+                self.get_irs_instructions(line) if use_irs_context else None
+            )
+            for line, calculation_prompt in line_prompts.items()
+        ]
+        responses = await self.llm.generate_many(prompts)
+        
+        values = {}
+        for line, response in zip(line_prompts, responses):
+            if isinstance(response, Exception):
+                self.add_error(f"Error calculating {line}: {response}")
+                values[line] = 0.0
+            else:
+                values[line] = self._extract_number(response)
+        return values
+    
+    def calculate_lines_batch(
+        self,
+        line_prompts: List[Tuple[str, str]],
+        use_irs_context: bool = True,
+        **collect_kwargs
+    ) -> List[float]:
+        """
+        Calculate many form lines through the provider's batch API.
+        
+        For runs where latency doesn't matter (benchmark suites, CI
+        re-evaluations): every call, e.g. the lines of many taxpayers, goes
+        into one batch at about half the cost of direct calls. Blocks until
+        the batch finishes.
+        
+        Args:
+            line_prompts: (line identifier, calculation prompt) pairs; a line
+                may appear more than once
+            use_irs_context: Whether to include IRS instructions
+            **collect_kwargs: Polling options for LLMEngine.collect_batch
+            
+        Returns:
+            Calculated values in line_prompts order (0.0 for failed calls)
+        """
+        prompts = [
+            (
+                _line_prompt(calculation_prompt),
+                self.default_system,
+                self.get_irs_instructions(line) if use_irs_context else None
+            )
+            for line, calculation_prompt in line_prompts
+        ]
+        responses = self.llm.collect_batch(self.llm.submit_batch(prompts), **collect_kwargs)
+        
+        values = []
+        for (line, _), response in zip(line_prompts, responses):
+            if isinstance(response, Exception):
+                self.add_error(f"Error calculating {line}: {response}")
+                values.append(0.0)
+            else:
+                values.append(self._extract_number(response))
+        return values
+    
     def _extract_number(self, text: str) -> float:
         """Extract numeric value from text response"""
-        import re
-        
-        # Remove common currency symbols and commas
-        text = text.replace('$', '').replace(',', '').strip()
+        # Remove common currency symbols and commas. Two replace() calls beat
+        # a str.translate deletion table, which looks up every code point.
+        text = text.replace('$', '').replace(',', '')
         
         # Find first number in text
-        match = re.search(r'-?\d+\.?\d*', text)
+        match = _NUMBER_RE.search(text)
         if match:
-            return float(match.group())
+            return float(match[0])
         
         return 0.0
     
@@ -0,0 +1,76 @@
+"""
+JIT helpers - optional Numba acceleration for numeric kernels
+
+Kernels decorated with njit compile to native code when Numba is installed
+and run as ordinary Python functions otherwise, so results never depend on
+whether the accelerator is present.
+
+Kernels are declared with cache=True so compiled code is written next to
+the module and reused by later processes. Run `python -m src.core.jit`
+once after installing to populate that cache ahead of the first return.
+The Streamlit app calls warm_kernels() once at startup unless
+LIGHTTAXES_LAZY_WARMUP is set.
+"""
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:  # optional accelerator - kernels run as plain Python
+    HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the function unchanged"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+def warm_kernels():
+    """Compile every kernel for the argument types the pipeline passes in"""
+    import numpy as np
+    from src.tools.adjustments import (
+        compute_schedule_1, compute_schedule_1_batch,
+        calculate_educator_expense, calculate_student_loan_interest,
+        calculate_excess_business_loss, calculate_educator_expense_batch,
+        calculate_student_loan_interest_batch, calculate_excess_business_loss_batch
+    )
+    from src.agents.form_1040_agent import (
+        _income_lines, _tax_lines, _income_lines_batch, _tax_lines_batch
+    )
+    from src.agents.schedule_se_agent import compute_se_batch
+    from src.tools.tax_table import calculate_tax_batch
+    from src.verifiers.arithmetic_verifier import BATCH_LINES, _check_batch
+    
+    calculate_educator_expense(0.0, False)
+    calculate_student_loan_interest(0.0, 0.0)
+    calculate_excess_business_loss(0.0)
+    compute_schedule_1(0, 0.0, 0.0, 0.0, False, 0.0, False, 0.0, False)
+    
+    floats = np.zeros(1)
+    flags = np.zeros(1, dtype=np.bool_)
+    compute_schedule_1_batch(
+        np.zeros(1, dtype=np.int64), floats, floats,
+        floats, flags, floats, flags, floats, flags
+    )
+    calculate_educator_expense_batch(floats, flags)
+    calculate_student_loan_interest_batch(floats, floats)
+    calculate_excess_business_loss_batch(floats)
+    compute_se_batch(floats)
+    calculate_tax_batch(floats, ["single"])
+    _income_lines(0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+    _tax_lines(0.0, 0, 0.0, 0.0)
+    _income_lines_batch(floats, floats, floats, floats, floats, floats)
+    _tax_lines_batch(floats, np.zeros(1, dtype=np.int64), floats, floats)
+    _check_batch((floats,) * len(BATCH_LINES))
+
+
+if __name__ == "__main__":
+    import time
+    
+    start = time.perf_counter()
+    warm_kernels()
+    if HAS_NUMBA:
+        print(f"Kernels compiled in {time.perf_counter() - start:.2f}s")
+    else:
+        print("Numba not installed; kernels run as plain Python")
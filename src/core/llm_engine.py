@@ -3,17 +3,161 @@ LLM Engine - Unified interface for multiple LLM providers
 Supports OpenAI, Anthropic (Claude), Google (Gemini), and Mock mode
 """
 
+import asyncio
+import hashlib
+import json
 import os
-from typing import Optional, Dict, List, Any
+import time
+import weakref
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, Dict, List, Any, Tuple
 from enum import Enum
+import httpx
 import openai
 import anthropic
 import google.generativeai as genai
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:  # optional accelerator - fall back to stdlib json
+    orjson = None
+
 load_dotenv()
 
 
+# Responses already seen by engines created with cache=True, by cache key.
+# Mirrored to one file per response on disk so re-runs skip the API call.
+_RESPONSES: Dict[str, str] = {}
+
+
+def _response_cache_dir() -> Path:
+    """Directory for cached LLM responses"""
+    return Path(os.getenv(
+        "LIGHTTAXES_CACHE_DIR",
+        os.path.join(os.path.expanduser("~"), ".cache", "lighttaxes")
+    )) / "llm"
+
+
+def _load_response(key: str) -> Optional[str]:
+    """Cached response for key, from memory or disk, or None"""
+    if key not in _RESPONSES:
+        try:
+            _RESPONSES[key] = (_response_cache_dir() / f"{key}.txt").read_text(encoding="utf-8")
+        except OSError:
+            return None
+    return _RESPONSES[key]
+
+
+def _store_response(key: str, response: str):
+    """Remember a response in memory and on disk"""
+    _RESPONSES[key] = response
+    try:
+        directory = _response_cache_dir()
+        directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = directory / f"{key}.{os.getpid()}.tmp"
+        tmp_path.write_text(response, encoding="utf-8")
+        os.replace(tmp_path, directory / f"{key}.txt")
+    except OSError:
+        pass  # read-only home etc. - the in-memory cache still applies
+
+
+# Connection pool for each async SDK client. Clients are made per event loop
+# (see LLMEngine._async_client), so connections are reused within a
+# generate_many burst but not across separate asyncio.run calls
+_ASYNC_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+
+
+def _request_timeout() -> httpx.Timeout:
+    """Per-request timeout, so one stuck call can't stall a whole fan-out"""
+    return httpx.Timeout(float(os.getenv("LLM_TIMEOUT", "120")), connect=5.0)
+
+
+def _json_loads(data: str) -> Any:
+    """json.loads, through orjson when installed (its errors subclass JSONDecodeError)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _with_context(prompt: str, context: Optional[str]) -> str:
+    """Prompt with the IRS context inlined ahead of it, for single-string APIs"""
+    if not context:
+        return prompt
+    return f"""IRS Official Instructions:
+{context}
+
+---
+
+{prompt}
+"""
+
+
+def _openai_messages(
+    prompt: str,
+    system_prompt: Optional[str],
+    context: Optional[str]
+) -> List[Dict[str, str]]:
+    """
+    Chat messages with the invariant parts first
+    
+    OpenAI caches matching prompt prefixes automatically, so the system
+    prompt and IRS context go ahead of the per-line user prompt.
+    """
+    messages = []
+    if system_prompt:
+        messages.append({"role": "system", "content": system_prompt})
+    if context:
+        messages.append({"role": "system", "content": f"IRS Official Instructions:\n{context}"})
+    messages.append({"role": "user", "content": prompt})
+    return messages
+
+
+def _anthropic_system(
+    system_prompt: Optional[str],
+    context: Optional[str]
+) -> List[Dict[str, Any]]:
+    """System blocks for Claude, each marked for prompt caching"""
+    texts = []
+    if system_prompt:
+        texts.append(system_prompt)
+    if context:
+        texts.append(f"IRS Official Instructions:\n{context}")
+    return [
+        {"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}
+        for text in texts
+    ]
+
+
+def _call_parts(call: Tuple[Optional[str], ...]) -> Tuple[str, Optional[str], Optional[str]]:
+    """(prompt, system_prompt, context) from a 2- or 3-tuple batch item"""
+    prompt, system_prompt, *rest = call
+    return prompt, system_prompt, rest[0] if rest else None
+
+
+def _anthropic_params(
+    model: str,
+    prompt: str,
+    system_prompt: Optional[str],
+    temperature: float,
+    max_tokens: int,
+    context: Optional[str]
+) -> Dict[str, Any]:
+    """Messages API parameters, shared by direct and batch requests"""
+    params = {
+        "model": model,
+        "max_tokens": max_tokens,
+        "temperature": temperature,
+        "messages": [{"role": "user", "content": prompt}]
+    }
+    
+    system_blocks = _anthropic_system(system_prompt, context)
+    if system_blocks:
+        params["system"] = system_blocks
+    return params
+
+
 class LLMProvider(str, Enum):
     OPENAI = "openai"
     ANTHROPIC = "anthropic"
@@ -29,8 +173,19 @@ class LLMEngine:
         provider: Optional[str] = None,
         model: Optional[str] = None,
         temperature: float = 0.1,
-        max_tokens: int = 4096
+        max_tokens: int = 4096,
+        cache: bool = False
     ):
+        """
+        Args:
+            provider: "openai", "anthropic", "google" or "mock"
+                (default: DEFAULT_LLM)
+            model: Model name (default: the provider's *_MODEL setting)
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens per response
+            cache: Reuse responses for identical requests, in this process
+                and across runs (stored under ~/.cache/lighttaxes/llm)
+        """
         self.provider = provider or os.getenv("DEFAULT_LLM", "openai")
         self.temperature = temperature or float(os.getenv("LLM_TEMPERATURE", "0.1"))
         self.max_tokens = max_tokens or int(os.getenv("LLM_MAX_TOKENS", "4096"))
@@ -49,6 +204,7 @@ class LLMEngine:
         else:
             raise ValueError(f"Unknown provider: {self.provider}")
         
+        self.cache = cache
         self._initialize_client()
     
     def _initialize_client(self):
@@ -57,13 +213,15 @@ class LLMEngine:
             api_key = os.getenv("OPENAI_API_KEY")
             if not api_key:
                 raise ValueError("OPENAI_API_KEY not found in environment")
-            self.client = openai.OpenAI(api_key=api_key)
+            self._api_key = api_key
+            self.client = openai.OpenAI(api_key=api_key, timeout=_request_timeout())
             
         elif self.provider == "anthropic":
             api_key = os.getenv("ANTHROPIC_API_KEY")
             if not api_key:
                 raise ValueError("ANTHROPIC_API_KEY not found in environment")
-            self.client = anthropic.Anthropic(api_key=api_key)
+            self._api_key = api_key
+            self.client = anthropic.Anthropic(api_key=api_key, timeout=_request_timeout())
             
         elif self.provider == "google":
             api_key = os.getenv("GOOGLE_API_KEY")
@@ -73,18 +231,43 @@ class LLMEngine:
             self.client = genai.GenerativeModel(self.model)
             
         elif self.provider == "mock":
-            # No client needed for mock
+            # No client needed for mock; batches complete on submission
             self.client = None
+            self._mock_batches: Dict[str, List[str]] = {}
             
         else:
             raise ValueError(f"Unknown provider: {self.provider}")
+        
+        # Async SDK clients by event loop, created on first use in each loop
+        self._aclients = weakref.WeakKeyDictionary()
+    
+    def _async_client(self):
+        """
+        Async SDK client for the running event loop
+        
+        An httpx AsyncClient's pooled connections belong to the loop that
+        opened them, and every asyncio.run() starts a new loop, so one
+        client per engine would fail ("Event loop is closed") from the
+        second run on. Each loop gets its own client instead.
+        """
+        loop = asyncio.get_running_loop()
+        aclient = self._aclients.get(loop)
+        if aclient is None:
+            http_client = httpx.AsyncClient(limits=_ASYNC_LIMITS, timeout=_request_timeout())
+            if self.provider == "openai":
+                aclient = openai.AsyncOpenAI(api_key=self._api_key, http_client=http_client)
+            else:
+                aclient = anthropic.AsyncAnthropic(api_key=self._api_key, http_client=http_client)
+            self._aclients[loop] = aclient
+        return aclient
     
     def generate(
         self, 
         prompt: str, 
         system_prompt: Optional[str] = None,
         temperature: Optional[float] = None,
-        max_tokens: Optional[int] = None
+        max_tokens: Optional[int] = None,
+        context: Optional[str] = None
     ) -> str:
         """
         Generate completion from LLM
@@ -94,6 +277,8 @@ class LLMEngine:
             system_prompt: System instructions
             temperature: Override default temperature
             max_tokens: Override default max tokens
+            context: Reference text shared by many calls (e.g. IRS
+                instructions), sent as a cacheable prefix block
             
         Returns:
             Generated text response
@@ -101,37 +286,297 @@ class LLMEngine:
         temp = temperature if temperature is not None else self.temperature
         tokens = max_tokens if max_tokens is not None else self.max_tokens
         
+        if self.cache:
+            key = self._cache_key(prompt, system_prompt, temp, tokens, context)
+            cached = _load_response(key)
+            if cached is not None:
+                return cached
+        
         if self.provider == "openai":
-            return self._generate_openai(prompt, system_prompt, temp, tokens)
+            response = self._generate_openai(prompt, system_prompt, temp, tokens, context)
         elif self.provider == "anthropic":
-            return self._generate_anthropic(prompt, system_prompt, temp, tokens)
+            response = self._generate_anthropic(prompt, system_prompt, temp, tokens, context)
         elif self.provider == "google":
-            return self._generate_google(prompt, system_prompt, temp, tokens)
+            response = self._generate_google(prompt, system_prompt, temp, tokens, context)
         elif self.provider == "mock":
-            return self._generate_mock(prompt, system_prompt, temp, tokens)
+            response = self._generate_mock(prompt, system_prompt, temp, tokens, context)
         else:
             raise ValueError(f"Unknown provider: {self.provider}")
+        
+        if self.cache:
+            _store_response(key, response)
+        return response
+    
+    async def agenerate(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        context: Optional[str] = None
+    ) -> str:
+        """
+        Async version of generate, for running many calls concurrently
+        
+        Args:
+            prompt: User prompt
+            system_prompt: System instructions
+            temperature: Override default temperature
+            max_tokens: Override default max tokens
+            context: Reference text shared by many calls (e.g. IRS
+                instructions), sent as a cacheable prefix block
+            
+        Returns:
+            Generated text response
+        """
+        temp = temperature if temperature is not None else self.temperature
+        tokens = max_tokens if max_tokens is not None else self.max_tokens
+        
+        if self.cache:
+            key = self._cache_key(prompt, system_prompt, temp, tokens, context)
+            cached = _load_response(key)
+            if cached is not None:
+                return cached
+        
+        if self.provider == "openai":
+            response = await self._agenerate_openai(prompt, system_prompt, temp, tokens, context)
+        elif self.provider == "anthropic":
+            response = await self._agenerate_anthropic(prompt, system_prompt, temp, tokens, context)
+        elif self.provider == "google":
+            response = await self._agenerate_google(prompt, system_prompt, temp, tokens, context)
+        elif self.provider == "mock":
+            response = self._generate_mock(prompt, system_prompt, temp, tokens, context)
+        else:
+            raise ValueError(f"Unknown provider: {self.provider}")
+        
+        if self.cache:
+            _store_response(key, response)
+        return response
+    
+    def _cache_key(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        temperature: float,
+        max_tokens: int,
+        context: Optional[str]
+    ) -> str:
+        """SHA-256 over everything that determines a response"""
+        digest = hashlib.sha256()
+        for part in (self.provider, self.model, temperature, max_tokens,
+                     system_prompt, context, prompt):
+            # Length-prefixed so adjacent fields can't run together
+            text = "" if part is None else str(part)
+            digest.update(f"{len(text)}:{text}".encode())
+        return digest.hexdigest()
+    
+    async def generate_many(
+        self,
+        prompts: List[Tuple[Optional[str], ...]],
+        max_concurrency: int = 16
+    ) -> List[Any]:
+        """
+        Run many (prompt, system_prompt[, context]) calls concurrently
+        
+        Calls overlap up to max_concurrency at a time, so N calls take
+        roughly the slowest call's latency instead of the sum of all of them.
+        
+        Args:
+            prompts: (prompt, system_prompt) or (prompt, system_prompt, context)
+                tuples
+            max_concurrency: Maximum number of requests in flight
+            
+        Returns:
+            Responses in the same order as prompts; a call that failed
+            yields its exception instead of a string
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def bounded(
+            prompt: str,
+            system_prompt: Optional[str],
+            context: Optional[str] = None
+        ) -> str:
+            async with semaphore:
+                return await self.agenerate(prompt, system_prompt, context=context)
+        
+        return await asyncio.gather(
+            *(bounded(*call) for call in prompts),
+            return_exceptions=True
+        )
+    
+    def submit_batch(self, prompts: List[Tuple[Optional[str], ...]]) -> str:
+        """
+        Queue many (prompt, system_prompt[, context]) calls on the provider's
+        batch API, which costs about half as much as direct calls but may
+        take up to 24 hours.
+        
+        Args:
+            prompts: (prompt, system_prompt) or (prompt, system_prompt, context)
+                tuples
+            
+        Returns:
+            Batch ID to pass to collect_batch
+        """
+        if self.provider == "openai":
+            lines = []
+            for i, call in enumerate(prompts):
+                prompt, system_prompt, context = _call_parts(call)
+                lines.append(json.dumps({
+                    "custom_id": str(i),
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": self.model,
+                        "messages": _openai_messages(prompt, system_prompt, context),
+                        "temperature": self.temperature,
+                        "max_tokens": self.max_tokens
+                    }
+                }))
+            batch_file = self.client.files.create(
+                file=("batch.jsonl", "\n".join(lines).encode("utf-8")),
+                purpose="batch"
+            )
+            batch = self.client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
+            )
+            return batch.id
+        elif self.provider == "anthropic":
+            requests = []
+            for i, call in enumerate(prompts):
+                prompt, system_prompt, context = _call_parts(call)
+                requests.append({
+                    "custom_id": str(i),
+                    "params": _anthropic_params(
+                        self.model, prompt, system_prompt,
+                        self.temperature, self.max_tokens, context
+                    )
+                })
+            return self.client.messages.batches.create(requests=requests).id
+        elif self.provider == "mock":
+            batch_id = f"mock-batch-{len(self._mock_batches)}"
+            self._mock_batches[batch_id] = [
+                self.generate(prompt, system_prompt, context=context)
+                for prompt, system_prompt, context in map(_call_parts, prompts)
+            ]
+            return batch_id
+        else:
+            raise ValueError(f"Batch API not supported for provider: {self.provider}")
+    
+    def collect_batch(
+        self,
+        batch_id: str,
+        poll_interval: float = 10.0,
+        max_poll_interval: float = 300.0,
+        timeout: Optional[float] = None
+    ) -> List[Any]:
+        """
+        Wait for a submitted batch and return its responses.
+        
+        Polls with exponential backoff from poll_interval up to
+        max_poll_interval.
+        
+        Args:
+            batch_id: ID returned by submit_batch
+            poll_interval: Seconds before the first status check
+            max_poll_interval: Longest wait between status checks
+            timeout: Give up with TimeoutError after this many seconds
+            
+        Returns:
+            Responses in submission order; a request that failed yields
+            an exception instead of a string
+        """
+        if self.provider == "mock":
+            return list(self._mock_batches.pop(batch_id))
+        
+        deadline = None if timeout is None else time.monotonic() + timeout
+        delay = poll_interval
+        while True:
+            if self.provider == "openai":
+                batch = self.client.batches.retrieve(batch_id)
+                done = batch.status in ("completed", "failed", "expired", "cancelled")
+            elif self.provider == "anthropic":
+                batch = self.client.messages.batches.retrieve(batch_id)
+                done = batch.processing_status == "ended"
+            else:
+                raise ValueError(f"Batch API not supported for provider: {self.provider}")
+            
+            if done:
+                break
+            if deadline is not None and time.monotonic() + delay > deadline:
+                raise TimeoutError(f"Batch {batch_id} not finished after {timeout}s")
+            time.sleep(delay)
+            delay = min(delay * 2, max_poll_interval)
+        
+        if self.provider == "openai":
+            return self._openai_batch_results(batch)
+        return self._anthropic_batch_results(batch)
+    
+    def _openai_batch_results(self, batch: Any) -> List[Any]:
+        """Responses from a finished OpenAI batch, in custom_id order"""
+        results: List[Any] = [
+            RuntimeError(f"No result for request in batch {batch.id} ({batch.status})")
+        ] * batch.request_counts.total
+        
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            for line in self.client.files.content(file_id).text.splitlines():
+                if not line:
+                    continue
+                record = _json_loads(line)
+                response = record.get("response") or {}
+                if record.get("error") or response.get("status_code") != 200:
+                    results[int(record["custom_id"])] = RuntimeError(
+                        record.get("error") or response.get("body")
+                    )
+                else:
+                    body = response["body"]
+                    results[int(record["custom_id"])] = body["choices"][0]["message"]["content"]
+        return results
+    
+    def _anthropic_batch_results(self, batch: Any) -> List[Any]:
+        """Responses from a finished Anthropic message batch, in custom_id order"""
+        counts = batch.request_counts
+        total = (counts.processing + counts.succeeded + counts.errored
+                 + counts.canceled + counts.expired)
+        results: List[Any] = [
+            RuntimeError(f"No result for request in batch {batch.id}")
+        ] * total
+        
+        for entry in self.client.messages.batches.results(batch.id):
+            if entry.result.type == "succeeded":
+                results[int(entry.custom_id)] = entry.result.message.content[0].text
+            else:
+                results[int(entry.custom_id)] = RuntimeError(
+                    f"Batch request {entry.result.type}: {getattr(entry.result, 'error', None)}"
+                )
+        return results
     
     def _generate_openai(
         self, 
         prompt: str, 
         system_prompt: Optional[str], 
         temperature: float, 
-        max_tokens: int
+        max_tokens: int,
+        context: Optional[str] = None,
+        response_format: Optional[Dict[str, str]] = None
     ) -> str:
         """Generate using OpenAI API"""
-        messages = []
-        
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
+        messages = _openai_messages(prompt, system_prompt, context)
         
-        messages.append({"role": "user", "content": prompt})
+        kwargs = {}
+        if response_format:
+            kwargs["response_format"] = response_format
         
         response = self.client.chat.completions.create(
             model=self.model,
             messages=messages,
             temperature=temperature,
-            max_tokens=max_tokens
+            max_tokens=max_tokens,
+            **kwargs
         )
         
         return response.choices[0].message.content
@@ -141,20 +586,13 @@ class LLMEngine:
         prompt: str, 
         system_prompt: Optional[str], 
         temperature: float, 
-        max_tokens: int
+        max_tokens: int,
+        context: Optional[str] = None
     ) -> str:
         """Generate using Anthropic Claude API"""
-        kwargs = {
-            "model": self.model,
-            "max_tokens": max_tokens,
-            "temperature": temperature,
-            "messages": [{"role": "user", "content": prompt}]
-        }
-        
-        if system_prompt:
-            kwargs["system"] = system_prompt
-        
-        response = self.client.messages.create(**kwargs)
+        response = self.client.messages.create(**_anthropic_params(
+            self.model, prompt, system_prompt, temperature, max_tokens, context
+        ))
         
         return response.content[0].text
     
@@ -163,13 +601,14 @@ class LLMEngine:
         prompt: str, 
         system_prompt: Optional[str], 
         temperature: float, 
-        max_tokens: int
+        max_tokens: int,
+        context: Optional[str] = None
     ) -> str:
         """Generate using Google Gemini API"""
-        # Combine system prompt and user prompt for Gemini
-        full_prompt = prompt
+        # Combine system prompt, IRS context and user prompt for Gemini
+        full_prompt = _with_context(prompt, context)
         if system_prompt:
-            full_prompt = f"{system_prompt}\n\n{prompt}"
+            full_prompt = f"{system_prompt}\n\n{full_prompt}"
         
         generation_config = genai.types.GenerationConfig(
             temperature=temperature,
@@ -183,15 +622,70 @@ class LLMEngine:
         
         return response.text
     
+    async def _agenerate_openai(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        temperature: float,
+        max_tokens: int,
+        context: Optional[str] = None
+    ) -> str:
+        """Generate using the async OpenAI client"""
+        messages = _openai_messages(prompt, system_prompt, context)
+        
+        response = await self._async_client().chat.completions.create(
+            model=self.model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens
+        )
+        
+        return response.choices[0].message.content
+    
+    async def _agenerate_anthropic(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        temperature: float,
+        max_tokens: int,
+        context: Optional[str] = None
+    ) -> str:
+        """Generate using the async Anthropic client"""
+        response = await self._async_client().messages.create(**_anthropic_params(
+            self.model, prompt, system_prompt, temperature, max_tokens, context
+        ))
+        
+        return response.content[0].text
+    
+    async def _agenerate_google(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        temperature: float,
+        max_tokens: int,
+        context: Optional[str] = None
+    ) -> str:
+        """
+        Generate with the sync Gemini client on a worker thread
+        
+        generate_content_async goes through a gRPC client that the SDK
+        caches process-wide and binds to the first event loop, so it can't
+        be shared across asyncio.run calls the way _async_client's are.
+        """
+        return await asyncio.to_thread(
+            self._generate_google, prompt, system_prompt, temperature, max_tokens, context
+        )
+    
     def _generate_mock(
         self, 
         prompt: str, 
         system_prompt: Optional[str], 
         temperature: float, 
-        max_tokens: int
+        max_tokens: int,
+        context: Optional[str] = None
     ) -> str:
         """Generate simulated responses for testing/demo purposes"""
-        prompt_lower = prompt.lower()
+        prompt_lower = _with_context(prompt, context).lower()
         
         # Return generic low number to be safe, or specific if detected
         if "wages" in prompt_lower or "line 1z" in prompt_lower:
@@ -223,32 +717,91 @@ class LLMEngine:
         system_prompt: Optional[str] = None,
         schema: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
-        """Generate structured JSON output"""
-        import json
+        """
+        Generate structured JSON output
         
+        Uses the provider's native structured output where it has one:
+        JSON mode for OpenAI, and a forced tool call for Claude (constrained
+        to schema when given). The reply then parses directly, with no
+        markdown to strip.
+        
+        Args:
+            prompt: User prompt
+            system_prompt: System instructions
+            schema: JSON schema for the result (used by Claude's tool call)
+            
+        Returns:
+            Parsed JSON object
+        """
         if self.provider == "mock":
             # Return dummy JSON for mock mode
             return {"status": "success", "mock_data": True}
         
-        # Add JSON instruction to prompt
+        if self.provider == "anthropic":
+            return self._generate_anthropic_json(prompt, system_prompt, schema)
+        
+        # Add JSON instruction to prompt (OpenAI's JSON mode also requires it)
         json_prompt = f"""{prompt}
 
 Please respond with valid JSON only. No additional text or markdown.
 """
         
-        response = self.generate(json_prompt, system_prompt)
+        if self.provider == "openai":
+            response = self._generate_openai(
+                json_prompt, system_prompt, self.temperature, self.max_tokens,
+                response_format={"type": "json_object"}
+            )
+        else:
+            # No JSON mode in the pinned Gemini SDK; unwrap a code fence if
+            # the model added one anyway
+            response = self.generate(json_prompt, system_prompt).strip()
+            if response.startswith("```"):
+                response = response.split("\n", 1)[-1].rsplit("```", 1)[0].strip()
         
-        # Try to extract JSON from response
         try:
-            # Remove markdown code blocks if present
-            if "```json" in response:
-                response = response.split("```json")[1].split("```")[0].strip()
-            elif "```" in response:
-                response = response.split("```")[1].split("```")[0].strip()
-            
-            return json.loads(response)
+            return _json_loads(response)
         except json.JSONDecodeError as e:
             raise ValueError(f"Failed to parse JSON from LLM response: {e}\n\nResponse: {response}")
+    
+    def _generate_anthropic_json(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        schema: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Structured output from Claude as the input of a forced tool call"""
+        response = self.client.messages.create(
+            **_anthropic_params(
+                self.model, prompt, system_prompt, self.temperature, self.max_tokens, None
+            ),
+            tools=[{
+                "name": "record_result",
+                "description": "Record the structured result of the request.",
+                "input_schema": schema or {"type": "object"}
+            }],
+            tool_choice={"type": "tool", "name": "record_result"}
+        )
+        
+        for block in response.content:
+            if block.type == "tool_use":
+                return block.input
+        raise ValueError("Claude response contained no structured output")
+
+
+@lru_cache(maxsize=8)
+def _get_default_engine(
+    provider: str,
+    model: Optional[str] = None,
+    temperature: float = 0.1,
+    max_tokens: int = 4096
+) -> LLMEngine:
+    """One engine per configuration, so agents share clients and their pools"""
+    return LLMEngine(provider=provider, model=model, temperature=temperature, max_tokens=max_tokens)
+
+
+def default_engine() -> LLMEngine:
+    """Shared LLMEngine for the current DEFAULT_LLM provider"""
+    return _get_default_engine(os.getenv("DEFAULT_LLM", "openai"))
 
 
 # Convenience function for quick usage
@@ -3,10 +3,18 @@ Type definitions for the tax agent system.
 Defines typed inputs/outputs for all forms following codebase-style architecture.
 """
 
-from typing import Dict, List, Optional, Any, Literal
-from pydantic import BaseModel, Field
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Any, Literal, Tuple
+from pydantic import BaseModel, ConfigDict, Field
 from enum import Enum
 
+import numpy as np
+
+
+# Parsed input records are immutable once built, so they can be shared safely
+_FROZEN = ConfigDict(frozen=True)
+
 
 class FilingStatus(str, Enum):
     """IRS Filing Status"""
@@ -17,30 +25,53 @@ class FilingStatus(str, Enum):
     QUALIFYING_WIDOW = "qualifying_widow"
 
 
-class W2(BaseModel):
+@lru_cache(maxsize=16)
+def normalize_filing_status(filing_status: str) -> str:
+    """Canonical status key, e.g. "Head of Household" -> "head_of_household" """
+    return filing_status.lower().replace(" ", "_")
+
+
+# Small source-document records are frozen slotted dataclasses. Pydantic
+# validates them when a model is built from raw dicts; constructing one
+# directly skips validation and coercion.
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class W2:
     """W-2 Wage and Tax Statement"""
     employer: Optional[str] = None
-    wages: float = Field(..., description="Box 1 - Wages, tips, other compensation")
-    federal_withholding: float = Field(0.0, description="Box 2 - Federal income tax withheld")
+    wages: float  # Box 1 - Wages, tips, other compensation
+    federal_withholding: float = 0.0  # Box 2 - Federal income tax withheld
     social_security_wages: Optional[float] = None
     medicare_wages: Optional[float] = None
     
     
-class Form1099INT(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Form1099INT:
     """1099-INT Interest Income"""
     payer: Optional[str] = None
-    interest_income: float = Field(..., description="Box 1 - Interest income")
+    interest_income: float  # Box 1 - Interest income
     
 
-class Form1099DIV(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Form1099DIV:
     """1099-DIV Dividend Income"""
     payer: Optional[str] = None
-    ordinary_dividends: float = Field(0.0, description="Box 1a - Ordinary dividends")
-    qualified_dividends: float = Field(0.0, description="Box 1b - Qualified dividends")
+    ordinary_dividends: float = 0.0  # Box 1a - Ordinary dividends
+    qualified_dividends: float = 0.0  # Box 1b - Qualified dividends
+
+
+# Schedule C Part II expense fields, in BusinessIncome.to_vector() order
+EXPENSE_FIELDS = (
+    "advertising", "car_truck_expenses", "commissions_fees", "contract_labor",
+    "depreciation", "insurance", "interest", "legal_professional",
+    "office_expense", "rent_lease", "repairs_maintenance", "supplies",
+    "taxes_licenses", "travel", "meals", "utilities", "wages",
+)
 
 
 class BusinessIncome(BaseModel):
     """Schedule C - Business Income"""
+    model_config = _FROZEN
     business_name: Optional[str] = None
     gross_receipts: float = 0.0
     returns_allowances: float = 0.0
@@ -64,9 +95,18 @@ class BusinessIncome(BaseModel):
     utilities: float = 0.0
     wages: float = 0.0
     other_expenses: Dict[str, float] = Field(default_factory=dict)
+    
+    def to_vector(self) -> np.ndarray:
+        """Part II expenses as a float64 array in EXPENSE_FIELDS order"""
+        return np.fromiter(
+            (getattr(self, name) for name in EXPENSE_FIELDS),
+            dtype=np.float64,
+            count=len(EXPENSE_FIELDS)
+        )
 
 
-class Dependent(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Dependent:
     """Dependent information"""
     name: str
     ssn: str
@@ -77,6 +117,7 @@ class Dependent(BaseModel):
 
 class TaxpayerInfo(BaseModel):
     """Taxpayer personal information"""
+    model_config = _FROZEN
     name: str
     ssn: str
     dob: Optional[str] = None
@@ -89,6 +130,12 @@ class TaxpayerInfo(BaseModel):
     spouse_age: Optional[int] = None
     spouse_blind: bool = False
     spouse_eligible_educator: bool = False  # Added for Schedule 1 adjustments
+    w2: List[W2] = Field(default_factory=list)  # For callers building Form1040Inputs directly
+    
+    @property
+    def w2_withholding(self) -> float:
+        """Total federal income tax withheld across the taxpayer's W-2s"""
+        return float(sum(w2.federal_withholding for w2 in self.w2))
 
 
 # ============================================================================
@@ -97,6 +144,7 @@ class TaxpayerInfo(BaseModel):
 
 class TaxInputs(BaseModel):
     """Main input data structure - maps to input.json from TaxCalcBench"""
+    model_config = _FROZEN
     filing_status: FilingStatus
     taxpayer: TaxpayerInfo
     dependents: List[Dependent] = Field(default_factory=list)
@@ -111,24 +159,28 @@ class TaxInputs(BaseModel):
 
 class ScheduleBInputs(BaseModel):
     """Schedule B - Interest and Ordinary Dividends"""
+    model_config = _FROZEN
     interest_income: List[Form1099INT] = Field(default_factory=list)
     dividend_income: List[Form1099DIV] = Field(default_factory=list)
 
 
 class ScheduleCInputs(BaseModel):
     """Schedule C - Profit or Loss from Business"""
+    model_config = _FROZEN
     business: BusinessIncome
     filing_status: FilingStatus
 
 
 class ScheduleSEInputs(BaseModel):
     """Schedule SE - Self-Employment Tax"""
+    model_config = _FROZEN
     net_profit_loss: float  # From Schedule C
     filing_status: FilingStatus
 
 
 class Schedule1Inputs(BaseModel):
     """Schedule 1 - Additional Income and Adjustments to Income"""
+    model_config = _FROZEN
     taxable_refunds: float = 0.0
     alimony_received: float = 0.0
     business_income: float = 0.0  # From Schedule C
@@ -146,6 +198,7 @@ class Schedule1Inputs(BaseModel):
 
 class Form1040Inputs(BaseModel):
     """Form 1040 - U.S. Individual Income Tax Return"""
+    model_config = _FROZEN
     filing_status: FilingStatus
     taxpayer: TaxpayerInfo
     dependents: List[Dependent] = Field(default_factory=list)
@@ -157,10 +210,24 @@ class Form1040Inputs(BaseModel):
     schedule_1_additional_income: float = 0.0  # Line 8
     # Adjustments from Schedule 1
     schedule_1_adjustments: float = 0.0  # Line 10
+    # Other taxes (Schedule 2, e.g. self-employment tax)
+    other_taxes: float = 0.0  # Line 23
+    # Payments
+    withholding: Optional[float] = None  # Line 25a (from W-2 Box 2); None = taxpayer's W-2s
+    
+    @property
+    def qualifying_child_mask(self) -> np.ndarray:
+        """Boolean array flagging which dependents are qualifying children"""
+        return np.fromiter(
+            (d.qualifying_child for d in self.dependents),
+            dtype=np.bool_,
+            count=len(self.dependents)
+        )
 
 
 class Schedule8812Inputs(BaseModel):
     """Schedule 8812 - Child Tax Credit"""
+    model_config = _FROZEN
     dependents: List[Dependent]
     agi: float
     tax_before_credits: float
@@ -232,6 +299,14 @@ class Form1040Outputs(BaseModel):
     line_37: float = 0.0  # Amount you owe
     
     citations: Dict[str, str] = Field(default_factory=dict)
+    
+    def as_cents(self) -> np.ndarray:
+        """Line values in field order as int64 whole cents"""
+        values = [getattr(self, name) for name in _FORM_1040_LINES]
+        return np.rint(np.array(values, dtype=np.float64) * 100).astype(np.int64)
+
+
+_FORM_1040_LINES = tuple(name for name in Form1040Outputs.model_fields if name.startswith("line_"))
 
 
 class Schedule8812Outputs(BaseModel):
@@ -245,7 +320,8 @@ class Schedule8812Outputs(BaseModel):
 # VERIFICATION TYPES
 # ============================================================================
 
-class VerificationError(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class VerificationError:
     """Error found by a verifier"""
     form: str
     line: str
@@ -257,18 +333,21 @@ class VerificationError(BaseModel):
 
 
 class VerificationResult(BaseModel):
-    """Result from a verifier"""
+    """Result from a verifier (frozen, with tuple fields, so verifiers can hand out cached results)"""
+    model_config = _FROZEN
+    
     verifier_name: str
     passed: bool
-    errors: List[VerificationError] = Field(default_factory=list)
-    warnings: List[str] = Field(default_factory=list)
+    errors: Tuple[VerificationError, ...] = ()
+    warnings: Tuple[str, ...] = ()
 
 
 # ============================================================================
 # AGENT TYPES
 # ============================================================================
 
-class Citation(BaseModel):
+@dataclass(frozen=True, slots=True)
+class Citation:
     """IRS citation for a decision"""
     form: str
     line: str
@@ -276,6 +355,19 @@ class Citation(BaseModel):
     reasoning: str
 
 
+class CitationRecord(NamedTuple):
+    """
+    Lightweight citation as recorded by FormAgent.cite
+    
+    Same fields as Citation as a plain tuple, so appends stay cheap;
+    converted to Citation records only when an AgentResponse is built.
+    """
+    form: str
+    line: str
+    source: str
+    reasoning: str
+
+
 class AgentResponse(BaseModel):
     """Response from any form agent"""
     form_name: str
@@ -283,3 +375,13 @@ class AgentResponse(BaseModel):
     citations: List[Citation] = Field(default_factory=list)
     errors: List[str] = Field(default_factory=list)
     warnings: List[str] = Field(default_factory=list)
+
+
+def dump(model: BaseModel) -> bytes:
+    """
+    Serialize a model to JSON bytes.
+    
+    Calls pydantic-core's serializer directly: faster than orjson over
+    model_dump(), and skips the bytes -> str step of model_dump_json().
+    """
+    return model.__pydantic_serializer__.to_json(model)
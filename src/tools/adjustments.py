@@ -6,8 +6,68 @@ Includes:
 - Excess Business Loss (Form 461) handling
 """
 
-from typing import Union
+from typing import Optional, Sequence, Union
+
+import numpy as np
+
 from src.core.types import FilingStatus
+from src.core.jit import njit, prange
+
+
+def _is_mfj(filing_status: Union[FilingStatus, str]) -> bool:
+    """Filing status check shared by the MFJ-specific limits below"""
+    # FilingStatus is a str enum, so this matches the member and its raw
+    # value alike without building a new string
+    return filing_status == FilingStatus.MARRIED_FILING_JOINTLY
+
+
+def _mfj_mask(filing_statuses: Optional[Sequence[Union[FilingStatus, str]]], n: int) -> np.ndarray:
+    """_is_mfj over many returns as a bool array (all False when None)"""
+    if filing_statuses is None:
+        return np.zeros(n, dtype=np.bool_)
+    return np.fromiter((_is_mfj(s) for s in filing_statuses), dtype=np.bool_, count=n)
+
+
+@njit(cache=True)
+def _educator_expense(amount_paid, is_eligible, spouse_amount_paid, spouse_eligible, is_mfj):
+    limit_per_person = 300.0
+    deduction = 0.0
+    
+    if is_eligible:
+        deduction += min(amount_paid, limit_per_person)
+        
+    if is_mfj and spouse_eligible:
+        deduction += min(spouse_amount_paid, limit_per_person)
+        
+    return deduction
+
+
+@njit(cache=True)
+def _student_loan_interest(interest_paid, magi, is_mfj):
+    max_deduction = 2500.0
+    deduction = min(interest_paid, max_deduction)
+    
+    if is_mfj:
+        start_phase = 165000.0
+        end_phase = 195000.0
+    else:
+        start_phase = 80000.0
+        end_phase = 95000.0
+    
+    # Phase-out ratio clamped to [0, 1] rather than branching on the range:
+    # 0 below start_phase (full deduction), 1 at or above end_phase (none)
+    phase_range = end_phase - start_phase
+    reduction_ratio = max(0.0, min(1.0, (magi - start_phase) / phase_range))
+    reduction = deduction * reduction_ratio
+    return round(deduction - reduction, 2)
+
+
+@njit(cache=True)
+def _excess_business_loss(net_business_loss, is_mfj):
+    # net_business_loss is positive if it's a loss (e.g. 400000); a profit,
+    # like any loss up to the threshold, has no excess
+    threshold = 610000.0 if is_mfj else 305000.0
+    return max(0.0, net_business_loss - threshold)
 
 
 def calculate_educator_expense(
@@ -21,16 +81,11 @@ def calculate_educator_expense(
     Calculate deductible educator expenses for 2024.
     Max $300 per eligible person.
     """
-    limit_per_person = 300.0
-    deduction = 0.0
-    
-    if is_eligible:
-        deduction += min(amount_paid, limit_per_person)
-        
-    if str(filing_status) == FilingStatus.MARRIED_FILING_JOINTLY and spouse_eligible:
-        deduction += min(spouse_amount_paid, limit_per_person)
-        
-    return deduction
+    return _educator_expense(
+        float(amount_paid), bool(is_eligible),
+        float(spouse_amount_paid), bool(spouse_eligible),
+        _is_mfj(filing_status)
+    )
 
 
 def calculate_student_loan_interest(
@@ -46,29 +101,7 @@ def calculate_student_loan_interest(
     - Single/HOH/Widow: $80,000 - $95,000
     - MFJ: $165,000 - $195,000
     """
-    max_deduction = 2500.0
-    deduction = min(interest_paid, max_deduction)
-    
-    status = str(filing_status)
-    
-    if status == FilingStatus.MARRIED_FILING_JOINTLY:
-        start_phase = 165000.0
-        end_phase = 195000.0
-    else:
-        start_phase = 80000.0
-        end_phase = 95000.0
-        
-    if magi <= start_phase:
-        return deduction
-    elif magi >= end_phase:
-        return 0.0
-    else:
-        # Phase-out calculation
-        phase_range = end_phase - start_phase
-        excess_magi = magi - start_phase
-        reduction_ratio = excess_magi / phase_range
-        reduction = deduction * reduction_ratio
-        return round(deduction - reduction, 2)
+    return _student_loan_interest(float(interest_paid), float(magi), _is_mfj(filing_status))
 
 
 def calculate_excess_business_loss(
@@ -84,21 +117,166 @@ def calculate_excess_business_loss(
     - Single/HOH: $305,000
     - MFJ: $610,000
     """
-    # net_business_loss is positive if it's a loss (e.g. 400000)
-    # If it's a profit, return 0
-    if net_business_loss <= 0:
-        return 0.0
-        
-    status = str(filing_status)
-    if status == FilingStatus.MARRIED_FILING_JOINTLY:
-        threshold = 610000.0
-    else:
-        threshold = 305000.0
-        
-    if net_business_loss > threshold:
-        return net_business_loss - threshold
+    return _excess_business_loss(float(net_business_loss), _is_mfj(filing_status))
+
+
+@njit(cache=True, parallel=True)
+def _educator_expense_batch(amount_paid, is_eligible, spouse_amount_paid, spouse_eligible, is_mfj):
+    n = amount_paid.shape[0]
+    deduction = np.empty(n)
+    for i in prange(n):
+        deduction[i] = _educator_expense(
+            amount_paid[i], is_eligible[i],
+            spouse_amount_paid[i], spouse_eligible[i], is_mfj[i]
+        )
+    return deduction
+
+
+@njit(cache=True, parallel=True)
+def _student_loan_interest_batch(interest_paid, magi, is_mfj):
+    n = interest_paid.shape[0]
+    deduction = np.empty(n)
+    for i in prange(n):
+        deduction[i] = _student_loan_interest(interest_paid[i], magi[i], is_mfj[i])
+    return deduction
+
+
+@njit(cache=True, parallel=True)
+def _excess_business_loss_batch(net_business_loss, is_mfj):
+    n = net_business_loss.shape[0]
+    excess = np.empty(n)
+    for i in prange(n):
+        excess[i] = _excess_business_loss(net_business_loss[i], is_mfj[i])
+    return excess
+
+
+def calculate_educator_expense_batch(
+    amount_paid: np.ndarray,
+    is_eligible: np.ndarray,
+    spouse_amount_paid: Optional[np.ndarray] = None,
+    spouse_eligible: Optional[np.ndarray] = None,
+    filing_statuses: Optional[Sequence[Union[FilingStatus, str]]] = None
+) -> np.ndarray:
+    """
+    Array form of calculate_educator_expense for many returns at once.
     
-    return 0.0
+    Spouse arrays default to no spouse expenses and filing statuses to
+    single; each return matches the scalar function exactly.
+    """
+    amount_paid = np.asarray(amount_paid, dtype=np.float64)
+    n = amount_paid.shape[0]
+    if spouse_amount_paid is None:
+        spouse_amount_paid = np.zeros(n)
+    if spouse_eligible is None:
+        spouse_eligible = np.zeros(n, dtype=np.bool_)
+    return _educator_expense_batch(
+        amount_paid, np.asarray(is_eligible, dtype=np.bool_),
+        np.asarray(spouse_amount_paid, dtype=np.float64),
+        np.asarray(spouse_eligible, dtype=np.bool_),
+        _mfj_mask(filing_statuses, n)
+    )
+
+
+def calculate_student_loan_interest_batch(
+    interest_paid: np.ndarray,
+    magi: np.ndarray,
+    filing_statuses: Optional[Sequence[Union[FilingStatus, str]]] = None
+) -> np.ndarray:
+    """
+    Array form of calculate_student_loan_interest for many returns at once.
+    
+    Filing statuses default to single; each return matches the scalar
+    function exactly, including the rounding of phased-out amounts.
+    """
+    interest_paid = np.asarray(interest_paid, dtype=np.float64)
+    return _student_loan_interest_batch(
+        interest_paid, np.asarray(magi, dtype=np.float64),
+        _mfj_mask(filing_statuses, interest_paid.shape[0])
+    )
+
+
+def calculate_excess_business_loss_batch(
+    net_business_loss: np.ndarray,
+    filing_statuses: Optional[Sequence[Union[FilingStatus, str]]] = None
+) -> np.ndarray:
+    """
+    Array form of calculate_excess_business_loss for many returns at once.
+    
+    Filing statuses default to single.
+    """
+    net_business_loss = np.asarray(net_business_loss, dtype=np.float64)
+    return _excess_business_loss_batch(
+        net_business_loss, _mfj_mask(filing_statuses, net_business_loss.shape[0])
+    )
+
+
+@njit(cache=True)
+def _cents(amount):
+    return int(round(amount * 100.0))
+
+
+@njit(cache=True)
+def compute_schedule_1(
+    income_c, net_business, se_deduction,
+    educator_paid, is_eligible_educator,
+    spouse_educator_paid, spouse_eligible_educator,
+    student_loan_interest_paid, is_mfj
+):
+    """
+    Compute Schedule 1 additional income and adjustments in one pass.
+    
+    income_c is wages + interest + dividends in integer cents; the other
+    amounts are dollars. Returns (additional_income_c, adjustments_c,
+    ebl_addback, educator_deduction, sli_deduction) with the totals in cents.
+    """
+    # 1. Business income/loss, plus the Form 461 excess business loss addback
+    additional_c = _cents(net_business)
+    ebl_addback = 0.0
+    if net_business < 0:
+        ebl_addback = _excess_business_loss(-net_business, is_mfj)
+        additional_c += _cents(ebl_addback)
+    
+    # 2-3. SE tax deduction and educator expenses
+    adjustments_c = _cents(se_deduction)
+    educator = _educator_expense(
+        educator_paid, is_eligible_educator,
+        spouse_educator_paid, spouse_eligible_educator, is_mfj
+    )
+    adjustments_c += _cents(educator)
+    
+    # 4. Student loan interest, phased out on the temporary MAGI
+    temp_agi_c = income_c + additional_c - adjustments_c
+    sli = _student_loan_interest(student_loan_interest_paid, temp_agi_c / 100.0, is_mfj)
+    adjustments_c += _cents(sli)
+    
+    return additional_c, adjustments_c, ebl_addback, educator, sli
+
+
+@njit(cache=True, parallel=True)
+def compute_schedule_1_batch(
+    income_c, net_business, se_deduction,
+    educator_paid, is_eligible_educator,
+    spouse_educator_paid, spouse_eligible_educator,
+    student_loan_interest_paid, is_mfj
+):
+    """
+    Array form of compute_schedule_1 for many returns at once.
+    
+    Returns (additional_income_c, adjustments_c) as int64 arrays.
+    """
+    n = income_c.shape[0]
+    additional_c = np.empty(n, dtype=np.int64)
+    adjustments_c = np.empty(n, dtype=np.int64)
+    for i in prange(n):
+        add_c, adj_c, _, _, _ = compute_schedule_1(
+            income_c[i], net_business[i], se_deduction[i],
+            educator_paid[i], is_eligible_educator[i],
+            spouse_educator_paid[i], spouse_eligible_educator[i],
+            student_loan_interest_paid[i], is_mfj[i]
+        )
+        additional_c[i] = add_c
+        adjustments_c[i] = adj_c
+    return additional_c, adjustments_c
 
 
 if __name__ == "__main__":
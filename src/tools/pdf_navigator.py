@@ -5,12 +5,183 @@ Implements the paper's approach: open(), find(), goto(), worksheet()
 This ensures agent reasoning is grounded in official IRS PDFs.
 """
 
+import hashlib
+import json
+import mmap
 import os
 import re
-from typing import Optional, List, Dict, Any
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from typing import Optional, List, Dict, Any, Iterator
 from pathlib import Path
 import pdfplumber
-from PyPDF2 import PdfReader
+
+try:
+    import fitz  # PyMuPDF
+except ImportError:  # optional accelerator - text comes from pdfplumber
+    fitz = None
+
+
+# Extracted page text and line instructions, per PDF (by SHA-1). Shared by
+# every navigator in the process and mirrored to JSON files on disk, so the
+# static IRS PDFs are only ever parsed once per machine.
+_PAGE_TEXT: Dict[str, List[str]] = {}
+_LINE_INSTRUCTIONS: Dict[str, Dict[str, str]] = {}
+
+
+# SHA-1 per PDF path, valid while the file's size and mtime are unchanged
+_PDF_SHA1: Dict[str, tuple] = {}
+
+
+def _pdf_sha1(path: Path) -> str:
+    """SHA-1 of a PDF, rehashed only when the file changes on disk"""
+    key = str(path.resolve())
+    stat = os.stat(key)
+    version = (stat.st_size, stat.st_mtime_ns)
+    cached = _PDF_SHA1.get(key)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    
+    with open(key, "rb") as f:
+        if stat.st_size:
+            # Hash straight from the page cache instead of copying into bytes
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                digest = hashlib.sha1(data).hexdigest()
+        else:
+            digest = hashlib.sha1(b"").hexdigest()
+    _PDF_SHA1[key] = (version, digest)
+    return digest
+
+
+def _cache_dir(kind: str = "instructions") -> Path:
+    """Directory for one kind of on-disk PDF cache"""
+    return Path(os.getenv(
+        "LIGHTTAXES_CACHE_DIR",
+        os.path.join(os.path.expanduser("~"), ".cache", "lighttaxes")
+    )) / kind
+
+
+def _read_cache(kind: str, pdf_sha1: str) -> Any:
+    """Decoded cache file for one PDF, or None if missing/corrupt"""
+    try:
+        with open(_cache_dir(kind) / f"{pdf_sha1}.json", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_cache(kind: str, pdf_sha1: str, data: Any):
+    """Atomically replace the cache file for one PDF"""
+    try:
+        directory = _cache_dir(kind)
+        directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = directory / f"{pdf_sha1}.json.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, directory / f"{pdf_sha1}.json")
+    except OSError:
+        pass  # read-only home etc. - the in-memory cache still applies
+
+
+def _cached_pages(pdf_sha1: str) -> Optional[List[str]]:
+    """Text of every page of one PDF, or None if it was never extracted"""
+    if pdf_sha1 not in _PAGE_TEXT:
+        pages = _read_cache("pages", pdf_sha1)
+        if not isinstance(pages, list):
+            return None
+        _PAGE_TEXT[pdf_sha1] = pages
+    return _PAGE_TEXT[pdf_sha1]
+
+
+def _store_pages(pdf_sha1: str, pages: List[str]):
+    """Record extracted page text in memory and on disk"""
+    _PAGE_TEXT[pdf_sha1] = pages
+    _write_cache("pages", pdf_sha1, pages)
+
+
+def _cached_instructions(pdf_sha1: str) -> Dict[str, str]:
+    """Line -> instructions for one PDF, loaded from disk on first use"""
+    if pdf_sha1 not in _LINE_INSTRUCTIONS:
+        _LINE_INSTRUCTIONS[pdf_sha1] = _read_cache("instructions", pdf_sha1) or {}
+    return _LINE_INSTRUCTIONS[pdf_sha1]
+
+
+def _store_instructions(pdf_sha1: str, line: str, text: str):
+    """Record instructions in memory and rewrite that PDF's cache file"""
+    entries = _cached_instructions(pdf_sha1)
+    entries[line] = text
+    _write_cache("instructions", pdf_sha1, entries)
+
+
+# pdfplumber keeps per-document state that grows with every page parsed;
+# the handle is closed (and reopened on demand) after this many pages
+_PLUMBER_REOPEN_PAGES = 500
+
+
+# Word index over page text, per PDF (by SHA-1): lowercased word -> pages.
+# Under the "" key (never a word) are pages with non-ASCII words, which
+# case-insensitive matching can reach in ways lowercasing does not model.
+_PAGE_INDEX: Dict[str, Dict[str, List[int]]] = {}
+_WORD_RE = re.compile(r"\w+")
+_REGEX_META = frozenset(".^$*+?{}[]\\|()")
+
+# Non-ASCII characters that re.IGNORECASE matches against ASCII letters
+# (dotted/dotless I, long s, Kelvin sign); str.lower() does not model them
+_CASE_FOLD_EXTRAS = "\u0130\u0131\u017f\u212a"
+
+
+def _literal_spans(text: str, query: str, case_sensitive: bool) -> Optional[List[tuple]]:
+    """
+    (start, end) of each non-overlapping occurrence of a literal query
+    
+    Same spans as re.finditer over the escaped query, found with str.find
+    instead of the regex engine. Returns None when a case-insensitive
+    search can't be reduced to lowercase comparison.
+    """
+    if not case_sensitive:
+        if not query.isascii() or any(c in text for c in _CASE_FOLD_EXTRAS):
+            return None
+        text, query = text.lower(), query.lower()
+    
+    spans = []
+    size = len(query)
+    start = text.find(query)
+    while start != -1:
+        spans.append((start, start + size))
+        start = text.find(query, start + size)
+    return spans
+
+
+def _page_index(pdf_sha1: str, pages: List[str]) -> Dict[str, List[int]]:
+    """Word -> 1-indexed pages containing it, built once per PDF"""
+    index = _PAGE_INDEX.get(pdf_sha1)
+    if index is None:
+        index = {}
+        for page_num, text in enumerate(pages, start=1):
+            words = set(_WORD_RE.findall(text))
+            if not all(word.isascii() for word in words):
+                index.setdefault("", []).append(page_num)
+            for word in {word.lower() for word in words}:
+                index.setdefault(word, []).append(page_num)
+        _PAGE_INDEX[pdf_sha1] = index
+    return index
+
+
+@lru_cache(maxsize=1024)
+def _pages_with(pdf_sha1: str, key: str) -> frozenset:
+    """Pages of an indexed PDF with a word containing key"""
+    pages = set()
+    for word, word_pages in _PAGE_INDEX[pdf_sha1].items():
+        if key in word:
+            pages.update(word_pages)
+    return frozenset(pages)
+
+
+@lru_cache(maxsize=256)
+def _compile(pattern: str, flags: int) -> "re.Pattern[str]":
+    """Compiled search pattern, shared across pages, calls and navigators"""
+    return re.compile(pattern, flags)
 
 
 class PDFNavigator:
@@ -29,9 +200,12 @@ class PDFNavigator:
         self.irs_forms_path = irs_forms_path or os.getenv("IRS_FORMS_PATH", "data/irs_forms")
         self.current_pdf = None
         self.current_pdf_path = None
-        self.pdf_reader = None
+        self.current_pdf_sha1 = None
         self.pdf_plumber = None
-        self.pages_cache = {}
+        self.page_count = 0
+        self._pages_text: List[Optional[str]] = []
+        self._pages_missing = 0
+        self._plumber_pages_read = 0
         
     def open(self, form_name: str) -> bool:
         """
@@ -69,53 +243,138 @@ class PDFNavigator:
         return False
     
     def _load_pdf(self, path: Path):
-        """Load PDF using both PyPDF2 and pdfplumber"""
+        """
+        Load PDF, reusing cached page text when this PDF was seen before
+        
+        Page text is cached by the PDF's SHA-1, so a fully extracted PDF
+        (in this process or an earlier one) is never parsed again.
+        Otherwise PyMuPDF, when installed, extracts every page up front -
+        MuPDF's C engine is fast enough that the whole document costs less
+        than a few pdfminer pages. Without it, pages are extracted lazily
+        by pdfplumber as they are read. pdfplumber is still opened on
+        demand for worksheet() tables.
+        """
+        self.close()
         self.current_pdf_path = path
-        self.pdf_reader = PdfReader(str(path))
-        self.pdf_plumber = pdfplumber.open(str(path))
-        self.pages_cache = {}
-        print(f"Loaded PDF: {path.name} ({len(self.pdf_reader.pages)} pages)")
+        self.current_pdf_sha1 = _pdf_sha1(path)
+        
+        pages = _cached_pages(self.current_pdf_sha1)
+        if pages is None and fitz is not None:
+            with fitz.open(str(path)) as doc:
+                pages = [page.get_text("text") for page in doc]
+            _store_pages(self.current_pdf_sha1, pages)
+        
+        if pages is not None:
+            self._pages_text = list(pages)
+        else:
+            self.pdf_plumber = pdfplumber.open(str(path))
+            self._pages_text = [None] * len(self.pdf_plumber.pages)
+            self._pages_missing = len(self._pages_text)
+        self.page_count = len(self._pages_text)
+        print(f"Loaded PDF: {path.name} ({self.page_count} pages)")
+    
+    def _plumber(self):
+        """pdfplumber handle for the current PDF, opened on first use"""
+        if self.pdf_plumber is None:
+            self.pdf_plumber = pdfplumber.open(str(self.current_pdf_path))
+        return self.pdf_plumber
     
-    def find(self, query: str, case_sensitive: bool = False) -> List[Dict[str, Any]]:
+    def _release_plumber_page(self, plumber_page):
+        """Drop pdfplumber's parsed objects for a page we are done with"""
+        plumber_page.flush_cache()
+        self._plumber_pages_read += 1
+        if self._plumber_pages_read >= _PLUMBER_REOPEN_PAGES:
+            self.pdf_plumber.close()
+            self.pdf_plumber = None
+            self._plumber_pages_read = 0
+    
+    def _page_text(self, page: int) -> str:
+        """Text of a 1-indexed page, extracted on first read"""
+        text = self._pages_text[page - 1]
+        if text is None:
+            plumber_page = self._plumber().pages[page - 1]
+            text = plumber_page.extract_text() or ""
+            self._release_plumber_page(plumber_page)
+            self._pages_text[page - 1] = text
+            
+            # Persist once the whole document has been read
+            self._pages_missing -= 1
+            if not self._pages_missing:
+                _store_pages(self.current_pdf_sha1, self._pages_text)
+        return text
+    
+    def find(
+        self,
+        query: str,
+        case_sensitive: bool = False,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """
         Search for text/regex in current PDF
         
         Args:
             query: Search string or regex pattern
             case_sensitive: Case-sensitive search
+            limit: Stop after this many matches (pages past the last
+                match needed are never extracted)
             
         Returns:
             List of matches with page numbers and context
         """
-        if not self.pdf_plumber:
+        if not self.current_pdf_path:
             raise ValueError("No PDF loaded. Call open() first.")
         
-        matches = []
-        flags = 0 if case_sensitive else re.IGNORECASE
+        return list(islice(self._find_iter(query, case_sensitive), limit))
+    
+    def _candidate_pages(self, query: str) -> Optional[List[int]]:
+        """
+        Pages that can contain a plain-text query, from the word index
+        
+        Every word of the query lies inside some word of a matching page,
+        so only pages that have, for each query word, a word containing it
+        are searched. Returns None (search every page) for regex queries
+        or while pages are still unextracted.
+        """
+        if self._pages_missing or not query.isascii() or not _REGEX_META.isdisjoint(query):
+            return None
+        keys = set(_WORD_RE.findall(query.lower()))
+        if not keys:
+            return None
         
-        for page_num, page in enumerate(self.pdf_plumber.pages, start=1):
-            text = page.extract_text()
+        index = _page_index(self.current_pdf_sha1, self._pages_text)
+        pages = frozenset.intersection(
+            *(_pages_with(self.current_pdf_sha1, key) for key in keys)
+        )
+        return sorted(pages.union(index.get("", ())))
+    
+    def _find_iter(self, query: str, case_sensitive: bool) -> Iterator[Dict[str, Any]]:
+        """Matches for find(), page by page in document order"""
+        pattern = _compile(query, 0 if case_sensitive else re.IGNORECASE)
+        literal = bool(query) and _REGEX_META.isdisjoint(query)
+        
+        pages = self._candidate_pages(query)
+        for page_num in pages if pages is not None else range(1, self.page_count + 1):
+            text = self._page_text(page_num)
             if not text:
                 continue
             
-            # Cache page text
-            self.pages_cache[page_num] = text
+            # Find all matches on this page (plain strings skip the regex engine)
+            spans = _literal_spans(text, query, case_sensitive) if literal else None
+            if spans is None:
+                spans = [match.span() for match in pattern.finditer(text)]
             
-            # Find all matches on this page
-            for match in re.finditer(query, text, flags):
+            for match_start, match_end in spans:
                 # Get context (50 chars before and after)
-                start = max(0, match.start() - 50)
-                end = min(len(text), match.end() + 50)
+                start = max(0, match_start - 50)
+                end = min(len(text), match_end + 50)
                 context = text[start:end].replace('\n', ' ')
                 
-                matches.append({
+                yield {
                     'page': page_num,
-                    'match': match.group(),
+                    'match': text[match_start:match_end],
                     'context': context,
-                    'position': match.start()
-                })
-        
-        return matches
+                    'position': match_start
+                }
     
     def goto(self, page: int, line: Optional[str] = None) -> str:
         """
@@ -128,23 +387,19 @@ class PDFNavigator:
         Returns:
             Page text or section around line
         """
-        if not self.pdf_plumber:
+        if not self.current_pdf_path:
             raise ValueError("No PDF loaded. Call open() first.")
         
-        if page < 1 or page > len(self.pdf_plumber.pages):
-            raise ValueError(f"Page {page} out of range (1-{len(self.pdf_plumber.pages)})")
+        if page < 1 or page > self.page_count:
+            raise ValueError(f"Page {page} out of range (1-{self.page_count})")
         
-        # Get page text (use cache if available)
-        if page in self.pages_cache:
-            text = self.pages_cache[page]
-        else:
-            text = self.pdf_plumber.pages[page - 1].extract_text()
-            self.pages_cache[page] = text
+        # Get page text (cached after the first extraction)
+        text = self._page_text(page)
         
         if line:
             # Find the line and return context
-            matches = re.finditer(re.escape(line), text, re.IGNORECASE)
-            for match in matches:
+            match = _compile(re.escape(line), re.IGNORECASE).search(text)
+            if match:
                 # Get paragraph around the match
                 start = max(0, match.start() - 200)
                 end = min(len(text), match.end() + 500)
@@ -170,21 +425,28 @@ class PDFNavigator:
             if not self.open(form_name):
                 return f"Could not load form '{form_name}'"
         
-        if not self.pdf_plumber:
+        if not self.current_pdf_path:
             return "No PDF loaded. Unable to get instructions."
         
+        # Same PDF and line as an earlier lookup (this or a previous process)
+        cached = _cached_instructions(self.current_pdf_sha1).get(line)
+        if cached is not None:
+            return cached
+        
         # Search for the line
-        matches = self.find(line, case_sensitive=False)
+        matches = self.find(line, case_sensitive=False, limit=1)
         
         if not matches:
-            return f"No instructions found for '{line}'"
-        
-        # Return the first match with extended context
-        best_match = matches[0]
-        page_num = best_match['page']
-        text = self.goto(page_num, line)
-        
-        return f"=== {line} Instructions (Page {page_num}) ===\n\n{text}"
+            instructions = f"No instructions found for '{line}'"
+        else:
+            # Return the first match with extended context
+            best_match = matches[0]
+            page_num = best_match['page']
+            text = self.goto(page_num, line)
+            instructions = f"=== {line} Instructions (Page {page_num}) ===\n\n{text}"
+        
+        _store_instructions(self.current_pdf_sha1, line, instructions)
+        return instructions
     
     def worksheet(self, name: str) -> Optional[Dict[str, Any]]:
         """
@@ -196,27 +458,28 @@ class PDFNavigator:
         Returns:
             Worksheet data if found
         """
-        if not self.pdf_plumber:
+        if not self.current_pdf_path:
             raise ValueError("No PDF loaded. Call open() first.")
         
         # Search for worksheet
-        matches = self.find(name, case_sensitive=False)
+        matches = self.find(name, case_sensitive=False, limit=1)
         
         if not matches:
             return None
         
         # Get the page with the worksheet
         page_num = matches[0]['page']
-        page = self.pdf_plumber.pages[page_num - 1]
+        page = self._plumber().pages[page_num - 1]
         
-        # Try to extract tables
+        # Try to extract tables (pdfplumber's table finder)
         tables = page.extract_tables()
+        self._release_plumber_page(page)
         
         return {
             'name': name,
             'page': page_num,
             'tables': tables,
-            'text': page.extract_text()
+            'text': self._page_text(page_num)
         }
     
     def get_tax_table(self, income_range: tuple) -> Optional[str]:
@@ -229,7 +492,7 @@ class PDFNavigator:
         Returns:
             Relevant tax table section
         """
-        if not self.pdf_plumber:
+        if not self.current_pdf_path:
             # Try to open tax table instructions
             if not self.open("1040"):
                 return None
@@ -239,7 +502,7 @@ class PDFNavigator:
         
         # Tax tables usually at the end of 1040 instructions
         # Search last 20 pages
-        total_pages = len(self.pdf_plumber.pages)
+        total_pages = self.page_count
         start_page = max(1, total_pages - 20)
         
         for page_num in range(start_page, total_pages + 1):
@@ -254,25 +517,73 @@ class PDFNavigator:
         """Close current PDF"""
         if self.pdf_plumber:
             self.pdf_plumber.close()
-        self.pdf_reader = None
         self.pdf_plumber = None
+        self.page_count = 0
+        self._pages_text = []
+        self._pages_missing = 0
+        self._plumber_pages_read = 0
         self.current_pdf_path = None
-        self.pages_cache = {}
+        self.current_pdf_sha1 = None
+
+
+# Open navigators shared by the convenience functions, one per form
+_NAV_POOL: Dict[str, PDFNavigator] = {}
+
+
+def _navigator(form: str) -> PDFNavigator:
+    """Navigator with the form open, reused across calls once it loads"""
+    nav = _NAV_POOL.get(form)
+    if nav is None:
+        nav = PDFNavigator()
+        if nav.open(form):
+            _NAV_POOL[form] = nav
+    return nav
 
 
 # Convenience functions for agents
+@lru_cache(maxsize=256)
 def get_irs_instructions(line: str, form: str = "1040") -> str:
     """Quick function to get IRS instructions for a line"""
-    nav = PDFNavigator()
-    nav.open(form)
-    return nav.get_line_instructions(line)
+    return _navigator(form).get_line_instructions(line)
 
 
 def search_irs_form(query: str, form: str = "1040") -> List[Dict[str, Any]]:
     """Quick function to search in an IRS form"""
+    return _navigator(form).find(query)
+
+
+def _search_form(form: str, query: str) -> List[Dict[str, Any]]:
+    """Worker for search_irs_forms - builds its own navigator in the child"""
     nav = PDFNavigator()
-    nav.open(form)
-    return nav.find(query)
+    if not nav.open(form):
+        return []
+    try:
+        return nav.find(query)
+    finally:
+        nav.close()
+
+
+def search_irs_forms(query: str, forms: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Search several IRS forms at once, one process per form
+    
+    PDF text extraction is CPU-bound, so forms are parsed in parallel
+    worker processes. Only (form, query) strings cross the process
+    boundary; navigators hold open PDF handles and stay in the workers.
+    
+    Args:
+        query: Search string or regex pattern
+        forms: Form names (e.g., ["1040", "schedule-b", "schedule-c"])
+        
+    Returns:
+        Form name -> matches, in the order the forms were given
+    """
+    if len(forms) < 2:
+        return {form: _search_form(form, query) for form in forms}
+    
+    with ProcessPoolExecutor(max_workers=min(len(forms), os.cpu_count() or 1)) as pool:
+        results = pool.map(_search_form, forms, [query] * len(forms))
+        return dict(zip(forms, results))
 
 
 if __name__ == "__main__":
@@ -5,7 +5,12 @@ Pure function - NO LLM involvement
 Source: IRS Revenue Procedure 2023-34
 """
 
-from typing import Literal, Optional
+from functools import lru_cache
+from typing import Literal, Optional, Sequence
+
+import numpy as np
+
+from src.core.types import normalize_filing_status
 
 
 FilingStatus = Literal["single", "married_filing_jointly", "married_filing_separately", "head_of_household", "qualifying_widow"]
@@ -29,6 +34,15 @@ ADDITIONAL_DEDUCTION_2024 = {
     "qualifying_widow": 1550
 }
 
+# Lookup columns indexed by an integer status code, for the batch form.
+# _SPOUSE_COUNTS marks the statuses whose spouse boxes count (MFJ and QW).
+_STATUS_CODES = {status: code for code, status in enumerate(STANDARD_DEDUCTION_2024)}
+_BASE = np.array([STANDARD_DEDUCTION_2024[s] for s in _STATUS_CODES], dtype=np.float64)
+_ADDITIONAL = np.array([ADDITIONAL_DEDUCTION_2024[s] for s in _STATUS_CODES], dtype=np.float64)
+_SPOUSE_COUNTS = np.array(
+    [s in ("married_filing_jointly", "qualifying_widow") for s in _STATUS_CODES]
+)
+
 
 def get_standard_deduction(
     filing_status: FilingStatus,
@@ -41,6 +55,9 @@ def get_standard_deduction(
     Calculate standard deduction for 2024.
     This is a PURE, DETERMINISTIC function - no LLM involved.
     
+    Ages only matter as 65-or-older, so they are bucketed before the
+    cached lookup in standard_deduction_for.
+    
     Args:
         filing_status: Filing status
         taxpayer_age: Taxpayer's age (for 65+ additional deduction)
@@ -57,8 +74,40 @@ def get_standard_deduction(
         >>> get_standard_deduction("single", taxpayer_age=66)
         16550.0
     """
+    return standard_deduction_for(
+        filing_status,
+        bool(taxpayer_age) and taxpayer_age >= 65,
+        bool(taxpayer_blind),
+        bool(spouse_age) and spouse_age >= 65,
+        bool(spouse_blind)
+    )
+
+
+@lru_cache(maxsize=None)
+def standard_deduction_for(
+    filing_status: FilingStatus,
+    taxpayer_65: bool = False,
+    taxpayer_blind: bool = False,
+    spouse_65: bool = False,
+    spouse_blind: bool = False
+) -> float:
+    """
+    Standard deduction keyed on filing status and the four 65+/blind flags.
+    
+    The whole domain is a few dozen keys, so every result stays cached.
+    
+    Args:
+        filing_status: Filing status
+        taxpayer_65: Whether taxpayer is 65 or older
+        taxpayer_blind: Whether taxpayer is blind
+        spouse_65: Whether spouse is 65 or older (for MFJ/QW)
+        spouse_blind: Whether spouse is blind (for MFJ/QW)
+        
+    Returns:
+        Standard deduction amount
+    """
     # Normalize filing status
-    status = filing_status.lower().replace(" ", "_")
+    status = normalize_filing_status(filing_status)
     
     if status not in STANDARD_DEDUCTION_2024:
         raise ValueError(f"Invalid filing status: {filing_status}")
@@ -70,14 +119,14 @@ def get_standard_deduction(
     additional = ADDITIONAL_DEDUCTION_2024[status]
     
     # Taxpayer additions
-    if taxpayer_age and taxpayer_age >= 65:
+    if taxpayer_65:
         deduction += additional
     if taxpayer_blind:
         deduction += additional
     
     # Spouse additions (only for MFJ and QW)
     if status in ["married_filing_jointly", "qualifying_widow"]:
-        if spouse_age and spouse_age >= 65:
+        if spouse_65:
             deduction += additional
         if spouse_blind:
             deduction += additional
@@ -85,6 +134,52 @@ def get_standard_deduction(
     return float(deduction)
 
 
+def get_standard_deduction_batch(
+    filing_statuses: Sequence[FilingStatus],
+    taxpayer_ages: Sequence[Optional[int]],
+    taxpayer_blind: Sequence[bool],
+    spouse_ages: Optional[Sequence[Optional[int]]] = None,
+    spouse_blind: Optional[Sequence[bool]] = None
+) -> np.ndarray:
+    """
+    Array form of get_standard_deduction for many returns at once.
+    
+    Base and per-box amounts are gathered by status code and the 65+/blind
+    boxes are counted with array comparisons, so there is no per-return
+    branching. Missing ages (None) count as under 65.
+    
+    Args:
+        filing_statuses: Filing status per return
+        taxpayer_ages: Taxpayer's age per return
+        taxpayer_blind: Whether taxpayer is blind, per return
+        spouse_ages: Spouse's age per return (for MFJ/QW)
+        spouse_blind: Whether spouse is blind, per return (for MFJ/QW)
+        
+    Returns:
+        Standard deduction per return as a float64 array
+    """
+    try:
+        codes = np.array(
+            [_STATUS_CODES[normalize_filing_status(s)] for s in filing_statuses],
+            dtype=np.int64
+        )
+    except KeyError as e:
+        raise ValueError(f"Invalid filing status: {e.args[0]}") from None
+    
+    def over_65(ages):
+        return np.asarray(ages, dtype=np.float64) >= 65  # None -> nan -> False
+    
+    boxes = over_65(taxpayer_ages).astype(np.int64) + np.asarray(taxpayer_blind, dtype=bool)
+    spouse_boxes = np.zeros(len(codes), dtype=np.int64)
+    if spouse_ages is not None:
+        spouse_boxes += over_65(spouse_ages)
+    if spouse_blind is not None:
+        spouse_boxes += np.asarray(spouse_blind, dtype=bool)
+    boxes += spouse_boxes * _SPOUSE_COUNTS[codes]
+    
+    return _BASE[codes] + _ADDITIONAL[codes] * boxes
+
+
 def should_itemize(
     filing_status: FilingStatus,
     total_itemized_deductions: float,
@@ -5,7 +5,14 @@ Pure function - NO LLM involvement
 Based on IRS Tax Computation Worksheet for 2024
 """
 
-from typing import Literal
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Literal, Sequence, Union
+
+import numpy as np
+
+from src.core.jit import njit, prange
+from src.core.types import normalize_filing_status
 
 
 FilingStatus = Literal["single", "married_filing_jointly", "married_filing_separately", "head_of_household", "qualifying_widow"]
@@ -60,7 +67,37 @@ TAX_BRACKETS_2024 = {
     ]
 }
 
+# (floor, rate, base tax) columns per status, for np.searchsorted bracket selection
+_BRACKETS = {
+    status: (
+        np.array([b[0] for b in brackets], dtype=np.float64),
+        np.array([b[2] for b in brackets], dtype=np.float64),
+        np.array([b[3] for b in brackets], dtype=np.float64),
+    )
+    for status, brackets in TAX_BRACKETS_2024.items()
+}
+
+
+# Integer code per status and the same columns stacked status-by-bracket,
+# so a batch kernel can look brackets up without Python objects
+_STATUS_CODES = {status: code for code, status in enumerate(_BRACKETS)}
+_FLOORS, _RATES, _BASES = (
+    np.stack([_BRACKETS[status][column] for status in _BRACKETS]) for column in range(3)
+)
+
+
+# Bracket floors as plain lists, so scalar lookups bisect without NumPy overhead
+_FLOORS_BY_STATUS = {
+    status: [b[0] for b in brackets] for status, brackets in TAX_BRACKETS_2024.items()
+}
+
+
+def _bracket_index(taxable_income: float, status: str) -> int:
+    """Index of the bracket whose [min, max) range contains taxable_income"""
+    return bisect_right(_FLOORS_BY_STATUS[status], taxable_income) - 1
+
 
+@lru_cache(maxsize=4096)
 def calculate_tax(taxable_income: float, filing_status: FilingStatus) -> float:
     """
     Calculate federal income tax using 2024 tax brackets.
@@ -81,21 +118,73 @@ def calculate_tax(taxable_income: float, filing_status: FilingStatus) -> float:
         return 0.0
     
     # Normalize filing status
-    status = filing_status.lower().replace(" ", "_")
+    status = normalize_filing_status(filing_status)
     
     if status not in TAX_BRACKETS_2024:
         raise ValueError(f"Invalid filing status: {filing_status}")
     
-    brackets = TAX_BRACKETS_2024[status]
-    
     # Find the applicable bracket
-    for min_income, max_income, rate, base_tax in brackets:
-        if min_income <= taxable_income < max_income:
-            tax = base_tax + (taxable_income - min_income) * rate
-            return round(tax, 2)
+    min_income, max_income, rate, base_tax = TAX_BRACKETS_2024[status][
+        _bracket_index(taxable_income, status)
+    ]
+    if not taxable_income < max_income:
+        # Should never reach here if brackets are properly defined
+        raise ValueError(f"No tax bracket found for income ${taxable_income:,.2f}")
     
-    # Should never reach here if brackets are properly defined
-    raise ValueError(f"No tax bracket found for income ${taxable_income:,.2f}")
+    tax = base_tax + (taxable_income - min_income) * rate
+    return round(tax, 2)
+
+
+@njit(cache=True, parallel=True)
+def _bracket_tax_batch(taxable_income, status_codes, floors, rates, bases):
+    """Unrounded bracket tax per return, one parallel loop over all returns"""
+    n = taxable_income.shape[0]
+    tax = np.zeros(n)
+    for i in prange(n):
+        income = taxable_income[i]
+        if income > 0:
+            code = status_codes[i]
+            index = np.searchsorted(floors[code], income, side="right") - 1
+            tax[i] = bases[code, index] + (income - floors[code, index]) * rates[code, index]
+    return tax
+
+
+def calculate_tax_batch(
+    taxable_income: np.ndarray,
+    filing_statuses: Union[FilingStatus, Sequence[FilingStatus]]
+) -> np.ndarray:
+    """
+    Array form of calculate_tax for many returns at once.
+    
+    Filing statuses are mapped to integer codes and the bracket formula
+    runs in a parallel kernel over all returns. Each amount is then
+    rounded with round(x, 2) so results match calculate_tax.
+    
+    Args:
+        taxable_income: Taxable income per return (Form 1040 Line 15)
+        filing_statuses: Filing status per return, or one status for all
+        
+    Returns:
+        Tax per return (Form 1040 Line 16) as a float64 array
+    """
+    taxable_income = np.asarray(taxable_income, dtype=np.float64)
+    n = taxable_income.shape[0]
+    try:
+        if isinstance(filing_statuses, str):
+            status_codes = np.full(
+                n, _STATUS_CODES[normalize_filing_status(filing_statuses)], dtype=np.int64
+            )
+        else:
+            status_codes = np.fromiter(
+                (_STATUS_CODES[normalize_filing_status(s)] for s in filing_statuses),
+                dtype=np.int64,
+                count=n
+            )
+    except KeyError as e:
+        raise ValueError(f"Invalid filing status: {e.args[0]}") from None
+    
+    tax = _bracket_tax_batch(taxable_income, status_codes, _FLOORS, _RATES, _BASES)
+    return np.array([round(t, 2) for t in tax.tolist()])
 
 
 def tax_table_lookup(taxable_income: float, filing_status: FilingStatus) -> float:
@@ -129,14 +218,13 @@ def get_marginal_tax_rate(taxable_income: float, filing_status: FilingStatus) ->
     Returns:
         Marginal tax rate (as decimal, e.g., 0.22 for 22%)
     """
-    status = filing_status.lower().replace(" ", "_")
+    status = normalize_filing_status(filing_status)
     brackets = TAX_BRACKETS_2024[status]
     
-    for min_income, max_income, rate, _ in brackets:
-        if min_income <= taxable_income < max_income:
-            return rate
-    
-    return brackets[-1][2]  # Highest bracket
+    index = _bracket_index(taxable_income, status)
+    if index < 0:
+        return brackets[-1][2]  # Highest bracket
+    return brackets[index][2]
 
 
 def get_effective_tax_rate(taxable_income: float, filing_status: FilingStatus) -> float:
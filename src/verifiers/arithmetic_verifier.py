@@ -3,12 +3,107 @@ Arithmetic Verifier - Validates mathematical correctness across forms
 Part of the verifier swarm architecture from the paper
 """
 
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
+from operator import attrgetter
+from typing import Dict, List, Sequence
+
+import numpy as np
 
-from typing import List
 from src.core.types import VerificationResult, VerificationError, Form1040Outputs
+from src.core.jit import njit, prange
+
+
+# Form 1040 lines the arithmetic checks read
+BATCH_LINES = (
+    "line_1z", "line_2b", "line_3b", "line_8", "line_9", "line_10", "line_11",
+    "line_12", "line_15", "line_16", "line_19", "line_23", "line_24",
+    "line_33", "line_34", "line_37",
+)
+
+# outputs -> tuple of the checked line values (the memoization key)
+_checked_lines = attrgetter(*BATCH_LINES)
+
+# Checks compare whole cents; one cent of difference is allowed for rounding
+_TOLERANCE_CENTS = 1
+
+# Memoized verify_form_1040 results by checked line values, shared by every
+# ArithmeticVerifier; cleared once it holds _MAX_CACHED_RESULTS entries
+_RESULTS: Dict[tuple, VerificationResult] = {}
+_MAX_CACHED_RESULTS = 4096
+
+# Structure-of-arrays Form 1040 outputs: line name -> float64 column
+Form1040OutputsBatch = Dict[str, np.ndarray]
+
+
+def stack_form_1040(outputs_list: Sequence[Form1040Outputs]) -> Form1040OutputsBatch:
+    """Columns of the checked lines for ArithmeticVerifier.verify_batch"""
+    return {
+        name: np.fromiter(
+            (getattr(outputs, name) for outputs in outputs_list),
+            dtype=np.float64,
+            count=len(outputs_list)
+        )
+        for name in BATCH_LINES
+    }
+
+
+# verify_batch checks in the order errors are reported, one column each in
+# _check_batch's outputs: (line, error type, message, actual line, severity);
+# the refund pair (5, 6) and owed pair (7, 8) are mutually exclusive
+_BATCH_CHECKS = (
+    ("Line 9", "arithmetic", "Total income calculation incorrect", "line_9", "error"),
+    ("Line 11", "arithmetic", "AGI calculation incorrect", "line_11", "error"),
+    ("Line 15", "arithmetic", "Taxable income calculation incorrect", "line_15", "error"),
+    ("Line 15", "logic", "Taxable income cannot be negative", "line_15", "critical"),
+    ("Line 24", "arithmetic", "Total tax calculation incorrect", "line_24", "error"),
+    ("Line 34", "arithmetic", "Refund calculation incorrect", "line_34", "error"),
+    ("Line 37", "logic", "Line 37 should be 0 when there is a refund", "line_37", "error"),
+    ("Line 37", "arithmetic", "Amount owed calculation incorrect", "line_37", "error"),
+    ("Line 34", "logic", "Line 34 should be 0 when tax is owed", "line_34", "error"),
+)
+
+
+@njit(cache=True)
+def _cents(amount):
+    """Dollar amount as whole cents"""
+    return np.int64(np.rint(amount * 100.0))
+
+
+@njit(cache=True, parallel=True)
+def _check_batch(lines):
+    """
+    Failed mask and expected cents for every _BATCH_CHECKS check, per return
+    
+    lines holds the BATCH_LINES columns in order. Same cent arithmetic as
+    _verify_form_1040, one parallel loop over all returns.
+    """
+    n = lines[0].shape[0]
+    failed = np.zeros((n, 9), dtype=np.bool_)
+    expected = np.zeros((n, 9), dtype=np.int64)
+    for i in prange(n):
+        c1z, c2b, c3b, c8 = _cents(lines[0][i]), _cents(lines[1][i]), _cents(lines[2][i]), _cents(lines[3][i])
+        c9, c10, c11, c12 = _cents(lines[4][i]), _cents(lines[5][i]), _cents(lines[6][i]), _cents(lines[7][i])
+        c15, c16, c19, c23 = _cents(lines[8][i]), _cents(lines[9][i]), _cents(lines[10][i]), _cents(lines[11][i])
+        c24, c33, c34, c37 = _cents(lines[12][i]), _cents(lines[13][i]), _cents(lines[14][i]), _cents(lines[15][i])
+        
+        expected[i, 0] = c1z + c2b + c3b + c8
+        expected[i, 1] = c9 - c10
+        expected[i, 2] = max(0, c11 - c12)
+        expected[i, 4] = c16 - c19 + c23
+        failed[i, 0] = abs(c9 - expected[i, 0]) > _TOLERANCE_CENTS
+        failed[i, 1] = abs(c11 - expected[i, 1]) > _TOLERANCE_CENTS
+        failed[i, 2] = abs(c15 - expected[i, 2]) > _TOLERANCE_CENTS
+        failed[i, 3] = c15 < 0
+        failed[i, 4] = abs(c24 - expected[i, 4]) > _TOLERANCE_CENTS
+        
+        if c33 > c24:
+            expected[i, 5] = c33 - c24
+            failed[i, 5] = abs(c34 - expected[i, 5]) > _TOLERANCE_CENTS
+            failed[i, 6] = c37 != 0
+        else:
+            expected[i, 7] = c24 - c33
+            failed[i, 7] = abs(c37 - expected[i, 7]) > _TOLERANCE_CENTS
+            failed[i, 8] = c34 != 0
+    return failed, expected
 
 
 class ArithmeticVerifier:
@@ -27,64 +122,80 @@ class ArithmeticVerifier:
         """
         Verify Form 1040 arithmetic
         
+        Results are memoized on the exact values of the checked lines, so
+        re-verifying unchanged outputs (e.g. another round of the verifier
+        swarm, or a new verifier) is a dict lookup. The returned result is
+        immutable, errors and warnings included, and shared.
+        
         Args:
             outputs: Form 1040 outputs to verify
             
         Returns:
             VerificationResult with any errors found
         """
+        key = _checked_lines(outputs)
+        result = _RESULTS.get(key)
+        if result is None:
+            if len(_RESULTS) >= _MAX_CACHED_RESULTS:
+                _RESULTS.clear()
+            result = _RESULTS[key] = self._verify_form_1040(outputs)
+        return result
+    
+    def _verify_form_1040(self, outputs: Form1040Outputs) -> VerificationResult:
+        """Uncached verify_form_1040"""
         errors: List[VerificationError] = []
         warnings: List[str] = []
         
+        # Checked lines as whole cents
+        (c1z, c2b, c3b, c8, c9, c10, c11, c12, c15, c16, c19, c23, c24,
+         c33, c34, c37) = [round(value * 100) for value in _checked_lines(outputs)]
+        
         # Verify Line 9: Total Income
-        expected_line_9 = (
-            outputs.line_1z +
-            outputs.line_2b +
-            outputs.line_3b +
-            outputs.line_8
-        )
+        expected_line_9 = c1z + c2b + c3b + c8
         
-        if abs(outputs.line_9 - expected_line_9) > 0.01:  # Allow for rounding
+        if abs(c9 - expected_line_9) > _TOLERANCE_CENTS:  # Allow for rounding
             errors.append(VerificationError(
                 form="1040",
                 line="Line 9",
                 error_type="arithmetic",
                 message="Total income calculation incorrect",
-                expected=expected_line_9,
+                expected=expected_line_9 / 100,
                 actual=outputs.line_9,
                 severity="error"
             ))
         
         # Verify Line 11: AGI
-        expected_line_11 = outputs.line_9 - outputs.line_10
+        expected_line_11 = c9 - c10
         
-        if abs(outputs.line_11 - expected_line_11) > 0.01:
+        if abs(c11 - expected_line_11) > _TOLERANCE_CENTS:
             errors.append(VerificationError(
                 form="1040",
                 line="Line 11",
                 error_type="arithmetic",
                 message="AGI calculation incorrect",
-                expected=expected_line_11,
+                expected=expected_line_11 / 100,
                 actual=outputs.line_11,
                 severity="error"
             ))
         
         # Verify Line 15: Taxable Income
-        expected_line_15 = max(0, outputs.line_11 - outputs.line_12)
+        expected_line_15 = c11 - c12
+        if expected_line_15 < 0:
+            expected_line_15 = 0
         
-        if abs(outputs.line_15 - expected_line_15) > 0.01:
+        if abs(c15 - expected_line_15) > _TOLERANCE_CENTS:
             errors.append(VerificationError(
                 form="1040",
                 line="Line 15",
                 error_type="arithmetic",
                 message="Taxable income calculation incorrect",
-                expected=expected_line_15,
+                expected=expected_line_15 / 100,
                 actual=outputs.line_15,
                 severity="error"
             ))
         
         # Verify Line 15 is non-negative
-        if outputs.line_15 < 0:
+        if c15 < 0:
             errors.append(VerificationError(
                 form="1040",
                 line="Line 15",
@@ -96,36 +207,36 @@ class ArithmeticVerifier:
             ))
         
         # Verify Line 24: Total Tax
-        expected_line_24 = outputs.line_16 - outputs.line_19 + outputs.line_23
+        expected_line_24 = c16 - c19 + c23
         
-        if abs(outputs.line_24 - expected_line_24) > 0.01:
+        if abs(c24 - expected_line_24) > _TOLERANCE_CENTS:
             errors.append(VerificationError(
                 form="1040",
                 line="Line 24",
                 error_type="arithmetic",
                 message="Total tax calculation incorrect",
-                expected=expected_line_24,
+                expected=expected_line_24 / 100,
                 actual=outputs.line_24,
                 severity="error"
             ))
         
         # Verify refund or amount owed logic
-        if outputs.line_33 > outputs.line_24:
+        if c33 > c24:
             # Should be refund
-            expected_refund = outputs.line_33 - outputs.line_24
+            expected_refund = c33 - c24
             
-            if abs(outputs.line_34 - expected_refund) > 0.01:
+            if abs(c34 - expected_refund) > _TOLERANCE_CENTS:
                 errors.append(VerificationError(
                     form="1040",
                     line="Line 34",
                     error_type="arithmetic",
                     message="Refund calculation incorrect",
-                    expected=expected_refund,
+                    expected=expected_refund / 100,
                     actual=outputs.line_34,
                     severity="error"
                 ))
             
-            if outputs.line_37 != 0:
+            if c37 != 0:
                 errors.append(VerificationError(
                     form="1040",
                     line="Line 37",
@@ -137,20 +248,20 @@ class ArithmeticVerifier:
                 ))
         else:
             # Should owe
-            expected_owed = outputs.line_24 - outputs.line_33
+            expected_owed = c24 - c33
             
-            if abs(outputs.line_37 - expected_owed) > 0.01:
+            if abs(c37 - expected_owed) > _TOLERANCE_CENTS:
                 errors.append(VerificationError(
                     form="1040",
                     line="Line 37",
                     error_type="arithmetic",
                     message="Amount owed calculation incorrect",
-                    expected=expected_owed,
+                    expected=expected_owed / 100,
                     actual=outputs.line_37,
                     severity="error"
                 ))
             
-            if outputs.line_34 != 0:
+            if c34 != 0:
                 errors.append(VerificationError(
                     form="1040",
                     line="Line 34",
@@ -171,10 +282,60 @@ class ArithmeticVerifier:
         return VerificationResult(
             verifier_name=self.name,
             passed=len(errors) == 0,
-            errors=errors,
-            warnings=warnings
+            errors=tuple(errors),
+            warnings=tuple(warnings)
         )
-
+    
+    def verify_batch(self, batch: Form1040OutputsBatch) -> List[VerificationResult]:
+        """
+        Verify Form 1040 arithmetic for many returns at once
+        
+        Same checks, messages and order as verify_form_1040, but expected
+        lines and error masks are computed for all returns in one parallel
+        kernel (_check_batch); VerificationError objects are only built for
+        the rows and checks that fail.
+        
+        Args:
+            batch: One float64 column per Form 1040 line (see stack_form_1040)
+            
+        Returns:
+            VerificationResult per return, in row order
+        """
+        line = {
+            name: np.ascontiguousarray(batch[name], dtype=np.float64) for name in BATCH_LINES
+        }
+        l11, l15 = line["line_11"], line["line_15"]
+        failed, expected = _check_batch(tuple(line.values()))
+        
+        errors: List[List[VerificationError]] = [[] for _ in range(len(l11))]
+        for check, (line_name, error_type, message, actual, severity) in enumerate(_BATCH_CHECKS):
+            for row in np.flatnonzero(failed[:, check]).tolist():
+                errors[row].append(VerificationError(
+                    form="1040",
+                    line=line_name,
+                    error_type=error_type,
+                    message=message,
+                    expected=int(expected[row, check]) / 100,
+                    actual=float(line[actual][row]),
+                    severity=severity
+                ))
+        
+        # Warnings for unusual values
+        warnings: List[List[str]] = [[] for _ in range(len(l11))]
+        for row in np.flatnonzero(l11 > 1000000).tolist():
+            warnings[row].append(f"High AGI: ${l11[row]:,.2f} - verify accuracy")
+        for row in np.flatnonzero((line["line_16"] == 0) & (l15 > 0)).tolist():
+            warnings[row].append("Tax is $0 despite positive taxable income - verify")
+        
+        return [
+            VerificationResult(
+                verifier_name=self.name,
+                passed=not row_errors,
+                errors=tuple(row_errors),
+                warnings=tuple(row_warnings)
+            )
+            for row_errors, row_warnings in zip(errors, warnings)
+        ]
 
 if __name__ == "__main__":
     from src.core.types import Form1040Outputs
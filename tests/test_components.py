@@ -9,7 +9,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 def test_tax_table():
     """Test tax table calculations"""
-    from src.tools.tax_table import calculate_tax
+    from src.tools.tax_table import calculate_tax, calculate_tax_batch
     
     print("Testing Tax Table...")
     
@@ -22,12 +22,23 @@ def test_tax_table():
     print(f"  Tax: ${tax:,.2f}")
     
     assert 4000 < tax < 4100, f"Tax ${tax} out of expected range"
+    
+    # Batched lookup matches the scalar one across statuses and brackets
+    incomes = [0, 35400, 35400, 250000.55, 800000]
+    statuses = ["single", "single", "married_filing_jointly", "head_of_household", "single"]
+    batch = calculate_tax_batch(incomes, statuses)
+    for income, status, batch_tax in zip(incomes, statuses, batch):
+        assert batch_tax == calculate_tax(income, status)
+    
+    # A single status applies to every return
+    single = calculate_tax_batch(incomes, "single")
+    assert single.tolist() == [calculate_tax(income, "single") for income in incomes]
     print("  ✓ PASS\n")
 
 
 def test_standard_deduction():
     """Test standard deduction"""
-    from src.tools.standard_deduction import get_standard_deduction
+    from src.tools.standard_deduction import get_standard_deduction, get_standard_deduction_batch
     
     print("Testing Standard Deduction...")
     
@@ -41,13 +52,25 @@ def test_standard_deduction():
     print(f"  MFJ: ${deduction:,.2f}")
     assert deduction == 29200, f"Expected $29,200, got ${deduction}"
     
+    # Batched lookup matches the scalar one, including spouse boxes that
+    # only count for MFJ/QW and missing ages
+    cases = [
+        ("single", None, False, None, False),
+        ("single", 66, True, 70, True),
+        ("married_filing_jointly", 66, False, 67, True),
+        ("qualifying_widow", 40, True, None, False),
+        ("head_of_household", 65, False, 80, False),
+    ]
+    batch = get_standard_deduction_batch(*zip(*cases))
+    assert batch.tolist() == [get_standard_deduction(*case) for case in cases]
+    
     print("  ✓ PASS\n")
 
 
 def test_form_1040_agent():
     """Test Form 1040 agent"""
     from src.agents.form_1040_agent import Form1040Agent
-    from src.core.types import Form1040Inputs, TaxpayerInfo, FilingStatus
+    from src.core.types import Form1040Inputs, TaxpayerInfo, FilingStatus, W2
     
     print("Testing Form 1040 Agent...")
     
@@ -55,7 +78,8 @@ def test_form_1040_agent():
     taxpayer = TaxpayerInfo(
         name="Test User",
         ssn="000-00-0000",
-        age=35
+        age=35,
+        w2=[W2(wages=50000, federal_withholding=5000)]
     )
     
     inputs = Form1040Inputs(
@@ -82,13 +106,30 @@ def test_form_1040_agent():
     assert outputs.line_12 == 14600  # Standard deduction
     assert outputs.line_15 == 35400  # 50000 - 14600
     assert 4000 < outputs.line_16 < 4100  # Tax on 35400
+    assert outputs.line_25a == 5000  # Withholding taken from the taxpayer's W-2
+    
+    # The W-2 total follows the taxpayer's W-2s, and an explicit zero is kept
+    updated = taxpayer.model_copy(update={"w2": [W2(wages=50000, federal_withholding=5)]})
+    assert updated.w2_withholding == 5
+    no_withholding = inputs.model_copy(update={"withholding": 0.0})
+    assert agent.process(no_withholding).line_25a == 0
+    
+    # Batched citations describe each return alone, not the returns before it
+    owed = inputs.model_copy(update={
+        "filing_status": FilingStatus.MARRIED_FILING_JOINTLY, "interest": 1200, "withholding": 1
+    })
+    cited = Form1040Agent()
+    batch = cited.process_batch([owed, inputs], emit_citations=True)
+    assert "Line 2b" in batch[0].citations and "Line 37" in batch[0].citations
+    assert batch[1].citations == Form1040Agent().process(inputs).citations
+    assert "Line 2b" not in batch[1].citations and "Line 37" not in batch[1].citations
     
     print("  ✓ PASS\n")
 
 
 def test_arithmetic_verifier():
     """Test arithmetic verifier"""
-    from src.verifiers.arithmetic_verifier import ArithmeticVerifier
+    from src.verifiers.arithmetic_verifier import ArithmeticVerifier, stack_form_1040
     from src.core.types import Form1040Outputs
     
     print("Testing Arithmetic Verifier...")
@@ -116,9 +157,343 @@ def test_arithmetic_verifier():
     assert result.passed, "Verifier should pass correct calculations"
     assert len(result.errors) == 0
     
+    # Unchanged outputs reuse the memoized result, from any verifier, and
+    # the shared result can't be changed in place
+    assert verifier.verify_form_1040(outputs.model_copy()) is result
+    assert ArithmeticVerifier().verify_form_1040(outputs) is result
+    assert isinstance(result.errors, tuple) and isinstance(result.warnings, tuple)
+    
+    # Batched verification reports the same errors as the scalar one
+    wrong = outputs.model_copy(update={"line_9": 49000, "line_34": 0, "line_37": 10})
+    batch = verifier.verify_batch(stack_form_1040([outputs, wrong]))
+    assert batch[0] == result
+    assert batch[1] == verifier.verify_form_1040(wrong)
+    assert [e.line for e in batch[1].errors] == ["Line 9", "Line 11", "Line 34", "Line 37"]
+    
+    # Checks run on whole cents: a one-cent rounding difference still passes
+    assert verifier.verify_form_1040(outputs.model_copy(update={"line_9": 50000.01})).passed
+    assert wrong.as_cents()[list(type(wrong).model_fields).index("line_37")] == 1000
+    
+    # A one-cent negative line 15 is within the arithmetic tolerance, so only
+    # the non-negative check catches it
+    negative = outputs.model_copy(update={"line_12": 50000, "line_15": -0.01})
+    errors = verifier.verify_form_1040(negative).errors
+    assert [(e.line, e.error_type) for e in errors if e.line == "Line 15"] == [("Line 15", "logic")]
+    
+    print("  ✓ PASS\n")
+
+
+def test_schedule_1_batch():
+    """Test batched Schedule 1 totals against the scalar kernel"""
+    import numpy as np
+    from src.tools.adjustments import compute_schedule_1, compute_schedule_1_batch
+    
+    print("Testing Schedule 1 Batch...")
+    
+    # (income cents, net business, SE deduction, educator paid, SLI paid)
+    cases = [
+        (5000000, 0.0, 0.0, 0.0, 0.0),
+        (9000000, -400000.0, 0.0, 400.0, 3000.0),
+        (7500000, 12000.0, 847.8, 250.0, 1000.0),
+    ]
+    income_c = np.array([c[0] for c in cases], dtype=np.int64)
+    net_business = np.array([c[1] for c in cases])
+    se_deduction = np.array([c[2] for c in cases])
+    educator_paid = np.array([c[3] for c in cases])
+    sli_paid = np.array([c[4] for c in cases])
+    eligible = educator_paid > 0
+    zeros = np.zeros(len(cases))
+    no = np.zeros(len(cases), dtype=np.bool_)
+    
+    additional_c, adjustments_c = compute_schedule_1_batch(
+        income_c, net_business, se_deduction,
+        educator_paid, eligible, zeros, no, sli_paid, no
+    )
+    
+    for i, case in enumerate(cases):
+        add_c, adj_c, _, _, _ = compute_schedule_1(
+            case[0], case[1], case[2], case[3], bool(eligible[i]), 0.0, False, case[4], False
+        )
+        assert additional_c[i] == add_c
+        assert adjustments_c[i] == adj_c
+    
+    # $400k loss: $95k EBL addback leaves a -$305k net
+    assert additional_c[1] == -30500000
+    print(f"  Returns: {len(cases)}")
+    print("  ✓ PASS\n")
+
+
+def test_adjustments_batch():
+    """Test batched Schedule 1 adjustment helpers against the scalar ones"""
+    from src.core.types import FilingStatus
+    from src.tools.adjustments import (
+        calculate_educator_expense, calculate_educator_expense_batch,
+        calculate_student_loan_interest, calculate_student_loan_interest_batch,
+        calculate_excess_business_loss, calculate_excess_business_loss_batch
+    )
+    
+    print("Testing Adjustments Batch...")
+    
+    mfj = FilingStatus.MARRIED_FILING_JOINTLY.value
+    statuses = ["single", mfj, "head_of_household", mfj, "single"]
+    paid = [400, 250, 0, 400, 3000]
+    eligible = [True, True, False, True, True]
+    spouse_paid = [0, 400, 0, 100, 0]
+    spouse_eligible = [False, True, False, True, False]
+    interest = [3000, 3000, 1000, 2000, 2600]
+    magi = [50000, 180000, 87500.33, 200000, 94999.99]
+    losses = [400000, 400000, -5000, 700000, 305000]
+    
+    educator = calculate_educator_expense_batch(paid, eligible, spouse_paid, spouse_eligible, statuses)
+    sli = calculate_student_loan_interest_batch(interest, magi, statuses)
+    ebl = calculate_excess_business_loss_batch(losses, statuses)
+    
+    for i, status in enumerate(statuses):
+        assert educator[i] == calculate_educator_expense(
+            paid[i], eligible[i], spouse_paid[i], spouse_eligible[i], status
+        )
+        assert sli[i] == calculate_student_loan_interest(interest[i], magi[i], status)
+        assert ebl[i] == calculate_excess_business_loss(losses[i], status)
+    
+    assert list(educator) == [300, 550, 0, 400, 300]
+    assert list(ebl) == [95000, 0, 0, 90000, 0]
+    
+    # FilingStatus members get the same MFJ limits as their raw values
+    mfj_member = FilingStatus.MARRIED_FILING_JOINTLY
+    assert calculate_educator_expense(400, True, 400, True, mfj_member) == 600
+    assert calculate_student_loan_interest(3000, 180000, mfj_member) == 1250
+    assert calculate_excess_business_loss(400000, mfj_member) == 0
+    print(f"  Returns: {len(statuses)}")
+    print("  ✓ PASS\n")
+
+
+def test_schedule_se_batch():
+    """Test batched SE tax against the scalar Schedule SE agent"""
+    import numpy as np
+    from src.agents.schedule_se_agent import ScheduleSEAgent, compute_se_batch
+    from src.core.types import ScheduleSEInputs, FilingStatus
+    
+    print("Testing Schedule SE Batch...")
+    
+    # Below threshold, at threshold, typical, above the SS wage base
+    profits = [300.0, 400.0, 50000.0, 200000.0]
+    net_earnings, se_tax, deduction = compute_se_batch(np.array(profits))
+    
+    agent = ScheduleSEAgent()
+    for i, profit in enumerate(profits):
+        outputs = agent.process(ScheduleSEInputs(net_profit_loss=profit, filing_status=FilingStatus.SINGLE))
+        assert net_earnings[i] == outputs.net_earnings
+        assert round(float(se_tax[i]), 2) == outputs.self_employment_tax
+        assert round(float(deduction[i]), 2) == outputs.deduction
+    
+    assert se_tax[0] == 0.0 and se_tax[1] == 0.0
+    print(f"  Net profits: {len(profits)}")
+    print("  ✓ PASS\n")
+
+
+def test_acalculate_lines():
+    """Test concurrent line calculations against calculate_line"""
+    import asyncio
+    from src.agents.form_1040_agent import Form1040Agent
+    from src.core.llm_engine import LLMEngine
+    
+    print("Testing Concurrent Line Calculation...")
+    
+    agent = Form1040Agent(llm=LLMEngine(provider="mock"), enable_citations=False)
+    line_prompts = {
+        "Line 1z": "Total wages from all W-2 forms",
+        "Line 25a": "Federal income tax withheld",
+        "Line 19": "Child tax credit",
+    }
+    values = asyncio.run(agent.acalculate_lines(line_prompts))
+    
+    assert list(values) == list(line_prompts)
+    for line, prompt in line_prompts.items():
+        assert values[line] == agent.calculate_line(line, prompt)
+    assert values["Line 1z"] == 50000
+    print(f"  Lines: {len(values)}")
+    print("  ✓ PASS\n")
+
+
+def test_calculate_lines_batch():
+    """Test batch-API line calculations against calculate_line"""
+    from src.agents.form_1040_agent import Form1040Agent
+    from src.core.llm_engine import LLMEngine
+    
+    print("Testing Batch Line Calculation...")
+    
+    agent = Form1040Agent(llm=LLMEngine(provider="mock"), enable_citations=False)
+    # Two taxpayers' lines in one batch
+    line_prompts = [
+        ("Line 1z", "Total wages from all W-2 forms"),
+        ("Line 25a", "Federal income tax withheld"),
+        ("Line 1z", "Total wages from all W-2 forms"),
+        ("Line 19", "Child tax credit"),
+    ]
+    values = agent.calculate_lines_batch(line_prompts)
+    
+    assert len(values) == len(line_prompts)
+    for (line, prompt), value in zip(line_prompts, values):
+        assert value == agent.calculate_line(line, prompt)
+    assert values[0] == values[2] == 50000
+    print(f"  Calls: {len(values)}")
+    print("  ✓ PASS\n")
+
+
+def test_llm_response_cache():
+    """Test that cached engines answer repeat prompts without a provider call"""
+    import tempfile
+    from src.core import llm_engine
+    from src.core.llm_engine import LLMEngine
+    
+    print("Testing LLM Response Cache...")
+    
+    calls = []
+    
+    def counting_mock(*args):
+        calls.append(args)
+        return str(len(calls))
+    
+    previous_dir = os.environ.get("LIGHTTAXES_CACHE_DIR")
+    with tempfile.TemporaryDirectory() as cache_dir:
+        os.environ["LIGHTTAXES_CACHE_DIR"] = cache_dir
+        try:
+            engine = LLMEngine(provider="mock", cache=True)
+            engine._generate_mock = counting_mock
+            
+            first = engine.generate("Line 1z wages", "system", context="IRS text")
+            assert engine.generate("Line 1z wages", "system", context="IRS text") == first
+            assert engine.generate("Line 1z wages", "system") != first
+            assert len(calls) == 2
+            
+            # A later run reads the response back from disk
+            llm_engine._RESPONSES.clear()
+            rerun = LLMEngine(provider="mock", cache=True)
+            rerun._generate_mock = counting_mock
+            assert rerun.generate("Line 1z wages", "system", context="IRS text") == first
+            assert len(calls) == 2
+        finally:
+            llm_engine._RESPONSES.clear()
+            if previous_dir is None:
+                del os.environ["LIGHTTAXES_CACHE_DIR"]
+            else:
+                os.environ["LIGHTTAXES_CACHE_DIR"] = previous_dir
+    
+    print(f"  Provider calls: {len(calls)}")
+    print("  ✓ PASS\n")
+
+
+def test_process_tax_returns_batch():
+    """Test batch processing against one-at-a-time processing"""
+    import glob
+    import json
+    from main import TaxReturnProcessor
+    
+    print("Testing Batch Processing...")
+    
+    root = os.path.join(os.path.dirname(__file__), '..')
+    cases = [
+        json.load(open(path))
+        for path in sorted(glob.glob(os.path.join(root, 'data/tax_calc_bench/*/input.json')))
+    ]
+    # A W-2 return with 1099-INT and Schedule 1 adjustments, no Schedule C
+    cases.append({
+        "filing_status": "single",
+        "w2": [{"wages": 88000, "federal_withholding": 9000}],
+        "income_1099_int": [{"interest_income": 321.11}],
+        "educator_expenses_paid": 412,
+        "is_taxpayer_educator": True,
+        "student_loan_interest_paid": 2700
+    })
+    
+    processor = TaxReturnProcessor()
+    single = [processor.process_tax_return(case) for case in cases]
+    batch = processor.process_tax_returns(cases)
+    
+    print(f"  Returns: {len(cases)}")
+    assert len(batch) == len(single)
+    for one, many in zip(single, batch):
+        assert one.model_dump() == many.model_dump()
+    
+    # verify_results() checks the last return of the batch
+    assert processor.results['form_1040'] is batch[-1]
+    
     print("  ✓ PASS\n")
 
 
+def test_processors_keep_their_own_citations():
+    """Test that a new processor reports only its own return's citations"""
+    import json
+    from main import TaxReturnProcessor
+    
+    print("Testing Per-Processor Citations...")
+    
+    root = os.path.join(os.path.dirname(__file__), '..')
+    business = json.load(open(os.path.join(root, 'data/tax_calc_bench/schedule-c-basic/input.json')))
+    TaxReturnProcessor().process_tax_return(business)
+    
+    w2_only = {"filing_status": "single", "w2": [{"wages": 50000, "federal_withholding": 5000}]}
+    citations = TaxReturnProcessor().process_tax_return(w2_only).citations
+    assert not {"Line 8", "Line 10", "Line 23", "Line 37"} & set(citations)
+    
+    print("  ✓ PASS\n")
+
+
+def test_processor_shared_across_threads():
+    """Test one processor serving W-2 returns from several threads at once"""
+    from concurrent.futures import ThreadPoolExecutor
+    from main import TaxReturnProcessor
+    
+    print("Testing Processor Shared Across Threads...")
+    
+    processor = TaxReturnProcessor()
+    cases = [
+        {"filing_status": "single", "w2": [{"wages": 40000 + n, "federal_withholding": 4000}]}
+        for n in range(400)
+    ]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        outputs = list(executor.map(processor.process_tax_return, cases))
+    
+    assert [o.line_1z for o in outputs] == [40000 + n for n in range(400)]
+    
+    print("  ✓ PASS\n")
+
+
+def test_form_1040_golden():
+    """Test every benchmark case against golden Form 1040 lines in one sweep"""
+    import json
+    import numpy as np
+    from main import TaxReturnProcessor
+    from src.verifiers.arithmetic_verifier import ArithmeticVerifier, stack_form_1040
+    
+    print("Testing Golden Form 1040 Lines...")
+    
+    here = os.path.dirname(__file__)
+    golden = json.load(open(os.path.join(here, 'golden_cases.json')))
+    names = sorted(golden['cases'])
+    cases = [
+        json.load(open(os.path.join(here, '..', 'data/tax_calc_bench', name, 'input.json')))
+        for name in names
+    ]
+    
+    outputs = TaxReturnProcessor().process_tax_returns(cases)
+    actual = np.array([[getattr(o, line) for line in golden['lines']] for o in outputs])
+    expected = np.array([golden['cases'][name] for name in names])
+    
+    mismatched = ~np.isclose(actual, expected, rtol=0, atol=0.01)
+    rows, cols = np.nonzero(mismatched)
+    assert not mismatched.any(), [
+        f"{names[r]} {golden['lines'][c]}: {actual[r, c]} != {expected[r, c]}"
+        for r, c in zip(rows, cols)
+    ]
+    
+    # The same sweep through the batched verifier
+    results = ArithmeticVerifier().verify_batch(stack_form_1040(outputs))
+    assert all(result.passed for result in results)
+    
+    print(f"  Cases: {len(names)}")
+    print("  ✓ PASS\n")
+
 def run_all_tests():
     """Run all component tests"""
     print("=" * 80)
@@ -131,6 +506,16 @@ def run_all_tests():
         test_standard_deduction()
         test_form_1040_agent()
         test_arithmetic_verifier()
+        test_schedule_1_batch()
+        test_adjustments_batch()
+        test_schedule_se_batch()
+        test_acalculate_lines()
+        test_calculate_lines_batch()
+        test_llm_response_cache()
+        test_process_tax_returns_batch()
+        test_processors_keep_their_own_citations()
+        test_processor_shared_across_threads()
+        test_form_1040_golden()
         
         print("=" * 80)
         print("✅ ALL TESTS PASSED!")